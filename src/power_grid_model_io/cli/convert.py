@@ -0,0 +1,296 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+pgm-io convert: convert many files to PGM JSON input data, in parallel
+"""
+import argparse
+import copy
+import glob
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional
+
+import structlog
+
+from power_grid_model_io import converters, data_stores
+from power_grid_model_io.converters.base_converter import BaseConverter
+from power_grid_model_io.utils.modules import get_function
+
+CONVERTER_TYPES = ("vision", "tabular", "pandapower", "pgm_json")
+
+ProgressCallback = Callable[[int, int, "ConversionResult"], None]
+
+
+@dataclass(frozen=True)
+class ConversionOptions:
+    """
+    The options that apply to all files of a (batch) conversion
+    """
+
+    converter_type: str
+    """The type of the source files: "vision", "tabular", "pandapower" or "pgm_json" """
+
+    output_dir: Path
+    """The directory in which the PGM JSON files are stored (using the file name of the source, with a .json suffix)"""
+
+    mapping_file: Optional[Path] = None
+    """The mapping file (required for the "tabular" converter type)"""
+
+    language: str = "en"
+    """The language of the Vision Excel exports (only for the "vision" converter type)"""
+
+
+@dataclass
+class ConversionResult:
+    """
+    The result of the conversion of a single file
+    """
+
+    source: Path
+    destination: Path
+    wall_time: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if the file was converted successfully
+        """
+        return self.error is None
+
+
+def expand_paths(patterns: Iterable[str]) -> List[Path]:
+    """
+    Expand glob patterns (e.g. "exports/**/*.xlsx"); patterns without any matches are kept as they are, so that a
+    missing file results in a (per file) conversion error instead of being ignored silently.
+
+    Args:
+        patterns: File paths and/or glob patterns
+
+    Returns:
+        The unique file paths, in order of appearance
+    """
+    paths: List[Path] = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else []
+        paths.extend(Path(match) for match in matches or [pattern])
+    return list(dict.fromkeys(paths))
+
+
+def create_converter(options: ConversionOptions) -> BaseConverter:
+    """
+    Create a converter (and load the mapping file, if applicable). Only the module of the requested converter is
+    imported, which keeps the start-up time of the worker processes low.
+
+    Args:
+        options: The conversion options
+
+    Returns:
+        A converter that can be used to convert the data of any of the source files
+    """
+    if options.converter_type == "vision":
+        return converters.VisionExcelConverter(language=options.language)
+    if options.converter_type == "tabular":
+        if options.mapping_file is None:
+            raise ValueError("A mapping file is required for the 'tabular' converter type")
+        return converters.TabularConverter(mapping_file=options.mapping_file)
+    if options.converter_type == "pandapower":
+        return converters.PandaPowerConverter()
+    if options.converter_type == "pgm_json":
+        return converters.PgmJsonConverter()
+    raise ValueError(f"Invalid converter type '{options.converter_type}', choose from: {', '.join(CONVERTER_TYPES)}")
+
+
+def load_source(options: ConversionOptions, file_path: Path) -> Any:
+    """
+    Load the data of a source file, in the format that is expected by the converter
+
+    Args:
+        options: The conversion options
+        file_path: The source file
+
+    Returns:
+        The source data
+    """
+    if options.converter_type == "vision":
+        return data_stores.VisionExcelFileStore(file_path=file_path).load()
+    if options.converter_type == "tabular":
+        return data_stores.ExcelFileStore(file_path=file_path).load()
+    if options.converter_type == "pandapower":
+        # pandapower is an optional dependency, so it is only imported when pandapower files are converted
+        return get_function("pandapower.from_json")(str(file_path))
+    return data_stores.JsonFileStore(file_path=file_path).load()
+
+
+def destination_path(options: ConversionOptions, file_path: Path) -> Path:
+    """
+    The PGM JSON file in which the converted data of a source file is stored
+    """
+    return options.output_dir / file_path.with_suffix(".json").name
+
+
+def convert_file(converter: BaseConverter, options: ConversionOptions, file_path: Path) -> ConversionResult:
+    """
+    Convert a single file and store the PGM JSON input data (including the extra info). Any error is caught and
+    stored in the result, so that a single invalid file doesn't stop the conversion of the other files.
+
+    Args:
+        converter: A (warmed up) converter; it is copied, so the auto ids of different files don't interfere
+        options: The conversion options
+        file_path: The source file
+
+    Returns:
+        The result of the conversion
+    """
+    destination = destination_path(options=options, file_path=file_path)
+    start = time.perf_counter()
+    try:
+        data = load_source(options=options, file_path=file_path)
+        input_data, extra_info = copy.deepcopy(converter).load_input_data(data=data)
+        converters.PgmJsonConverter().save(
+            data=input_data, extra_info=extra_info, destination=data_stores.JsonFileStore(destination)
+        )
+    except Exception as ex:  # pylint: disable=broad-except
+        return ConversionResult(
+            source=file_path,
+            destination=destination,
+            wall_time=time.perf_counter() - start,
+            error=f"{type(ex).__name__}: {ex}",
+        )
+    return ConversionResult(source=file_path, destination=destination, wall_time=time.perf_counter() - start)
+
+
+_WORKER_CONVERTER: Optional[BaseConverter] = None
+
+
+def _init_worker(options: ConversionOptions, log_level: Optional[int]) -> None:
+    """
+    Create the converter of a worker process once, so that the mapping file is only loaded once per process
+    """
+    global _WORKER_CONVERTER  # pylint: disable=global-statement
+    if log_level is not None:
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(log_level))
+    _WORKER_CONVERTER = create_converter(options)
+
+
+def _convert_file_in_worker(options: ConversionOptions, file_path: Path) -> ConversionResult:
+    assert _WORKER_CONVERTER is not None
+    return convert_file(converter=_WORKER_CONVERTER, options=options, file_path=file_path)
+
+
+def convert_files(
+    file_paths: List[Path],
+    options: ConversionOptions,
+    workers: int = 1,
+    progress: Optional[ProgressCallback] = None,
+    log_level: Optional[int] = None,
+) -> List[ConversionResult]:
+    """
+    Convert multiple files to PGM JSON input data, optionally in a pool of worker processes. Each worker creates a
+    converter only once and reuses it for all the files it converts.
+
+    Args:
+        file_paths: The source files
+        options: The conversion options
+        workers: The number of worker processes; 1 means that all files are converted in the current process
+        progress: A function that is called after each conversion, with the number of converted files, the total
+            number of files and the result of the conversion
+        log_level: The log level of the worker processes, e.g. logging.WARNING (by default, nothing is configured)
+
+    Returns:
+        The results of all conversions, in order of completion
+    """
+    destinations = [destination_path(options=options, file_path=file_path) for file_path in file_paths]
+    duplicates = sorted({str(path) for path in destinations if destinations.count(path) > 1})
+    if duplicates:
+        raise ValueError(f"Multiple source files would be converted to: {', '.join(duplicates)}")
+    options.output_dir.mkdir(parents=True, exist_ok=True)
+
+    results: List[ConversionResult] = []
+
+    def completed(result: ConversionResult) -> None:
+        results.append(result)
+        if progress is not None:
+            progress(len(results), len(file_paths), result)
+
+    if workers <= 1:
+        if log_level is not None:
+            structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(log_level))
+        converter = create_converter(options)
+        for file_path in file_paths:
+            completed(convert_file(converter=converter, options=options, file_path=file_path))
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(options, log_level)) as pool:
+        futures = [pool.submit(_convert_file_in_worker, options, file_path) for file_path in file_paths]
+        for future in as_completed(futures):
+            completed(future.result())
+    return results
+
+
+def add_parser(subparsers: Any) -> None:
+    """
+    Add the convert command to the command line interface
+    """
+    parser = subparsers.add_parser(
+        "convert",
+        help="Convert files to PGM JSON input data",
+        description="Convert files to PGM JSON input data, in parallel. "
+        "Files that can't be converted are reported, but don't stop the conversion of the other files.",
+    )
+    parser.add_argument("files", nargs="+", help="Source files and/or glob patterns, e.g. 'exports/**/*.xlsx'")
+    parser.add_argument("-t", "--type", dest="converter_type", choices=CONVERTER_TYPES, required=True)
+    parser.add_argument("-o", "--output-dir", type=Path, required=True, help="Directory for the PGM JSON files")
+    parser.add_argument("-m", "--mapping", dest="mapping_file", type=Path, help="Mapping file (for tabular data)")
+    parser.add_argument("-l", "--language", default="en", help="Language of the Vision Excel exports")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes (default: #cpus)"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show the log messages of the converters")
+    parser.set_defaults(run=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Run the convert command
+
+    Returns:
+        The exit code: 0 if all files were converted successfully, 1 otherwise
+    """
+    if args.converter_type == "tabular" and args.mapping_file is None:
+        print("A mapping file (--mapping) is required for the 'tabular' converter type", file=sys.stderr)
+        return 2
+
+    options = ConversionOptions(
+        converter_type=args.converter_type,
+        output_dir=args.output_dir,
+        mapping_file=args.mapping_file,
+        language=args.language,
+    )
+    file_paths = expand_paths(args.files)
+
+    def progress(n_completed: int, n_total: int, result: ConversionResult) -> None:
+        width = len(str(n_total))
+        if result.ok:
+            message = f"{result.source} -> {result.destination} ({result.wall_time:.2f}s)"
+        else:
+            message = f"{result.source} FAILED: {result.error}"
+        print(f"[{n_completed:>{width}}/{n_total}] {message}", file=sys.stderr, flush=True)
+
+    results = convert_files(
+        file_paths=file_paths,
+        options=options,
+        workers=args.workers,
+        progress=progress,
+        log_level=logging.DEBUG if args.verbose else logging.WARNING,
+    )
+
+    failed = [result for result in results if not result.ok]
+    print(f"Converted {len(results) - len(failed)} of {len(results)} files", file=sys.stderr)
+    return 1 if failed else 0
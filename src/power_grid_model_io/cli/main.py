@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+The pgm-io command line interface
+"""
+import argparse
+from typing import List, Optional
+
+from power_grid_model_io.cli import convert
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Parse the command line arguments and run the command, e.g. pgm-io convert --type vision exports/*.xlsx
+
+    Args:
+        argv: The command line arguments (by default: sys.argv[1:])
+
+    Returns:
+        The exit code
+    """
+    parser = argparse.ArgumentParser(prog="pgm-io", description="Power Grid Model Input/Output")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    convert.add_parser(subparsers)
+    args = parser.parse_args(argv)
+    return args.run(args)
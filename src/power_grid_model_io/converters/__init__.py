@@ -3,8 +3,28 @@
 # SPDX-License-Identifier: MPL-2.0
 """
 Converters
+
+The converters are imported lazily, e.g. `from power_grid_model_io.converters import PgmJsonConverter` doesn't import
+the pandapower converter.
 """
+from typing import TYPE_CHECKING
+
+from power_grid_model_io.utils.modules import lazy_attributes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from power_grid_model_io.converters.pandapower_converter import PandaPowerConverter
+    from power_grid_model_io.converters.pgm_json_converter import PgmJsonConverter
+    from power_grid_model_io.converters.tabular_converter import TabularConverter
+    from power_grid_model_io.converters.vision_excel_converter import VisionExcelConverter
+
+__all__ = ["PandaPowerConverter", "PgmJsonConverter", "TabularConverter", "VisionExcelConverter"]
 
-from power_grid_model_io.converters.pandapower_converter import PandaPowerConverter
-from power_grid_model_io.converters.pgm_json_converter import PgmJsonConverter
-from power_grid_model_io.converters.vision_excel_converter import VisionExcelConverter
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "PandaPowerConverter": "power_grid_model_io.converters.pandapower_converter",
+        "PgmJsonConverter": "power_grid_model_io.converters.pgm_json_converter",
+        "TabularConverter": "power_grid_model_io.converters.tabular_converter",
+        "VisionExcelConverter": "power_grid_model_io.converters.vision_excel_converter",
+    },
+)
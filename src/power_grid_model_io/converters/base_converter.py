@@ -4,15 +4,19 @@
 """
 Abstract converter class
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, Tuple, TypeVar
+from contextlib import nullcontext
+from functools import partial
+from typing import Any, ContextManager, Generic, Literal, Optional, Tuple, TypeVar, overload
 
 import structlog
 from power_grid_model.data_types import Dataset, SingleDataset
 
 from power_grid_model_io.data_stores.base_data_store import BaseDataStore
-from power_grid_model_io.data_types import ExtraInfoLookup
+from power_grid_model_io.data_types import ExtraInfoContainer, ExtraInfoLookup, ExtraInfoTable
 from power_grid_model_io.utils.auto_id import AutoID
+from power_grid_model_io.utils.instrumentation import Instrumentation
 
 T = TypeVar("T")
 
@@ -28,25 +32,85 @@ class BaseConverter(Generic[T], ABC):
         self._source = source
         self._destination = destination
         self._auto_id = AutoID()
+        self._instrumentation: Optional[Instrumentation] = None
 
-    def load_input_data(self, data: Optional[T] = None) -> Tuple[SingleDataset, ExtraInfoLookup]:
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]) -> None:
+        """
+        Measure the wall time, CPU time and (optionally) allocated memory of each stage of the conversions, e.g.
+        loading the data from the store, parsing the data, serializing the data and saving it to the store.
+
+        Args:
+            instrumentation: The instrumentation that records the metrics of each stage, or None to disable it
+        """
+        self._instrumentation = instrumentation
+
+    @overload
+    def load_input_data(
+        self, data: Optional[T] = None, columnar_extra_info: Literal[False] = False
+    ) -> Tuple[SingleDataset, ExtraInfoLookup]:
+        ...  # pragma: no cover
+
+    @overload
+    def load_input_data(
+        self, data: Optional[T] = None, *, columnar_extra_info: Literal[True]
+    ) -> Tuple[SingleDataset, ExtraInfoTable]:
+        ...  # pragma: no cover
+
+    def load_input_data(
+        self, data: Optional[T] = None, columnar_extra_info: bool = False
+    ) -> Tuple[SingleDataset, ExtraInfoContainer]:
         """Load input data and extra info
 
         Note: You shouldn't have to overwrite this method. Check _parse_data() instead.
 
         Args:
           data: Optional[T]:  (Default value = None)
+          columnar_extra_info: Return the extra info as an ExtraInfoTable, instead of a dictionary per object. This
+        requires much less memory for large networks.
 
         Returns:
 
         """
         data = self._load_data(data)
-        extra_info: ExtraInfoLookup = {}
-        data = self._parse_data(data=data, data_type="input", extra_info=extra_info)
+        extra_info: ExtraInfoContainer = ExtraInfoTable() if columnar_extra_info else {}
+        with self._stage("parse", data_type="input"):
+            data = self._parse_data(data=data, data_type="input", extra_info=extra_info)
         if isinstance(data, list):
             raise TypeError("Input data can not be batch data")
         return data, extra_info
 
+    @overload
+    async def aload_input_data(
+        self, data: Optional[T] = None, columnar_extra_info: Literal[False] = False
+    ) -> Tuple[SingleDataset, ExtraInfoLookup]:
+        ...  # pragma: no cover
+
+    @overload
+    async def aload_input_data(
+        self, data: Optional[T] = None, *, columnar_extra_info: Literal[True]
+    ) -> Tuple[SingleDataset, ExtraInfoTable]:
+        ...  # pragma: no cover
+
+    async def aload_input_data(
+        self, data: Optional[T] = None, columnar_extra_info: bool = False
+    ) -> Tuple[SingleDataset, ExtraInfoContainer]:
+        """Load input data and extra info asynchronously: the data is loaded using the asynchronous interface of the
+        source (if no data was supplied) and parsed in a separate thread, so that the event loop isn't blocked. This
+        way, a service can (for example) load the next file while the current file is being converted.
+
+        Args:
+          data: Optional[T]:  (Default value = None)
+          columnar_extra_info: Return the extra info as an ExtraInfoTable, instead of a dictionary per object.
+
+        Returns:
+
+        """
+        if data is None and self._source is not None:
+            data = await self._source.aload()
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(self.load_input_data, data=data, columnar_extra_info=columnar_extra_info)
+        )
+
     def load_update_data(self, data: Optional[T] = None) -> Dataset:
         """Load update data
 
@@ -59,7 +123,8 @@ class BaseConverter(Generic[T], ABC):
 
         """
         data = self._load_data(data)
-        return self._parse_data(data=data, data_type="update", extra_info=None)
+        with self._stage("parse", data_type="update"):
+            return self._parse_data(data=data, data_type="update", extra_info=None)
 
     def load_sym_output_data(self, data: Optional[T] = None) -> Dataset:
         """Load symmetric output data
@@ -73,7 +138,8 @@ class BaseConverter(Generic[T], ABC):
 
         """
         data = self._load_data(data)
-        return self._parse_data(data=data, data_type="sym_output", extra_info=None)
+        with self._stage("parse", data_type="sym_output"):
+            return self._parse_data(data=data, data_type="sym_output", extra_info=None)
 
     def load_asym_output_data(self, data: Optional[T] = None) -> Dataset:
         """Load asymmetric output data
@@ -87,26 +153,28 @@ class BaseConverter(Generic[T], ABC):
 
         """
         data = self._load_data(data)
-        return self._parse_data(data=data, data_type="asym_output", extra_info=None)
+        with self._stage("parse", data_type="asym_output"):
+            return self._parse_data(data=data, data_type="asym_output", extra_info=None)
 
-    def convert(self, data: Dataset, extra_info: Optional[ExtraInfoLookup] = None) -> T:
+    def convert(self, data: Dataset, extra_info: Optional[ExtraInfoContainer] = None) -> T:
         """Convert input/update/(a)sym_output data and optionally extra info.
 
         Note: You shouldn't have to overwrite this method. Check _serialize_data() instead.
 
         Args:
           data: Dataset:
-          extra_info: Optional[ExtraInfoLookup]:  (Default value = None)
+          extra_info: Optional[ExtraInfoContainer]:  (Default value = None)
 
         Returns:
 
         """
-        return self._serialize_data(data=data, extra_info=extra_info)
+        with self._stage("serialize"):
+            return self._serialize_data(data=data, extra_info=extra_info)
 
     def save(
         self,
         data: Dataset,
-        extra_info: Optional[ExtraInfoLookup] = None,
+        extra_info: Optional[ExtraInfoContainer] = None,
         destination: Optional[BaseDataStore[T]] = None,
     ) -> None:
         """Save input/update/(a)sym_output data and optionally extra info.
@@ -115,31 +183,66 @@ class BaseConverter(Generic[T], ABC):
 
         Args:
           data: Dataset:
-          extra_info: Optional[ExtraInfoLookup]:  (Default value = None)
+          extra_info: Optional[ExtraInfoContainer]:  (Default value = None)
           destination: Optional[BaseDataStore[T]]:  (Default value = None)
 
         Returns:
 
         """
         data_converted = self.convert(data=data, extra_info=extra_info)
-        if destination is not None:
+        if destination is None:
+            destination = self._destination
+        if destination is None:
+            raise ValueError("No destination supplied!")
+        with self._stage("store_save", store=type(destination).__name__):
             destination.save(data=data_converted)
-        elif self._destination is not None:
-            self._destination.save(data=data_converted)
-        else:
+
+    async def asave(
+        self,
+        data: Dataset,
+        extra_info: Optional[ExtraInfoContainer] = None,
+        destination: Optional[BaseDataStore[T]] = None,
+    ) -> None:
+        """Save input/update/(a)sym_output data and optionally extra info asynchronously: the data is converted in a
+        separate thread and saved using the asynchronous interface of the destination.
+
+        Args:
+          data: Dataset:
+          extra_info: Optional[ExtraInfoContainer]:  (Default value = None)
+          destination: Optional[BaseDataStore[T]]:  (Default value = None)
+
+        Returns:
+
+        """
+        if destination is None:
+            destination = self._destination
+        if destination is None:
             raise ValueError("No destination supplied!")
+        data_converted = await asyncio.get_running_loop().run_in_executor(
+            None, partial(self.convert, data=data, extra_info=extra_info)
+        )
+        await destination.asave(data=data_converted)
 
     def _load_data(self, data: Optional[T]) -> T:
         if data is not None:
             return data
         if self._source is not None:
-            return self._source.load()
+            with self._stage("store_load", store=type(self._source).__name__):
+                return self._source.load()
         raise ValueError("No data supplied!")
 
+    def _stage(self, name: str, **context: Any) -> ContextManager:
+        """
+        Measure a stage of the conversion, if instrumentation is enabled; see set_instrumentation()
+        """
+        if self._instrumentation is None:
+            return nullcontext()
+        return self._instrumentation.stage(name, **context)
+
     @abstractmethod  # pragma: nocover
-    def _parse_data(self, data: T, data_type: str, extra_info: Optional[ExtraInfoLookup]) -> Dataset:
+    def _parse_data(self, data: T, data_type: str, extra_info: Optional[ExtraInfoContainer]) -> Dataset:
         pass
 
     @abstractmethod  # pragma: nocover
-    def _serialize_data(self, data: Dataset, extra_info: Optional[ExtraInfoLookup]) -> T:
+    def _serialize_data(self, data: Dataset, extra_info: Optional[ExtraInfoContainer]) -> T:
         pass
@@ -5,8 +5,8 @@
 """
 Panda Power Converter
 """
-from functools import lru_cache
-from typing import Dict, List, MutableMapping, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -14,12 +14,77 @@ from power_grid_model import Branch3Side, BranchSide, LoadGenType, initialize_ar
 from power_grid_model.data_types import Dataset, SingleDataset
 
 from power_grid_model_io.converters.base_converter import BaseConverter
-from power_grid_model_io.data_types import ExtraInfoLookup
+from power_grid_model_io.data_types import ExtraInfoContainer, ExtraInfoTable
 from power_grid_model_io.functions import get_winding
 from power_grid_model_io.utils.regex import NODE_REF_RE, TRAFO3_CONNECTION_RE, TRAFO_CONNECTION_RE
+from power_grid_model_io.utils.uniques import apply_unique
 
 PandaPowerData = MutableMapping[str, pd.DataFrame]
 
+PP_INPUT_TABLES = [
+    "bus",
+    "line",
+    "ext_grid",
+    "load",
+    "shunt",
+    "trafo",
+    "sgen",
+    "trafo3w",
+    "switch",
+    "asymmetric_load",
+    "asymmetric_sgen",
+    "ward",
+    "motor",
+    "storage",
+    "impedance",
+    "xward",
+    "gen",
+    "dcline",
+]
+"""
+The PandaPower tables that are used to create power-grid-model input data
+"""
+
+PGM_INPUT_COMPONENTS = [
+    "node",
+    "line",
+    "source",
+    "sym_load",
+    "shunt",
+    "transformer",
+    "sym_gen",
+    "three_winding_transformer",
+    "link",
+    "asym_load",
+    "asym_gen",
+]
+"""
+The power-grid-model components that are created from PandaPower input data, in the order of conversion
+"""
+
+PP_OUTPUT_TABLES = [
+    "res_bus",
+    "res_line",
+    "res_ext_grid",
+    "res_load",
+    "res_shunt",
+    "res_trafo",
+    "res_sgen",
+    "res_trafo3w",
+    "res_ward",
+    "res_motor",
+    "res_asymmetric_sgen",
+    "res_asymmetric_load",
+]
+"""
+The PandaPower result tables that are created from power-grid-model output data, in the order of conversion
+"""
+
+SWITCH_ELEMENT_TABLES = {"l": "line", "t": "trafo", "t3": "trafo3w"}
+"""
+The PandaPower element types of switches and the corresponding tables ("b" switches are converted to links)
+"""
+
 
 # pylint: disable=too-many-instance-attributes
 class PandaPowerConverter(BaseConverter[PandaPowerData]):
@@ -29,15 +94,32 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
 
     __slots__ = ("pp_input_data", "pgm_input_data", "idx", "idx_lookup", "next_idx", "system_frequency")
 
-    def __init__(self, system_frequency: float = 50.0):
+    def __init__(
+        self,
+        system_frequency: float = 50.0,
+        compact_loads: bool = False,
+        max_workers: Optional[int] = 1,
+        incremental: bool = False,
+    ):
         """
         Prepare some member variables
 
         Args:
             system_frequency: fundamental frequency of the alternating current and voltage in the Network measured in Hz
+            compact_loads: only create the constant impedance and constant current sym_loads for PandaPower loads
+            with a non-zero const_z_percent / const_i_percent. In incremental updates, a percentage that changed to
+            zero results in a sym_load with a zero power; a percentage that changed from zero to non-zero can't be
+            converted to update data, so the input data should be converted again in that case.
+            max_workers: the maximum number of threads used to convert the components (1: convert the components
+            one by one, without threads; None: the default of concurrent.futures.ThreadPoolExecutor)
+            incremental: keep a copy of the converted PandaPower tables, so that later edits of the same network can
+            be converted to update data (see load_update_data()). This requires memory for a copy of the input tables.
         """
         super().__init__(source=None, destination=None)
         self.system_frequency: float = system_frequency
+        self.compact_loads = compact_loads
+        self.max_workers = max_workers
+        self.incremental = incremental
         self.pp_input_data: PandaPowerData = {}
         self.pgm_input_data: SingleDataset = {}
         self.pp_output_data: PandaPowerData = {}
@@ -46,9 +128,13 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
         self.idx: Dict[Tuple[str, Optional[str]], pd.Series] = {}
         self.idx_lookup: Dict[Tuple[str, Optional[str]], pd.Series] = {}
         self.next_idx = 0
+        self.pp_input_snapshot: Dict[str, pd.DataFrame] = {}
+        self._reuse_ids = False
+        self._reserved_ids: Dict[Tuple[str, Optional[str]], int] = {}
+        self._sym_load_rows: Dict[Tuple[str, Optional[str]], slice] = {}
 
     def _parse_data(
-        self, data: PandaPowerData, data_type: str, extra_info: Optional[ExtraInfoLookup] = None
+        self, data: PandaPowerData, data_type: str, extra_info: Optional[ExtraInfoContainer] = None
     ) -> Dataset:
         """
         Set up for conversion from PandaPower to power-grid-model
@@ -64,19 +150,28 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
             Converted power-grid-model data
         """
 
+        # Update data is based on the previously converted input data
+        if data_type == "update":
+            return self._create_update_data(data=data)
+        if data_type != "input":
+            raise ValueError(f"Data type: '{data_type}' is not implemented")
+
         # Clear pgm data
         self.pgm_input_data = {}
         self.idx_lookup = {}
         self.next_idx = 0
+        self._reserved_ids = {}
 
         # Set pandas data
         self.pp_input_data = data
 
         # Convert
-        if data_type == "input":
-            self._create_input_data()
-        else:
-            raise ValueError(f"Data type: '{data_type}' is not implemented")
+        self._create_input_data()
+
+        # Keep a copy of the converted tables, so that later edits can be converted incrementally
+        self.pp_input_snapshot = {}
+        if self.incremental:
+            self.pp_input_snapshot = {table: data[table].copy() for table in PP_INPUT_TABLES if table in data}
 
         # Construct extra_info
         if extra_info is not None:
@@ -84,7 +179,7 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
 
         return self.pgm_input_data
 
-    def _serialize_data(self, data: Dataset, extra_info: Optional[ExtraInfoLookup]) -> PandaPowerData:
+    def _serialize_data(self, data: Dataset, extra_info: Optional[ExtraInfoContainer]) -> PandaPowerData:
         """
         Set up for conversion from power-grid-model to PandaPower
 
@@ -105,8 +200,9 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
 
         # If extra_info is supplied, index lookups and node lookups should be created accordingly
         if extra_info is not None:
-            self._extra_info_to_idx_lookup(extra_info)
-            self._extra_info_to_pgm_input_data(extra_info)
+            table = extra_info if isinstance(extra_info, ExtraInfoTable) else ExtraInfoTable.from_lookup(extra_info)
+            self._extra_info_to_idx_lookup(table)
+            self._extra_info_to_pgm_input_data(table)
 
         # Convert
         self._create_output_data()
@@ -115,75 +211,357 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
 
     def _create_input_data(self):
         """
-        Performs the conversion from PandaPower to power-grid-model by calling individual conversion functions
+        Performs the conversion from PandaPower to power-grid-model by calling individual conversion functions.
+        All other components refer to the nodes, so the nodes are converted first. Then the id ranges of all other
+        components are reserved, in the same order as they would be created one by one, so that the (independent)
+        conversion functions can run concurrently and still generate the same ids.
         """
         self._create_pgm_input_nodes()
-        self._create_pgm_input_lines()
-        self._create_pgm_input_sources()
-        self._create_pgm_input_sym_loads()
-        self._create_pgm_input_shunts()
-        self._create_pgm_input_transformers()
-        self._create_pgm_input_sym_gens()
-        self._create_pgm_input_three_winding_transformers()
-        self._create_pgm_input_links()
-        self._create_pgm_input_asym_loads()
-        self._create_pgm_input_asym_gens()
-        self._create_pgm_input_wards()
-        self._create_pgm_input_motors()
-        self._create_pgm_input_storages()
-        self._create_pgm_input_impedances()
-        self._create_pgm_input_xwards()
-        self._create_pgm_input_generators()
-        self._create_pgm_input_dclines()
-
-    def _fill_extra_info(self, extra_info: ExtraInfoLookup):
+
+        blocks = self._get_pgm_input_blocks()
+        self._reserve_ids(blocks)
+        self._allocate_sym_loads(blocks)
+
+        _run_concurrently(
+            [
+                self._create_pgm_input_lines,
+                self._create_pgm_input_sources,
+                self._create_pgm_input_sym_loads,
+                self._create_pgm_input_shunts,
+                self._create_pgm_input_transformers,
+                self._create_pgm_input_sym_gens,
+                self._create_pgm_input_three_winding_transformers,
+                self._create_pgm_input_links,
+                self._create_pgm_input_asym_loads,
+                self._create_pgm_input_asym_gens,
+                self._create_pgm_input_wards,
+                self._create_pgm_input_motors,
+                self._create_pgm_input_storages,
+                self._create_pgm_input_impedances,
+                self._create_pgm_input_xwards,
+                self._create_pgm_input_generators,
+                self._create_pgm_input_dclines,
+            ],
+            max_workers=self.max_workers,
+        )
+
+        # The components are stored in a fixed order, regardless of the order in which the functions completed
+        self.pgm_input_data = _sort_components(self.pgm_input_data, order=PGM_INPUT_COMPONENTS)
+
+    def _get_pgm_input_blocks(self) -> List[Tuple[str, str, Optional[str], int]]:
+        """
+        Lists the blocks of power-grid-model objects (except for the nodes) that will be created by
+        _create_input_data(), in the order in which they would be created one by one.
+
+        Returns:
+            a list of (component, pp_table, name, number of objects) tuples
+        """
+
+        def n_objects(pp_table: str) -> int:
+            if pp_table not in self.pp_input_data:
+                return 0
+            return len(self.pp_input_data[pp_table])
+
+        def n_rows(pp_table: str, rows: Optional[np.ndarray]) -> int:
+            return n_objects(pp_table) if rows is None else int(np.count_nonzero(rows))
+
+        const_z_rows, const_i_rows = self._get_zip_load_rows() if n_objects("load") else (None, None)
+
+        n_links = 0
+        if n_objects("switch"):
+            n_links = int(np.count_nonzero(self.pp_input_data["switch"]["et"] == "b"))
+
+        return [
+            ("line", "line", None, n_objects("line")),
+            ("source", "ext_grid", None, n_objects("ext_grid")),
+            ("sym_load", "load", "const_power", n_objects("load")),
+            ("sym_load", "load", "const_impedance", n_rows("load", const_z_rows)),
+            ("sym_load", "load", "const_current", n_rows("load", const_i_rows)),
+            ("shunt", "shunt", None, n_objects("shunt")),
+            ("transformer", "trafo", None, n_objects("trafo")),
+            ("sym_gen", "sgen", None, n_objects("sgen")),
+            ("three_winding_transformer", "trafo3w", None, n_objects("trafo3w")),
+            ("link", "switch", "bus_to_bus", n_links),
+            ("asym_load", "asymmetric_load", None, n_objects("asymmetric_load")),
+            ("asym_gen", "asymmetric_sgen", None, n_objects("asymmetric_sgen")),
+            ("sym_load", "ward", "ward_const_power_load", n_objects("ward")),
+            ("sym_load", "ward", "ward_const_impedance_load", n_objects("ward")),
+            ("sym_load", "motor", "motor_load", n_objects("motor")),
+        ]
+
+    def _reserve_ids(self, blocks: List[Tuple[str, str, Optional[str], int]]):
+        """
+        Reserves a range of power-grid-model ids for each block of objects; _generate_ids() uses the reserved ranges.
+        During incremental conversions no new ids are generated, so nothing is reserved.
+
+        Args:
+            blocks: the blocks of objects, as returned by _get_pgm_input_blocks()
+        """
+        if self._reuse_ids:
+            return
+        for _, pp_table, name, n_objects in blocks:
+            self._reserved_ids[(pp_table, name)] = self.next_idx
+            self.next_idx += n_objects
+
+    def _allocate_sym_loads(self, blocks: List[Tuple[str, str, Optional[str], int]]):
+        """
+        Sym loads are created from several PandaPower tables (load, ward and motor). Instead of concatenating the
+        arrays of each table, the sym_load array is allocated once and each table fills its own rows.
+
+        Args:
+            blocks: the blocks of objects, as returned by _get_pgm_input_blocks()
+        """
+        self._sym_load_rows = {}
+        n_sym_loads = 0
+        for component, pp_table, name, n_objects in blocks:
+            if component == "sym_load":
+                self._sym_load_rows[(pp_table, name)] = slice(n_sym_loads, n_sym_loads + n_objects)
+                n_sym_loads += n_objects
+        if n_sym_loads > 0:
+            self.pgm_input_data["sym_load"] = initialize_array(
+                data_type="input", component_type="sym_load", shape=n_sym_loads
+            )
+
+    def _get_sym_load_rows(self, pp_table: str, name: str) -> Tuple[np.ndarray, slice]:
+        """
+        Get the sym_load array and the rows that are allocated for a specific PandaPower table (and name). If the
+        conversion functions are called individually, the sym_load array is allocated on the first call.
+
+        Args:
+            pp_table: Table name (e.g. "load")
+            name: The name of the sym loads (e.g. "const_power")
+
+        Returns:
+            the sym_load array and the (slice of) rows of the objects
+        """
+        if "sym_load" not in self.pgm_input_data:
+            self._allocate_sym_loads(self._get_pgm_input_blocks())
+        return self.pgm_input_data["sym_load"], self._sym_load_rows[(pp_table, name)]
+
+    def _get_zip_load_rows(self) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        In compact mode, the constant impedance and constant current parts of PandaPower loads are only created if
+        their percentage is non-zero. During incremental conversions, the parts that were created before are kept
+        (with a zero power, if their percentage changed to zero), while no new parts can be created.
+
+        Returns:
+            boolean masks of the loads for which the const_impedance and const_current sym_loads are created, or
+            (None, None) if they are created for all loads
+        """
+        if not self.compact_loads:
+            return None, None
+        pp_loads = self.pp_input_data["load"]
+        zip_load_rows = []
+        for name, percent_attr in (("const_impedance", "const_z_percent"), ("const_current", "const_i_percent")):
+            non_zero = np.broadcast_to(self._get_pp_attr("load", percent_attr, 0) != 0, len(pp_loads))
+            if not self._reuse_ids:
+                zip_load_rows.append(non_zero)
+                continue
+            existing = pp_loads.index.isin(self.idx[("load", name)].index)
+            if np.any(non_zero & ~existing):
+                raise ValueError(
+                    f"The {percent_attr} of load(s) {list(pp_loads.index[non_zero & ~existing])} changed from zero to "
+                    "non-zero, which can't be stored in update data; convert the input data instead"
+                )
+            zip_load_rows.append(existing)
+        return zip_load_rows[0], zip_load_rows[1]
+
+    def _create_update_data(self, data: PandaPowerData) -> SingleDataset:
+        """
+        Converts only the PandaPower objects that were changed since the last conversion. The previously generated
+        ids are kept, the power-grid-model input data (self.pgm_input_data) is patched and an update dataset
+        containing only the changed objects is returned. Objects can't be added or removed; in that case the input
+        data should be converted again.
+
+        Args:
+            data: PandaPowerData; the same network that was converted before, after some edits
+
+        Returns:
+            a power-grid-model update dataset
+        """
+        if not self.incremental:
+            raise ValueError(
+                "Update data can only be created if the converter was created with incremental=True, before the input "
+                "data was converted"
+            )
+        if not self.pp_input_snapshot:
+            raise ValueError("Update data can only be created after the input data has been converted")
+
+        changed_rows = self._get_changed_rows(data=data)
+
+        # Convert the changed rows only, while using the previously generated ids
+        pp_input_data = self.pp_input_data
+        pgm_input_data = self.pgm_input_data
+        self.pp_input_data = {table: data[table].loc[rows].copy() for table, rows in changed_rows.items()}
+        self.pgm_input_data = {}
+        self._reuse_ids = True
+        try:
+            self._create_input_data()
+            changed_data = self.pgm_input_data
+        finally:
+            self.pp_input_data = pp_input_data
+            self.pgm_input_data = pgm_input_data
+            self._reuse_ids = False
+
+        update_data = {}
+        for component, component_data in changed_data.items():
+            # Components without any (changed) objects, e.g. links in a network without bus-bus switches, are skipped
+            if component_data.size == 0 or component not in self.pgm_input_data:
+                continue
+            component_update = self._patch_pgm_input_data(component=component, component_data=component_data)
+            if component_update.size > 0:
+                update_data[component] = component_update
+
+        # The edited network is the new reference for the next incremental conversion
+        for table, rows in changed_rows.items():
+            if not rows.empty:
+                self.pp_input_snapshot[table] = data[table].copy()
+        self.pp_input_data = data
+
+        return update_data
+
+    def _get_changed_rows(self, data: PandaPowerData) -> Dict[str, pd.Index]:
+        """
+        Compares the PandaPower tables with the snapshot of the last conversion
+
+        Args:
+            data: PandaPowerData; the same network that was converted before, after some edits
+
+        Returns:
+            the indexes of the changed rows, for each table
+        """
+        changed_rows: Dict[str, pd.Index] = {}
+        for table, snapshot in self.pp_input_snapshot.items():
+            table_data = data[table]
+            if not table_data.index.equals(snapshot.index):
+                raise ValueError(f"Objects were added to or removed from '{table}'; convert the input data instead")
+            columns = snapshot.columns.intersection(table_data.columns)
+            old_values = snapshot[columns]
+            new_values = table_data[columns]
+            equal = (new_values == old_values) | (new_values.isna() & old_values.isna())
+            changed_rows[table] = table_data.index[~equal.all(axis=1).to_numpy()]
+
+        # A toggled switch changes the status of the line or transformer it is attached to, and the status of a
+        # changed line or transformer depends on all the switches that are attached to it.
+        switches = data["switch"]
+        toggled = switches.loc[changed_rows["switch"]]
+        attached = np.zeros(len(switches), dtype=bool)
+        for element_type, table in SWITCH_ELEMENT_TABLES.items():
+            elements = toggled.loc[toggled["et"] == element_type, "element"]
+            changed_rows[table] = changed_rows[table].union(pd.Index(elements))
+            attached |= (switches["et"] == element_type).to_numpy() & switches["element"].isin(changed_rows[table])
+        changed_rows["switch"] = changed_rows["switch"].union(switches.index[attached])
+
+        return changed_rows
+
+    def _patch_pgm_input_data(self, component: str, component_data: np.ndarray) -> np.ndarray:
+        """
+        Replaces the objects in the power-grid-model input data (matched on id) and creates update data for the
+        objects of which any of the updatable attributes changed.
+
+        Args:
+            component: the power-grid-model component name (e.g. "line")
+            component_data: the newly converted power-grid-model input data for the changed objects
+
+        Returns:
+            a power-grid-model update array for the component
+        """
+        input_data = self.pgm_input_data[component]
+        rows = pd.Index(input_data["id"]).get_indexer(component_data["id"])
+        assert np.all(rows >= 0)
+
+        update_attributes = power_grid_meta_data["update"][component]["dtype"].names
+        is_updated = np.zeros(len(component_data), dtype=bool)
+        fixed_attributes = []
+        for attr in component_data.dtype.names:
+            differs = self._differs(input_data[attr][rows], component_data[attr])
+            if attr in update_attributes:
+                is_updated |= differs
+            elif np.any(differs):
+                fixed_attributes.append(attr)
+        if fixed_attributes:
+            self._log.warning(
+                "Attributes changed that can't be stored in update data, only the input data is patched",
+                component=component,
+                attributes=fixed_attributes,
+            )
+
+        input_data[rows] = component_data
+
+        component_update = initialize_array(data_type="update", component_type=component, shape=is_updated.sum())
+        for attr in update_attributes:
+            component_update[attr] = component_data[attr][is_updated]
+        return component_update
+
+    @staticmethod
+    def _differs(old_values: np.ndarray, new_values: np.ndarray) -> np.ndarray:
+        """
+        Compares two (possibly multi dimensional) attribute arrays, where NaN values are considered to be equal
+
+        Args:
+            old_values: the original values
+            new_values: the new values
+
+        Returns:
+            a boolean array, True for each object that differs
+        """
+        differs = old_values != new_values
+        if np.issubdtype(old_values.dtype, np.floating):
+            differs &= ~(np.isnan(old_values) & np.isnan(new_values))
+        return differs.reshape(len(old_values), int(np.prod(differs.shape[1:]))).any(axis=1)
+
+    def _fill_extra_info(self, extra_info: ExtraInfoContainer):
+        """
+        Stores the original PandaPower table, name and index of each object, and the node references of all branches
+        and appliances. The extra info is collected column-wise; if extra_info is a regular dictionary, the
+        dictionaries per object are only created at the end.
+
+        Args:
+            extra_info: a dictionary (or ExtraInfoTable) where the extra info is stored
+        """
+        table = extra_info if isinstance(extra_info, ExtraInfoTable) else ExtraInfoTable()
         for (pp_table, name), indices in self.idx_lookup.items():
-            for pgm_id, pp_idx in zip(indices.index, indices):
-                if name:
-                    extra_info[pgm_id] = {"id_reference": {"table": pp_table, "name": name, "index": pp_idx}}
-                else:
-                    extra_info[pgm_id] = {"id_reference": {"table": pp_table, "index": pp_idx}}
+            table.add(ids=indices.index, columns={"id_reference": {"table": pp_table, "name": name, "index": indices}})
         for component_data in self.pgm_input_data.values():
-            for attr_name in component_data.dtype.names:
-                if NODE_REF_RE.fullmatch(attr_name):
-                    for pgm_id, node_id in component_data[["id", attr_name]]:
-                        if pgm_id not in extra_info:
-                            extra_info[pgm_id] = {attr_name: node_id}
-                        else:
-                            extra_info[pgm_id][attr_name] = node_id
+            node_cols = [col for col in component_data.dtype.names if NODE_REF_RE.fullmatch(col)]
+            if node_cols:
+                table.add(ids=component_data["id"], columns={col: component_data[col] for col in node_cols})
+
+        if not isinstance(extra_info, ExtraInfoTable):
+            for pgm_id, extra in table.to_lookup().items():
+                if pgm_id in extra_info:
+                    extra_info[pgm_id].update(extra)
+                else:
+                    extra_info[pgm_id] = extra
 
-    def _extra_info_to_idx_lookup(self, extra_info: ExtraInfoLookup):
+    def _extra_info_to_idx_lookup(self, extra_info: ExtraInfoTable):
         """
         Converts extra component info into idx_lookup
 
         Args:
-            extra_info: a dictionary where the original panda power ids are stored
+            extra_info: a table where the original panda power ids are stored
         """
         self.idx = {}
         self.idx_lookup = {}
-        pgm_to_pp_id: Dict[Tuple[str, Optional[str]], List[Tuple[int, int]]] = {}
-        for pgm_idx, extra in extra_info.items():
-            if "id_reference" not in extra:
-                continue
-            assert isinstance(extra["id_reference"], dict)
-            pp_table = extra["id_reference"]["table"]
-            pp_index = extra["id_reference"]["index"]
-            pp_name = extra["id_reference"].get("name")
-            key = (pp_table, pp_name)
-            if key not in pgm_to_pp_id:
-                pgm_to_pp_id[key] = []
-            pgm_to_pp_id[key].append((pgm_idx, pp_index))
-        for key, table_pgm_to_pp_id in pgm_to_pp_id.items():
-            pgm_ids, pp_indices = zip(*table_pgm_to_pp_id)
+        extra = extra_info.to_frame()
+        if "id_reference.table" not in extra:
+            return
+        extra = extra[extra["id_reference.table"].notna()]
+        if "id_reference.name" not in extra:
+            extra = extra.assign(**{"id_reference.name": None})
+        for (pp_table, pp_name), group in extra.groupby(["id_reference.table", "id_reference.name"], dropna=False):
+            key = (pp_table, None if pd.isna(pp_name) else pp_name)
+            pgm_ids = group.index.to_numpy()
+            pp_indices = group["id_reference.index"].infer_objects().to_numpy()
             self.idx[key] = pd.Series(pgm_ids, index=pp_indices)
             self.idx_lookup[key] = pd.Series(pp_indices, index=pgm_ids)
 
-    def _extra_info_to_pgm_input_data(self, extra_info: ExtraInfoLookup):
+    def _extra_info_to_pgm_input_data(self, extra_info: ExtraInfoTable):
         """
         Converts extra component info into node_lookup
 
         Args:
-            extra_info: a dictionary where the node reference ids are stored
+            extra_info: a table where the node reference ids are stored
         """
         assert not self.pgm_input_data
         assert self.pgm_output_data
@@ -201,9 +579,11 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
                 fill_value=nan,
                 dtype={"names": ["id"] + node_cols, "formats": [dtype] * num_cols},
             )
-            for i, pgm_id in enumerate(data["id"]):
-                extra = extra_info[pgm_id]
-                ref[i] = (pgm_id,) + tuple(extra[col] for col in node_cols)
+            ref["id"] = data["id"]
+            extra = extra_info.join(data["id"])
+            for col in node_cols:
+                if col in extra:
+                    ref[col] = extra[col].fillna(nan).to_numpy(dtype=dtype)
             self.pgm_input_data[component] = ref
 
     def _create_output_data(self):
@@ -222,18 +602,27 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
             index=self.pgm_output_data["node"]["id"],
         )
 
-        self._pp_buses_output()
-        self._pp_lines_output()
-        self._pp_ext_grids_output()
-        self._pp_loads_output()
-        self._pp_shunts_output()
-        self._pp_trafos_output()
-        self._pp_sgens_output()
-        self._pp_trafos3w_output()
-        self._pp_ward_output()
-        self._pp_motor_output()
-        self._pp_asym_gens_output()
-        self._pp_asym_loads_output()
+        # Each conversion function creates its own PandaPower table, so they can run concurrently
+        _run_concurrently(
+            [
+                self._pp_buses_output,
+                self._pp_lines_output,
+                self._pp_ext_grids_output,
+                self._pp_loads_output,
+                self._pp_shunts_output,
+                self._pp_trafos_output,
+                self._pp_sgens_output,
+                self._pp_trafos3w_output,
+                self._pp_ward_output,
+                self._pp_motor_output,
+                self._pp_asym_gens_output,
+                self._pp_asym_loads_output,
+            ],
+            max_workers=self.max_workers,
+        )
+
+        # The tables are stored in a fixed order, regardless of the order in which the functions completed
+        self.pp_output_data = _sort_components(self.pp_output_data, order=PP_OUTPUT_TABLES)
 
     def _create_pgm_input_nodes(self):
         """
@@ -434,37 +823,42 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
         q_mvar = self._get_pp_attr("load", "q_mvar", 0.0)
         bus = self._get_pp_attr("load", "bus")
 
-        n_loads = len(pp_loads)
-
-        pgm_sym_loads = initialize_array(data_type="input", component_type="sym_load", shape=3 * n_loads)
-
         const_i_multiplier = self._get_pp_attr("load", "const_i_percent", 0) * scaling * (1e-2 * 1e6)
         const_z_multiplier = self._get_pp_attr("load", "const_z_percent", 0) * scaling * (1e-2 * 1e6)
         const_p_multiplier = (1e6 - const_i_multiplier - const_z_multiplier) * scaling
 
-        pgm_sym_loads["id"][:n_loads] = self._generate_ids("load", pp_loads.index, name="const_power")
-        pgm_sym_loads["node"][:n_loads] = self._get_pgm_ids("bus", bus)
-        pgm_sym_loads["status"][:n_loads] = in_service
-        pgm_sym_loads["type"][:n_loads] = LoadGenType.const_power
-        pgm_sym_loads["p_specified"][:n_loads] = const_p_multiplier * p_mw
-        pgm_sym_loads["q_specified"][:n_loads] = const_p_multiplier * q_mvar
-
-        pgm_sym_loads["id"][n_loads : 2 * n_loads] = self._generate_ids("load", pp_loads.index, name="const_impedance")
-        pgm_sym_loads["node"][n_loads : 2 * n_loads] = self._get_pgm_ids("bus", bus)
-        pgm_sym_loads["status"][n_loads : 2 * n_loads] = in_service
-        pgm_sym_loads["type"][n_loads : 2 * n_loads] = LoadGenType.const_impedance
-        pgm_sym_loads["p_specified"][n_loads : 2 * n_loads] = const_z_multiplier * p_mw
-        pgm_sym_loads["q_specified"][n_loads : 2 * n_loads] = const_z_multiplier * q_mvar
-
-        pgm_sym_loads["id"][-n_loads:] = self._generate_ids("load", pp_loads.index, name="const_current")
-        pgm_sym_loads["node"][-n_loads:] = self._get_pgm_ids("bus", bus)
-        pgm_sym_loads["status"][-n_loads:] = in_service
-        pgm_sym_loads["type"][-n_loads:] = LoadGenType.const_current
-        pgm_sym_loads["p_specified"][-n_loads:] = const_i_multiplier * p_mw
-        pgm_sym_loads["q_specified"][-n_loads:] = const_i_multiplier * q_mvar
-
-        assert "sym_load" not in self.pgm_input_data
-        self.pgm_input_data["sym_load"] = pgm_sym_loads
+        const_z_rows, const_i_rows = self._get_zip_load_rows()
+
+        def select(values, rows: Optional[np.ndarray]):
+            return values if rows is None else np.broadcast_to(values, len(pp_loads))[rows]
+
+        pgm_sym_loads, rows = self._get_sym_load_rows("load", "const_power")
+        pgm_sym_loads["id"][rows] = self._generate_ids("load", pp_loads.index, name="const_power")
+        pgm_sym_loads["node"][rows] = self._get_pgm_ids("bus", bus)
+        pgm_sym_loads["status"][rows] = in_service
+        pgm_sym_loads["type"][rows] = LoadGenType.const_power
+        pgm_sym_loads["p_specified"][rows] = const_p_multiplier * p_mw
+        pgm_sym_loads["q_specified"][rows] = const_p_multiplier * q_mvar
+
+        _, rows = self._get_sym_load_rows("load", "const_impedance")
+        pgm_sym_loads["id"][rows] = self._generate_ids(
+            "load", select(pp_loads.index, const_z_rows), name="const_impedance"
+        )
+        pgm_sym_loads["node"][rows] = self._get_pgm_ids("bus", select(bus, const_z_rows))
+        pgm_sym_loads["status"][rows] = select(in_service, const_z_rows)
+        pgm_sym_loads["type"][rows] = LoadGenType.const_impedance
+        pgm_sym_loads["p_specified"][rows] = select(const_z_multiplier * p_mw, const_z_rows)
+        pgm_sym_loads["q_specified"][rows] = select(const_z_multiplier * q_mvar, const_z_rows)
+
+        _, rows = self._get_sym_load_rows("load", "const_current")
+        pgm_sym_loads["id"][rows] = self._generate_ids(
+            "load", select(pp_loads.index, const_i_rows), name="const_current"
+        )
+        pgm_sym_loads["node"][rows] = self._get_pgm_ids("bus", select(bus, const_i_rows))
+        pgm_sym_loads["status"][rows] = select(in_service, const_i_rows)
+        pgm_sym_loads["type"][rows] = LoadGenType.const_current
+        pgm_sym_loads["p_specified"][rows] = select(const_i_multiplier * p_mw, const_i_rows)
+        pgm_sym_loads["q_specified"][rows] = select(const_i_multiplier * q_mvar, const_i_rows)
 
     def _create_pgm_input_asym_loads(self):
         """
@@ -701,38 +1095,24 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
         if pp_wards.empty:
             return
 
-        n_wards = len(pp_wards)
         in_service = self._get_pp_attr("ward", "in_service", True)
         bus = self._get_pp_attr("ward", "bus")
 
-        pgm_sym_loads_from_ward = initialize_array(data_type="input", component_type="sym_load", shape=n_wards * 2)
-        pgm_sym_loads_from_ward["id"][:n_wards] = self._generate_ids(
-            "ward", pp_wards.index, name="ward_const_power_load"
-        )
-        pgm_sym_loads_from_ward["node"][:n_wards] = self._get_pgm_ids("bus", bus)
-        pgm_sym_loads_from_ward["status"][:n_wards] = in_service
-        pgm_sym_loads_from_ward["type"][:n_wards] = LoadGenType.const_power
-        pgm_sym_loads_from_ward["p_specified"][:n_wards] = self._get_pp_attr("ward", "ps_mw") * 1e6
-        pgm_sym_loads_from_ward["q_specified"][:n_wards] = self._get_pp_attr("ward", "qs_mvar") * 1e6
-
-        pgm_sym_loads_from_ward["id"][-n_wards:] = self._generate_ids(
-            "ward", pp_wards.index, name="ward_const_impedance_load"
-        )
-        pgm_sym_loads_from_ward["node"][-n_wards:] = self._get_pgm_ids("bus", bus)
-        pgm_sym_loads_from_ward["status"][-n_wards:] = in_service
-        pgm_sym_loads_from_ward["type"][-n_wards:] = LoadGenType.const_impedance
-        pgm_sym_loads_from_ward["p_specified"][-n_wards:] = self._get_pp_attr("ward", "pz_mw") * 1e6
-        pgm_sym_loads_from_ward["q_specified"][-n_wards:] = self._get_pp_attr("ward", "qz_mvar") * 1e6
-
-        #  If input data of loads has already been filled then extend it with data of wards. If it is empty and there
-        #  is no data about loads,then assign ward data to it
-        if "sym_load" in self.pgm_input_data:
-            symload_dtype = self.pgm_input_data["sym_load"].dtype
-            self.pgm_input_data["sym_load"] = np.concatenate(  # pylint: disable=unexpected-keyword-arg
-                [self.pgm_input_data["sym_load"], pgm_sym_loads_from_ward], dtype=symload_dtype
-            )
-        else:
-            self.pgm_input_data["sym_load"] = pgm_sym_loads_from_ward
+        pgm_sym_loads, rows = self._get_sym_load_rows("ward", "ward_const_power_load")
+        pgm_sym_loads["id"][rows] = self._generate_ids("ward", pp_wards.index, name="ward_const_power_load")
+        pgm_sym_loads["node"][rows] = self._get_pgm_ids("bus", bus)
+        pgm_sym_loads["status"][rows] = in_service
+        pgm_sym_loads["type"][rows] = LoadGenType.const_power
+        pgm_sym_loads["p_specified"][rows] = self._get_pp_attr("ward", "ps_mw") * 1e6
+        pgm_sym_loads["q_specified"][rows] = self._get_pp_attr("ward", "qs_mvar") * 1e6
+
+        _, rows = self._get_sym_load_rows("ward", "ward_const_impedance_load")
+        pgm_sym_loads["id"][rows] = self._generate_ids("ward", pp_wards.index, name="ward_const_impedance_load")
+        pgm_sym_loads["node"][rows] = self._get_pgm_ids("bus", bus)
+        pgm_sym_loads["status"][rows] = in_service
+        pgm_sym_loads["type"][rows] = LoadGenType.const_impedance
+        pgm_sym_loads["p_specified"][rows] = self._get_pp_attr("ward", "pz_mw") * 1e6
+        pgm_sym_loads["q_specified"][rows] = self._get_pp_attr("ward", "qz_mvar") * 1e6
 
     def _create_pgm_input_xwards(self):
         # TODO: create unit tests for the function
@@ -750,34 +1130,24 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
         if pp_motors.empty:
             return
 
-        pgm_sym_loads_from_motor = initialize_array(data_type="input", component_type="sym_load", shape=len(pp_motors))
-        pgm_sym_loads_from_motor["id"] = self._generate_ids("motor", pp_motors.index, name="motor_load")
-        pgm_sym_loads_from_motor["node"] = self._get_pgm_ids("bus", self._get_pp_attr("motor", "bus"))
-        pgm_sym_loads_from_motor["status"] = self._get_pp_attr("motor", "in_service")
-        pgm_sym_loads_from_motor["type"] = LoadGenType.const_power
+        pgm_sym_loads, rows = self._get_sym_load_rows("motor", "motor_load")
+        pgm_sym_loads["id"][rows] = self._generate_ids("motor", pp_motors.index, name="motor_load")
+        pgm_sym_loads["node"][rows] = self._get_pgm_ids("bus", self._get_pp_attr("motor", "bus"))
+        pgm_sym_loads["status"][rows] = self._get_pp_attr("motor", "in_service")
+        pgm_sym_loads["type"][rows] = LoadGenType.const_power
         #  The formula for p_specified is pn_mech_mw /(efficiency_percent/100) * (loading_percent/100) * scaling * 1e6
-        pgm_sym_loads_from_motor["p_specified"] = (
+        pgm_sym_loads["p_specified"][rows] = (
             self._get_pp_attr("motor", "pn_mech_mw")
             / self._get_pp_attr("motor", "efficiency_percent")
             * self._get_pp_attr("motor", "loading_percent")
             * self._get_pp_attr("motor", "scaling")
             * 1e6
         )
-        p_spec = pgm_sym_loads_from_motor["p_specified"]
-        pgm_sym_loads_from_motor["q_specified"] = np.sqrt(
+        p_spec = pgm_sym_loads["p_specified"][rows]
+        pgm_sym_loads["q_specified"][rows] = np.sqrt(
             np.power(p_spec / self._get_pp_attr("motor", "cos_phi"), 2) - p_spec**2
         )
 
-        #  If input data of loads has already been filled then extend it with data of motors. If it is empty and there
-        #  is no data about loads,then assign motor data to it
-        if "sym_load" in self.pgm_input_data:
-            symload_dtype = self.pgm_input_data["sym_load"].dtype
-            self.pgm_input_data["sym_load"] = np.concatenate(  # pylint: disable=unexpected-keyword-arg
-                [self.pgm_input_data["sym_load"], pgm_sym_loads_from_motor], dtype=symload_dtype
-            )
-        else:
-            self.pgm_input_data["sym_load"] = pgm_sym_loads_from_motor
-
     def _create_pgm_input_dclines(self):
         # TODO: create unit tests for the function
         pp_dcline = self.pp_input_data["dcline"]
@@ -1291,13 +1661,24 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
         Returns:
             the generated IDs
         """
+        # During incremental conversions, the ids that were previously generated are used
+        if self._reuse_ids:
+            return self._get_pgm_ids(pp_table, pp_idx, name=name).to_numpy()
+
         key = (pp_table, name)
         assert key not in self.idx_lookup
         n_objects = len(pp_idx)
-        pgm_idx = np.arange(start=self.next_idx, stop=self.next_idx + n_objects, dtype=np.int32)
+
+        # Use the range of ids that was reserved by _create_input_data(), if any
+        if key in self._reserved_ids:
+            start = self._reserved_ids.pop(key)
+        else:
+            start = self.next_idx
+            self.next_idx += n_objects
+
+        pgm_idx = np.arange(start=start, stop=start + n_objects, dtype=np.int32)
         self.idx[key] = pd.Series(pgm_idx, index=pp_idx)
         self.idx_lookup[key] = pd.Series(pp_idx, index=pgm_idx)
-        self.next_idx += n_objects
         return pgm_idx
 
     def _get_pgm_ids(
@@ -1523,19 +1904,19 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
             the "from" and "to" winding types of a transformer
         """
 
-        @lru_cache
-        def vector_group_to_winding_types(vector_group: str) -> pd.Series:
+        def vector_group_to_winding_types(vector_group: str) -> Tuple[int, int]:
             match = TRAFO_CONNECTION_RE.fullmatch(vector_group)
             if not match:
                 raise ValueError(f"Invalid transformer connection string: '{vector_group}'")
             winding_from = get_winding(match.group(1)).value
             winding_to = get_winding(match.group(2)).value
-            return pd.Series([winding_from, winding_to])
+            return winding_from, winding_to
 
+        # Each distinct vector group is parsed only once
         trafo = self.pp_input_data["trafo"]
-        trafo = trafo["vector_group"].apply(vector_group_to_winding_types)
-        trafo.columns = ["winding_from", "winding_to"]
-        return trafo
+        return apply_unique(
+            trafo["vector_group"], vector_group_to_winding_types, columns=["winding_from", "winding_to"]
+        )
 
     def get_trafo3w_winding_types(self) -> pd.DataFrame:
         """
@@ -1545,20 +1926,20 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
             the three winding types of Three Winding Transformers
         """
 
-        @lru_cache
-        def vector_group_to_winding_types(vector_group: str) -> pd.Series:
+        def vector_group_to_winding_types(vector_group: str) -> Tuple[int, int, int]:
             match = TRAFO3_CONNECTION_RE.fullmatch(vector_group)
             if not match:
                 raise ValueError(f"Invalid transformer connection string: '{vector_group}'")
             winding_1 = get_winding(match.group(1)).value
             winding_2 = get_winding(match.group(2)).value
             winding_3 = get_winding(match.group(4)).value
-            return pd.Series([winding_1, winding_2, winding_3])
+            return winding_1, winding_2, winding_3
 
+        # Each distinct vector group is parsed only once
         trafo3w = self.pp_input_data["trafo3w"]
-        trafo3w = trafo3w["vector_group"].apply(vector_group_to_winding_types)
-        trafo3w.columns = ["winding_1", "winding_2", "winding_3"]
-        return trafo3w
+        return apply_unique(
+            trafo3w["vector_group"], vector_group_to_winding_types, columns=["winding_1", "winding_2", "winding_3"]
+        )
 
     def _get_pp_attr(self, table: str, attribute: str, default: Optional[Union[float, bool]] = None) -> np.ndarray:
         """
@@ -1580,14 +1961,27 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
                 raise KeyError(f"No '{attribute}' value for '{table}'.")
             return np.array([default])
 
-        attr_data = pp_component_data[attribute]
+        # Extract the column as a numpy array; this is a view on the PandaPower data, if possible
+        attr_data = pp_component_data[attribute].to_numpy()
 
-        # If any of the attribute values are missing, and a default is supplied, fill the nans with the default value
-        nan_values = np.equal(attr_data, None) if attr_data.dtype is np.dtype("O") else np.isnan(attr_data)
-        if any(nan_values):
-            attr_data = attr_data.fillna(value=default, inplace=False)
+        # Integer and boolean columns can't contain missing values
+        if attr_data.dtype.kind not in "fO":
+            return attr_data
 
-        return attr_data.to_numpy()
+        # If none of the attribute values are missing, or the default would be NaN anyway, use the data as is
+        missing = pd.isna(attr_data)
+        if not missing.any() or (isinstance(default, float) and np.isnan(default)):
+            return attr_data
+
+        if default is None:
+            if attr_data.dtype.kind == "f":
+                raise ValueError(f"Missing '{attribute}' values for '{table}' and no default value is available.")
+            return attr_data
+
+        # Fill the missing values with the default value in a single copy, so the PandaPower data remains untouched
+        attr_data = attr_data.copy()
+        attr_data[missing] = default
+        return attr_data
 
     def get_id(self, pp_table: str, pp_idx: int, name: Optional[str] = None) -> int:
         """
@@ -1618,3 +2012,42 @@ class PandaPowerConverter(BaseConverter[PandaPowerData]):
                     return {"table": table, "name": name, "index": indices[pgm_id]}
                 return {"table": table, "index": indices[pgm_id]}
         raise KeyError(pgm_id)
+
+
+def _run_concurrently(functions: List[Callable[[], None]], max_workers: Optional[int] = None):
+    """
+    Calls the functions on a pool of threads and waits until all of them have finished. Most of the heavy lifting is
+    done by numpy and pandas, which release the GIL for large arrays. If any of the functions raise an exception, the
+    exception of the first of those functions (in the order of the list) is re-raised.
+
+    Args:
+        functions: The functions to call; they should not depend on each other
+        max_workers: The maximum number of threads (see concurrent.futures.ThreadPoolExecutor); if it is 1, the
+            functions are called one by one, in the current thread
+    """
+    if max_workers == 1:
+        for function in functions:
+            function()
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(function) for function in functions]
+        for future in futures:
+            future.result()
+
+
+def _sort_components(data: Dict[str, Any], order: List[str]) -> Dict[str, Any]:
+    """
+    Sort the components (or tables) of a dataset in a fixed order; components that are not in the list are kept, in
+    their original order, after the listed components
+
+    Args:
+        data: The dataset
+        order: The component names, in the required order
+
+    Returns:
+        The same components, in the required order
+    """
+    return {
+        **{component: data[component] for component in order if component in data},
+        **{component: values for component, values in data.items() if component not in order},
+    }
@@ -1,26 +1,48 @@
 # SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
 #
 # SPDX-License-Identifier: MPL-2.0
+# pylint: disable = too-many-lines
 """
 Tabular Data Converter: Load data from multiple tables and use a mapping file to convert the data to PGM
 """
 import inspect
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Mapping, Optional, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    ContextManager,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
 import pandas as pd
 import yaml
-from power_grid_model import initialize_array
-from power_grid_model.data_types import Dataset
+from power_grid_model import initialize_array, power_grid_meta_data
+from power_grid_model.data_types import BatchArray, BatchDataset, BatchList, Dataset, SingleDataset, SparseBatchArray
 
 from power_grid_model_io.converters.base_converter import BaseConverter
 from power_grid_model_io.data_stores.base_data_store import BaseDataStore
-from power_grid_model_io.data_types import ExtraInfoLookup, TabularData
+from power_grid_model_io.data_stores.chunked_data_store import ChunkedDataStore
+from power_grid_model_io.data_types import ExtraInfoContainer, ExtraInfoTable, TabularData
 from power_grid_model_io.mappings.multiplier_mapping import MultiplierMapping, Multipliers
 from power_grid_model_io.mappings.tabular_mapping import InstanceAttributes, Tables, TabularMapping
 from power_grid_model_io.mappings.unit_mapping import UnitMapping, Units
 from power_grid_model_io.mappings.value_mapping import ValueMapping, Values
+from power_grid_model_io.utils.auto_id_state import load_auto_id_state, save_auto_id_state
+from power_grid_model_io.utils.expressions import compile_expression
+from power_grid_model_io.utils.growable_array import GrowableArray
+from power_grid_model_io.utils.instrumentation import Instrumentation
+from power_grid_model_io.utils.mapping_profile import MappingProfile
 from power_grid_model_io.utils.modules import get_function
 
 MappingFile = Dict[Literal["multipliers", "grid", "units", "substitutions"], Union[Multipliers, Tables, Units, Values]]
@@ -34,18 +56,24 @@ class TabularConverter(BaseConverter[TabularData]):
         mapping_file: Optional[Path] = None,
         source: Optional[BaseDataStore[TabularData]] = None,
         destination: Optional[BaseDataStore[TabularData]] = None,
+        profile: bool = False,
     ):
         """
         Prepare some member variables and optionally load a mapping file
 
         Args:
             mapping_file: A yaml file containing the mapping.
+            profile: Measure the time spent on each entry of the mapping; see get_profile().
         """
         super().__init__(source=source, destination=destination)
+        self._profile = profile
+        if profile:
+            self.set_instrumentation(Instrumentation())
         self._mapping: TabularMapping = TabularMapping(mapping={})
         self._units: Optional[UnitMapping] = None
         self._substitutions: Optional[ValueMapping] = None
         self._multipliers: Optional[MultiplierMapping] = None
+        self._reference_index: Dict[Tuple[str, Tuple[str, ...]], pd.Index] = {}
         if mapping_file is not None:
             self.set_mapping_file(mapping_file=mapping_file)
 
@@ -79,7 +107,7 @@ class TabularConverter(BaseConverter[TabularData]):
             MultiplierMapping(cast(Multipliers, mapping["multipliers"])) if "multipliers" in mapping else None
         )
 
-    def _parse_data(self, data: TabularData, data_type: str, extra_info: Optional[ExtraInfoLookup]) -> Dataset:
+    def _parse_data(self, data: TabularData, data_type: str, extra_info: Optional[ExtraInfoContainer]) -> Dataset:
         """This function parses tabular data and returns power-grid-model data
 
         Args:
@@ -90,41 +118,39 @@ class TabularConverter(BaseConverter[TabularData]):
         power-grid-model data) can be specified
           data: TabularData:
           data_type: str:
-          extra_info: Optional[ExtraInfoLookup]:
+          extra_info: Optional[ExtraInfoContainer]:
 
         Returns:
           a power-grid-model dataset, i.e. a dictionary as {component: np.ndarray}
 
         """
-        # Apply units and substitutions to the data. Note that the conversions are 'lazy', i.e. the units and
-        # substitutions will be applied the first time .get_column(table, field) is called.
-        if self._units is not None:
-            data.set_unit_multipliers(self._units)
-        if self._substitutions is not None:
-            data.set_substitutions(self._substitutions)
+        self._prepare_data(data)
 
         # Initialize some empty data structures
         pgm: Dict[str, List[np.ndarray]] = {}
+        self._reference_index = {}
 
         # For each table in the mapping
         for table in self._mapping.tables():
             if table not in data or len(data[table]) == 0:
                 continue  # pragma: no cover (bug in python 3.9)
             for component, attributes in self._mapping.instances(table=table):
-                component_data = self._convert_table_to_component(
-                    data=data,
-                    data_type=data_type,
-                    table=table,
-                    component=component,
-                    attributes=attributes,
-                    extra_info=extra_info,
-                )
+                with self._stage("table", table=table, component=component, rows=len(data[table])):
+                    component_data = self._convert_table_to_component(
+                        data=data,
+                        data_type=data_type,
+                        table=table,
+                        component=component,
+                        attributes=attributes,
+                        extra_info=extra_info,
+                    )
                 if component_data is not None:
                     if component not in pgm:
                         pgm[component] = []
                     pgm[component].append(component_data)
 
-        input_data = TabularConverter._merge_pgm_data(data=pgm)
+        with self._stage("merge"):
+            input_data = TabularConverter._merge_pgm_data(data=pgm)
         self._log.debug(
             "Converted tabular data to power grid model data",
             n_components=len(input_data),
@@ -132,6 +158,359 @@ class TabularConverter(BaseConverter[TabularData]):
         )
         return input_data
 
+    # pylint: disable = too-many-locals
+    def load_input_data_in_chunks(
+        self,
+        source: ChunkedDataStore,
+        chunk_size: int = 100_000,
+        reference_tables: Optional[Collection[str]] = None,
+        memmap_dir: Optional[Path] = None,
+        columnar_extra_info: bool = False,
+    ) -> Tuple[SingleDataset, ExtraInfoContainer]:
+        """Load input data and extra info, while reading the tables in chunks of rows. Only a single chunk of a table
+        (and the reference tables) is kept in memory, and the component arrays are filled chunk by chunk.
+
+        Auto ids are shared by all chunks, so auto ids referring to other tables (e.g. the from_node of a line) resolve
+        to the same objects as in load_input_data(). Note however that the ids are generated chunk by chunk, so the
+        numbering usually differs from load_input_data(): for each chunk, ids are created for the objects in that
+        chunk and for the objects they refer to, before the next chunk is converted. E.g. if the lines are converted
+        before the nodes, the ids of the lines and of the nodes they refer to are interleaved per chunk, instead of
+        all lines first. The same applies to tables with multiple component instances (e.g. two sym_loads per row).
+        The ids are only the same as in load_input_data() if each table contains a single component instance, without
+        auto ids referring to tables that haven't been converted yet.
+
+        Reference lookups (`reference`) require the entire other table; these tables should be supplied as
+        reference_tables, which are loaded entirely (once). References to the table that is being converted only
+        resolve within the same chunk.
+
+        Args:
+          source: A data store that can load the tables in chunks
+          chunk_size: The (maximum) number of rows per chunk
+          reference_tables: The tables that are used in reference lookups and fit in memory
+          memmap_dir: A directory in which the component arrays are stored as memory-mapped files, e.g. if the
+        resulting arrays don't fit in memory either; by default, the arrays are kept in memory
+          columnar_extra_info: Return the extra info as an ExtraInfoTable, instead of a dictionary per object. This
+        requires much less memory for large networks.
+
+        Returns:
+          a power-grid-model input dataset, i.e. a dictionary as {component: np.ndarray}, and the extra info
+
+        """
+        extra_info: ExtraInfoContainer = ExtraInfoTable() if columnar_extra_info else {}
+        reference_tables = list(reference_tables or [])
+        available_tables = set(source.table_names())
+        required_columns = self._mapping.required_columns()
+
+        # Check the headers of all tables, before anything is converted
+        missing_columns = self._mapping.missing_columns(
+            {table: source.table_columns(table) for table in required_columns if table in available_tables}
+        )
+        if missing_columns:
+            missing_str = "; ".join(
+                f"'{table}': " + ", ".join(f"'{col_def}'" for col_def in col_defs)
+                for table, col_defs in missing_columns.items()
+            )
+            raise KeyError(f"Missing columns: {missing_str}")
+
+        # Only the columns that are used in the mapping are loaded
+        projections = {
+            table: TabularConverter._get_column_projection(source, table, required_columns.get(table))
+            for table in set(reference_tables).union(available_tables.intersection(self._mapping.tables()))
+        }
+        with self._stage("store_load", store=type(source).__name__):
+            references = {table: source.load_table(table, columns=projections[table]) for table in reference_tables}
+
+        arrays: Dict[str, GrowableArray] = {}
+        self._reference_index = {}
+        with self._stage("parse", data_type="input"):
+            for table in self._mapping.tables():
+                if table not in available_tables:
+                    continue
+                for chunk in source.load_chunks(table_name=table, chunk_size=chunk_size, columns=projections[table]):
+                    if len(chunk) == 0:
+                        continue
+
+                    # The reference index of the (streamed) table is only valid for the current chunk
+                    self._reference_index = {
+                        key: index
+                        for key, index in self._reference_index.items()
+                        if key[0] in references and key[0] != table
+                    }
+                    data = TabularData(**{**references, table: TabularConverter._reset_chunk_index(chunk)})
+                    self._prepare_data(data)
+
+                    for component, attributes in self._mapping.instances(table=table):
+                        with self._stage("table", table=table, component=component, rows=len(chunk)):
+                            component_data = self._convert_table_to_component(
+                                data=data,
+                                data_type="input",
+                                table=table,
+                                component=component,
+                                attributes=attributes,
+                                extra_info=extra_info,
+                            )
+                        if component_data is not None:
+                            if component not in arrays:
+                                file_path = None if memmap_dir is None else memmap_dir / f"{component}.bin"
+                                arrays[component] = GrowableArray(
+                                    dtype=component_data.dtype, capacity=chunk_size, file_path=file_path
+                                )
+                            arrays[component].append(component_data)
+
+        input_data = {component: array.to_array() for component, array in arrays.items()}
+        self._log.debug(
+            "Converted tabular data to power grid model data in chunks",
+            n_components=len(input_data),
+            n_instances=sum(len(table) for table in input_data.values()),
+        )
+        return input_data, extra_info
+
+    # pylint: disable = too-many-arguments
+    def load_batch_update_data(
+        self,
+        data: TabularData,
+        component: str,
+        id_reference: Mapping[str, Any],
+        profiles: Mapping[str, Any],
+        table: Optional[str] = None,
+        time_column: Optional[str] = None,
+        sparse: bool = False,
+    ) -> BatchDataset:
+        """Convert time series profiles (e.g. load or generation profiles) to a batch update dataset for one component,
+        in a single vectorized pass. Two layouts are supported:
+
+        * wide: one table per attribute, with one row per object and one column per time step. All columns, other
+          than the key columns, are time steps (in order). E.g. profiles={"p_specified": "P", "q_specified": "Q"}
+        * long: a single table, with one row per (object, time step), a time column and a column per attribute. The
+          time steps are sorted. E.g. table="Profiles", time_column="Time", profiles={"p_specified": "P"}, where each
+          profile can be any column definition, like in the mapping file.
+
+        The objects are identified by the same auto_id (table, key and optional name) as in the input data, so the
+        input data should be converted first, using the same converter (or the same auto ids; see load_auto_ids()).
+
+        Args:
+          data: The profile table(s)
+          component: The component to update, e.g. "sym_load"
+          id_reference: The auto_id definition of the objects, using the key columns of the profile table(s), e.g.
+        {"table": "Loads", "key": {"Node_Number": "Node", "Subnumber": "Sub"}}
+          profiles: For each attribute, the table (wide) or the column definition (long) of the profile
+          table: The name of the table in long format, or None for wide tables
+          time_column: The name of the time column (long format only)
+          sparse: Create a sparse batch array (indptr/data), instead of a dense (n_steps, n_objects) array. Objects
+        without any value for a time step (e.g. missing rows, or NaN) are not updated in that time step.
+
+        Returns:
+          A batch update dataset, i.e. {component: <2d-array>} or {component: {"indptr": ..., "data": ...}}
+
+        """
+        self._prepare_data(data)
+        if "table" not in id_reference or "key" not in id_reference:
+            raise ValueError(f"Invalid id reference: {id_reference}; both 'table' and 'key' should be supplied")
+        key_col_def = id_reference["key"]
+        if isinstance(key_col_def, dict):
+            key_names, key_columns = list(key_col_def.keys()), list(key_col_def.values())
+        elif isinstance(key_col_def, list):
+            key_names, key_columns = key_col_def, key_col_def
+        else:
+            key_names, key_columns = [key_col_def], [key_col_def]
+
+        def object_ids(profile_table: str) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+            """
+            The codes of the unique objects (for each row), the pgm ids of the unique objects and the names of the key
+            columns (e.g. the first existing column of "Node | NodeNr")
+            """
+            keys = self._parse_col_def(data=data, table=profile_table, col_def=key_columns, extra_info=None)
+            key_column_names = [col[0] if isinstance(col, tuple) else col for col in keys.columns]
+            codes, uniques = pd.MultiIndex.from_frame(keys).factorize()
+            pgm_ids = [
+                self.get_id(
+                    table=id_reference["table"], key=dict(zip(key_names, values)), name=id_reference.get("name")
+                )
+                for values in uniques
+            ]
+            return codes, np.array(pgm_ids, dtype=np.int64), key_column_names
+
+        with self._stage("batch_update", component=component, layout="wide" if table is None else "long"):
+            if table is None:
+                batch, mask = self._wide_profiles_to_batch(data, component, profiles, object_ids)
+                if sparse:
+                    return {component: TabularConverter._dense_to_sparse_batch(batch=batch, mask=mask)}
+                return {component: batch}
+            if time_column is None:
+                raise ValueError("A time column is required for profiles in long format")
+            obj_codes, pgm_ids, _ = object_ids(table)
+            time_codes, _ = pd.factorize(data.get_column(table_name=table, column_name=time_column), sort=True)
+            values = {
+                attr: self._parse_col_def(data=data, table=table, col_def=col_def, extra_info=None).iloc[:, 0]
+                for attr, col_def in profiles.items()
+            }
+            return {
+                component: TabularConverter._long_profiles_to_batch(
+                    component=component,
+                    time_codes=time_codes,
+                    obj_codes=obj_codes,
+                    pgm_ids=pgm_ids,
+                    values=values,
+                    sparse=sparse,
+                )
+            }
+
+    @staticmethod
+    def _wide_profiles_to_batch(
+        data: TabularData,
+        component: str,
+        profiles: Mapping[str, Any],
+        object_ids: Callable[[str], Tuple[np.ndarray, np.ndarray, List[str]]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Create a dense batch update array of profile tables in wide format, i.e. one row per object and one column
+        per time step. The mask indicates which (time step, object) combinations contain at least one value. The time
+        step columns are read like any other column, i.e. with unit conversions and value substitutions applied.
+        """
+        batch: Optional[np.ndarray] = None
+        mask: Optional[np.ndarray] = None
+        pgm_ids: Optional[np.ndarray] = None
+        for attr, profile_table in profiles.items():
+            obj_codes, obj_ids, key_column_names = object_ids(profile_table)
+            if len(obj_ids) != len(obj_codes):
+                raise ValueError(f"Duplicate objects in profile table '{profile_table}'")
+            table_data = data[profile_table]
+            column_names = table_data.dtype.names if isinstance(table_data, np.ndarray) else table_data.columns
+            time_columns = [
+                col_name
+                for col_name in dict.fromkeys(col[0] if isinstance(col, tuple) else col for col in column_names)
+                if col_name not in key_column_names
+            ]
+            values = np.array(
+                [
+                    data.get_column(table_name=profile_table, column_name=col_name).to_numpy()
+                    for col_name in time_columns
+                ]
+            ).reshape(len(time_columns), len(obj_codes))
+            if batch is None or mask is None or pgm_ids is None:
+                pgm_ids = obj_ids[obj_codes]
+                batch = initialize_array(data_type="update", component_type=component, shape=values.shape)
+                batch["id"] = pgm_ids
+                mask = np.zeros(values.shape, dtype=bool)
+            indexer = pd.Index(obj_ids[obj_codes]).get_indexer(pgm_ids)
+            if values.shape != batch.shape or (indexer < 0).any():
+                raise ValueError(f"The profile tables of {component} should contain the same objects and time steps")
+            batch[attr] = values[:, indexer]
+            mask |= ~pd.isna(values[:, indexer])
+        if batch is None or mask is None:
+            raise ValueError(f"No profiles supplied for {component}")
+        return batch, mask
+
+    @staticmethod
+    def _long_profiles_to_batch(
+        component: str,
+        time_codes: np.ndarray,
+        obj_codes: np.ndarray,
+        pgm_ids: np.ndarray,
+        values: Mapping[str, pd.Series],
+        sparse: bool,
+    ) -> BatchArray:
+        """
+        Create a dense or sparse batch update array of a profile table in long format, i.e. one row per (time step,
+        object) combination. In a sparse batch, rows without any profile value (i.e. only NaN values) are skipped.
+        """
+        if (time_codes < 0).any():
+            raise ValueError(f"Missing time values in the profiles of {component}")
+        n_steps = time_codes.max() + 1 if len(time_codes) else 0
+        positions = time_codes.astype(np.int64) * len(pgm_ids) + obj_codes
+        if len(np.unique(positions)) != len(positions):
+            raise ValueError(f"Duplicate time steps for the same object in the profiles of {component}")
+
+        if sparse:
+            present = np.zeros(len(positions), dtype=bool)
+            for attr_values in values.values():
+                present |= ~pd.isna(attr_values.to_numpy())
+            rows = np.flatnonzero(present)
+            order = rows[np.argsort(positions[rows], kind="stable")]
+            batch = initialize_array(data_type="update", component_type=component, shape=len(order))
+            batch["id"] = pgm_ids[obj_codes[order]]
+            for attr, attr_values in values.items():
+                batch[attr] = attr_values.to_numpy()[order]
+            counts = np.bincount(time_codes[rows], minlength=n_steps)
+            indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+            return {"indptr": indptr, "data": batch}
+
+        batch = initialize_array(data_type="update", component_type=component, shape=(n_steps, len(pgm_ids)))
+        batch["id"] = pgm_ids
+        for attr, attr_values in values.items():
+            batch[attr][time_codes, obj_codes] = attr_values.to_numpy()
+        return batch
+
+    @staticmethod
+    def _dense_to_sparse_batch(batch: np.ndarray, mask: np.ndarray) -> SparseBatchArray:
+        """
+        Convert a dense batch array to a sparse batch array, containing only the masked objects of each time step
+        """
+        indptr = np.concatenate(([0], np.cumsum(mask.sum(axis=1)))).astype(np.int64)
+        return {"indptr": indptr, "data": batch[mask]}
+
+    def required_columns(self) -> Dict[str, Set[str]]:
+        """
+        The names of all source columns that are used by the mapping, for each table; see
+        TabularMapping.column_dependencies() for details.
+
+        Returns:
+            For each table, the set of column names
+        """
+        return self._mapping.required_columns()
+
+    def missing_columns(self, columns: Mapping[str, Collection[str]]) -> Dict[str, List[str]]:
+        """
+        Check which columns that are used by the mapping don't exist, e.g. based on the header of each table, before
+        loading the (entire) data.
+
+        Args:
+            columns: The column names of each available table
+
+        Returns:
+            For each table with missing columns, the missing column definitions (e.g. "Unom | U_nom")
+        """
+        return self._mapping.missing_columns(columns)
+
+    @staticmethod
+    def _get_column_projection(
+        source: ChunkedDataStore, table: str, required_columns: Optional[Set[str]]
+    ) -> Optional[List[str]]:
+        """
+        The columns of a table that should be loaded, i.e. the required columns, except for the (virtual) index
+        column. If no other columns are required, e.g. if the mapping only uses the index and constants, a single
+        column is loaded, so that the number of rows is still known.
+
+        Returns:
+            The column names, or None if all columns should be loaded
+        """
+        columns = sorted((required_columns or set()) - {"index"})
+        if columns:
+            return columns
+        return source.table_columns(table)[:1] or None
+
+    @staticmethod
+    def _reset_chunk_index(chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        The index of a chunk contains the row numbers within the entire table. The column definitions are evaluated
+        using a zero based index, so the row numbers are moved to an 'index' column (unless the table already contains
+        a column called 'index').
+        """
+        if "index" not in chunk:
+            chunk = chunk.assign(index=chunk.index.to_numpy())
+        return chunk.reset_index(drop=True)
+
+    def _prepare_data(self, data: TabularData) -> None:
+        """
+        Apply units and substitutions to the data. Note that the conversions are 'lazy', i.e. the units and
+        substitutions will be applied the first time .get_column(table, field) is called.
+        """
+        if self._units is not None:
+            data.set_unit_multipliers(self._units)
+        if self._substitutions is not None:
+            data.set_substitutions(self._substitutions)
+        data.set_instrumentation(self._instrumentation)
+
     # pylint: disable = too-many-arguments
     def _convert_table_to_component(
         self,
@@ -140,7 +519,7 @@ class TabularConverter(BaseConverter[TabularData]):
         table: str,
         component: str,
         attributes: InstanceAttributes,
-        extra_info: Optional[ExtraInfoLookup],
+        extra_info: Optional[ExtraInfoContainer],
     ) -> Optional[np.ndarray]:
         """
         This function converts a single table/sheet of TabularData to a power-grid-model input/update array. One table
@@ -160,7 +539,7 @@ class TabularConverter(BaseConverter[TabularData]):
           table: str:
           component: str:
           attributes: InstanceAttributes:
-          extra_info: Optional[ExtraInfoLookup]:
+          extra_info: Optional[ExtraInfoContainer]:
 
         Returns:
           returns a power-grid-model structured array for one component
@@ -172,29 +551,63 @@ class TabularConverter(BaseConverter[TabularData]):
         n_records = len(data[table])
 
         try:
-            pgm_data = initialize_array(data_type=data_type, component_type=component, shape=n_records)
+            dtype = power_grid_meta_data[data_type][component]["dtype"]
         except KeyError as ex:
             raise KeyError(f"Invalid component type '{component}' or data type '{data_type}'") from ex
 
         if "id" not in attributes:
             raise KeyError(f"No mapping for the attribute 'id' for '{component}s'!")
 
+        # If the table already is a power-grid-model array, which is mapped as it is, the table itself is used
+        if self._is_identity_mapping(table=table, table_data=data[table], dtype=dtype, attributes=attributes):
+            self._log.debug("Used table as it is", table=table, component=component, n_records=n_records)
+            return data[table]
+
+        pgm_data = initialize_array(data_type=data_type, component_type=component, shape=n_records)
+
         # Make sure that the "id" column is always parsed first (at least before "extra" is parsed)
         sorted_attributes = sorted(attributes.items(), key=lambda x: "" if x[0] == "id" else x[0])
 
         for attr, col_def in sorted_attributes:
-            self._convert_col_def_to_attribute(
-                data=data,
-                pgm_data=pgm_data,
-                table=table,
-                component=component,
-                attr=attr,
-                col_def=col_def,
-                extra_info=extra_info,
-            )
+            with self._profile_stage("attribute", attribute=attr, rows=n_records):
+                self._convert_col_def_to_attribute(
+                    data=data,
+                    pgm_data=pgm_data,
+                    table=table,
+                    component=component,
+                    attr=attr,
+                    col_def=col_def,
+                    extra_info=extra_info,
+                )
 
         return pgm_data
 
+    def _is_identity_mapping(
+        self, table: str, table_data: Union[pd.DataFrame, np.ndarray], dtype: np.dtype, attributes: InstanceAttributes
+    ) -> bool:
+        """
+        Check if a table is a NumPy structured array with exactly the same dtype as the power-grid-model component and
+        each attribute is mapped to the column with the same name, without any substitutions or multipliers.
+        """
+        if not isinstance(table_data, np.ndarray) or table_data.dtype != dtype or dtype.names is None:
+            return False
+        if attributes != {name: name for name in dtype.names}:
+            return False
+        for column in dtype.names:
+            try:
+                if self._substitutions is not None:
+                    self._substitutions.get_substitutions(attr=column, table=table)
+                    return False
+            except KeyError:
+                pass
+            try:
+                if self._multipliers is not None:
+                    self._multipliers.get_multiplier(attr=column, table=table)
+                    return False
+            except KeyError:
+                pass
+        return True
+
     # pylint: disable = too-many-arguments
     def _convert_col_def_to_attribute(
         self,
@@ -204,7 +617,7 @@ class TabularConverter(BaseConverter[TabularData]):
         component: str,
         attr: str,
         col_def: Any,
-        extra_info: Optional[ExtraInfoLookup],
+        extra_info: Optional[ExtraInfoContainer],
     ):
         """This function updates one of the attributes of pgm_data, based on the corresponding table/column in a tabular
         dataset
@@ -225,7 +638,7 @@ class TabularConverter(BaseConverter[TabularData]):
           component: str:
           attr: str:
           col_def: Any:
-          extra_info: Optional[ExtraInfoLookup]:
+          extra_info: Optional[ExtraInfoContainer]:
 
         Returns:
           the function updates pgm_data, it should not return something
@@ -240,12 +653,25 @@ class TabularConverter(BaseConverter[TabularData]):
         if attr == "extra":
             # Extra info must be linked to the object IDs, therefore the uuids should be known before extra info can
             # be parsed. Before this for loop, it is checked that "id" exists and it is placed at the front.
-            self._handle_extra_info(
-                data=data, table=table, col_def=col_def, uuids=pgm_data["id"], extra_info=extra_info
-            )
+            with self._stage("extra_info", table=table, component=component):
+                self._handle_extra_info(
+                    data=data, table=table, col_def=col_def, uuids=pgm_data["id"], extra_info=extra_info
+                )
             # Extra info should not be added to the numpy arrays, so let's continue to the next attribute
             return
 
+        # Constants are broadcast straight into the pgm data, without creating a column first
+        if isinstance(col_def, (int, float)):
+            with self._profile_stage("col_def", node=str(col_def), rows=len(pgm_data)):
+                pgm_data[attr] = col_def
+            return
+
+        # Single columns are copied straight into the pgm data, without creating an intermediate DataFrame
+        arrays = self._parse_col_def_arrays(data=data, table=table, col_def=col_def)
+        if arrays is not None and len(arrays) == 1:
+            pgm_data[attr] = arrays[0][1]
+            return
+
         attr_data = self._parse_col_def(data=data, table=table, col_def=col_def, extra_info=extra_info)
 
         if len(attr_data.columns) != 1:
@@ -259,7 +685,7 @@ class TabularConverter(BaseConverter[TabularData]):
         table: str,
         col_def: Any,
         uuids: np.ndarray,
-        extra_info: Optional[ExtraInfoLookup],
+        extra_info: Optional[ExtraInfoContainer],
     ) -> None:
         """This function can extract extra info from the tabular data and store it in the extra_info dict
 
@@ -275,7 +701,7 @@ class TabularConverter(BaseConverter[TabularData]):
           table: str:
           col_def: Any:
           uuids: np.ndarray:
-          extra_info: Optional[ExtraInfoLookup]:
+          extra_info: Optional[ExtraInfoContainer]:
 
         Returns:
 
@@ -283,18 +709,36 @@ class TabularConverter(BaseConverter[TabularData]):
         if extra_info is None:
             return
 
-        extra = self._parse_col_def(data=data, table=table, col_def=col_def, extra_info=None).to_dict(orient="records")
-        for i, xtr in zip(uuids, extra):
+        arrays = self._parse_col_def_arrays(data=data, table=table, col_def=col_def)
+        if arrays is not None:
+            columns = dict(arrays)
+        else:
+            extra = self._parse_col_def(data=data, table=table, col_def=col_def, extra_info=None)
+            columns = {
+                col[0] if isinstance(col, tuple) else col: extra.iloc[:, i].to_numpy()
+                for i, col in enumerate(extra.columns)
+            }
+
+        # The extra info is stored column-wise; missing values (None or NaN) are skipped
+        if isinstance(extra_info, ExtraInfoTable):
+            extra_info.add(ids=uuids, columns=columns)
+            return
+
+        # The legacy dictionary form only skips NaN values; None values are kept
+        names = list(columns)
+        value_lists = [
+            [value.item() if isinstance(value, np.generic) else value for value in np.asarray(column).tolist()]
+            for column in columns.values()
+        ]
+        for pgm_id, values in zip(uuids.tolist(), zip(*value_lists)):
             xtr = {
-                k[0] if isinstance(k, tuple) else k: v
-                for k, v in xtr.items()
-                if not isinstance(v, float) or not np.isnan(v)
+                name: value for name, value in zip(names, values) if not isinstance(value, float) or not np.isnan(value)
             }
             if xtr:
-                if i in extra_info:
-                    extra_info[i].update(xtr)
+                if pgm_id in extra_info:
+                    extra_info[pgm_id].update(xtr)
                 else:
-                    extra_info[i] = xtr
+                    extra_info[pgm_id] = xtr
 
     @staticmethod
     def _merge_pgm_data(data: Dict[str, List[np.ndarray]]) -> Dict[str, np.ndarray]:
@@ -323,15 +767,112 @@ class TabularConverter(BaseConverter[TabularData]):
 
         return merged
 
-    def _serialize_data(self, data: Dataset, extra_info: Optional[ExtraInfoLookup]) -> TabularData:
+    def _serialize_data(self, data: Dataset, extra_info: Optional[ExtraInfoContainer]) -> TabularData:
         if extra_info is not None:
             raise NotImplementedError("Extra info can not (yet) be stored for tabular data")
+        if TabularConverter._is_batch(data):
+            return self.convert_batch(data=data)
+        return TabularData(**cast(SingleDataset, data))
+
+    def convert_batch(
+        self,
+        data: Union[Dataset, BatchList],
+        columns: Optional[Mapping[str, Collection[str]]] = None,
+        scenarios: Optional[slice] = None,
+        scenario_index: bool = False,
+    ) -> TabularData:
+        """Convert a (dense, sparse or list) batch dataset, e.g. batch output data, to long format tables: one table per
+        component, with one row per (scenario, object) combination. Only the selected scenarios and columns are copied,
+        so large batches can be exported in parts, e.g. one scenario range per file. Asymmetric attributes are split
+        into one column per phase, e.g. u_a, u_b and u_c.
+
+        Args:
+          data: The batch dataset
+          columns: Only convert these components and attributes (the id is always included); by default, all
+        attributes of all components are converted
+          scenarios: Only convert these scenarios, e.g. slice(0, 96); by default, all scenarios are converted
+          scenario_index: Use a (scenario, id) index, instead of a scenario column
+
+        Returns:
+          The tables, which can be stored in any tabular data store
+
+        """
+        tables: Dict[str, pd.DataFrame] = {}
+        if columns is not None:
+            if isinstance(data, list):
+                data = [
+                    {component: array for component, array in dataset.items() if component in columns}
+                    for dataset in data
+                ]
+            else:
+                data = {component: array for component, array in data.items() if component in columns}
+        for component, (scenario_ids, component_data) in TabularConverter._select_batch(data, scenarios).items():
+            attributes = ["id"] + [
+                attr
+                for attr in (component_data.dtype.names or [])
+                if attr != "id" and (columns is None or attr in columns[component])
+            ]
+            table: Dict[str, np.ndarray] = {"scenario": scenario_ids}
+            for attr in attributes:
+                attr_data = component_data[attr]
+                if attr_data.ndim == 1:
+                    table[attr] = attr_data
+                else:
+                    table.update({f"{attr}_{phase}": attr_data[:, i] for i, phase in enumerate("abc")})
+            tables[component] = pd.DataFrame(table)
+            if scenario_index:
+                tables[component].set_index(["scenario", "id"], inplace=True)
+        return TabularData(**tables)
+
+    @staticmethod
+    def _is_batch(data: Union[Dataset, BatchList]) -> bool:
+        """
+        Check if the data is a batch dataset, i.e. a list of datasets, or a dataset containing two-dimensional
+        (dense) arrays or indptr/data dictionaries (sparse)
+        """
+        if isinstance(data, list):
+            return True
+        return any(isinstance(array, dict) or array.ndim == 2 for array in data.values())
+
+    @staticmethod
+    def _select_batch(
+        data: Union[Dataset, BatchList], scenarios: Optional[slice]
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Select the scenarios of a batch dataset and flatten them, for each component
+
+        Returns:
+            For each component, the scenario index of each row and the data
+        """
         if isinstance(data, list):
-            raise NotImplementedError("Batch data can not (yet) be stored for tabular data")
-        return TabularData(**data)
+            scenario_ids = np.arange(len(data))[scenarios or slice(None)]
+            # Components that only appear in scenarios that are not selected are skipped
+            components = {component: None for i in scenario_ids for component in data[i]}
+            return {
+                component: (
+                    np.repeat(scenario_ids, [len(data[i].get(component, [])) for i in scenario_ids]),
+                    np.concatenate([data[i][component] for i in scenario_ids if component in data[i]]),
+                )
+                for component in components
+            }
+
+        result = {}
+        for component, array in data.items():
+            if isinstance(array, dict):
+                indptr = array["indptr"]
+                selected = np.arange(len(indptr) - 1)[scenarios or slice(None)]
+                counts = indptr[selected + 1] - indptr[selected]
+                # The rows of the selected scenarios: start of each scenario + the position within the scenario
+                offsets = np.repeat(indptr[selected] - np.cumsum(counts) + counts, counts)
+                rows = offsets + np.arange(counts.sum())
+                result[component] = (np.repeat(selected, counts), array["data"][rows])
+            else:
+                selected = np.arange(array.shape[0])[scenarios or slice(None)]
+                result[component] = (np.repeat(selected, array.shape[1]), array[selected].reshape(-1))
+        return result
 
     def _parse_col_def(
-        self, data: TabularData, table: str, col_def: Any, extra_info: Optional[ExtraInfoLookup]
+        self, data: TabularData, table: str, col_def: Any, extra_info: Optional[ExtraInfoContainer]
     ) -> pd.DataFrame:
         """Interpret the column definition and extract/convert/create the data as a pandas DataFrame.
 
@@ -339,21 +880,65 @@ class TabularConverter(BaseConverter[TabularData]):
           data: TabularData:
           table: str:
           col_def: Any:
-          extra_info: Optional[ExtraInfoLookup]:
+          extra_info: Optional[ExtraInfoContainer]:
 
         Returns:
 
         """
         if isinstance(col_def, (int, float)):
-            return self._parse_col_def_const(data=data, table=table, col_def=col_def)
+            with self._profile_stage("col_def", node=str(col_def), rows=len(data[table])):
+                return self._parse_col_def_const(data=data, table=table, col_def=col_def)
         if isinstance(col_def, str):
-            return self._parse_col_def_column_name(data=data, table=table, col_def=col_def)
+            with self._profile_stage("col_def", node=col_def, rows=len(data[table])):
+                return self._parse_col_def_column_name(data=data, table=table, col_def=col_def)
         if isinstance(col_def, dict):
             return self._parse_col_def_filter(data=data, table=table, col_def=col_def, extra_info=extra_info)
         if isinstance(col_def, list):
             return self._parse_col_def_composite(data=data, table=table, col_def=col_def)
         raise TypeError(f"Invalid column definition: {col_def}")
 
+    def _parse_col_def_arrays(
+        self, data: TabularData, table: str, col_def: Any
+    ) -> Optional[List[Tuple[str, np.ndarray]]]:
+        """Extract the columns of a column definition as NumPy arrays, without creating intermediate DataFrames. This
+        is only possible if the column definition consists of (a list of) column names that exist in the table. For
+        NumPy structured arrays, pandas isn't used at all; for DataFrames, the underlying array of each column is used.
+
+        Args:
+          data: TabularData:
+          table: str:
+          col_def: Any:
+
+        Returns:
+          A list of (column name, column data) tuples, or None if the column definition should be parsed as a pandas
+          DataFrame
+
+        """
+        table_data = data[table]
+        if isinstance(table_data, np.ndarray):
+            if table_data.dtype.names is None:
+                return None
+            available = set(table_data.dtype.names)
+        else:
+            # The 'index' refers to the row numbers, unless the DataFrame contains a column called 'index'
+            available = {"index"}.union(table_data.columns.get_level_values(0))
+
+        col_defs = [col_def] if isinstance(col_def, str) else col_def
+        if not isinstance(col_defs, list) or not all(isinstance(sub_def, str) for sub_def in col_defs):
+            return None
+
+        arrays = []
+        for sub_def in col_defs:
+            # If multiple columns are given in col_def, use the first column that exists in the dataset
+            columns = [col_name.strip() for col_name in sub_def.split("|")]
+            col_name = next((col_name for col_name in columns if col_name in available), None)
+            if col_name is None:
+                return None
+            with self._profile_stage("col_def", node=sub_def, rows=len(table_data)):
+                col_data = data.get_column_array(table_name=table, column_name=col_name)
+                arrays.append((col_name, self._apply_multiplier(table=table, column=col_name, data=col_data)))
+        return arrays
+
     @staticmethod
     def _parse_col_def_const(data: TabularData, table: str, col_def: Union[int, float]) -> pd.DataFrame:
         """Create a single column pandas DataFrame containing the const value.
@@ -368,7 +953,7 @@ class TabularConverter(BaseConverter[TabularData]):
 
         """
         assert isinstance(col_def, (int, float))
-        return pd.DataFrame([col_def] * len(data[table]))
+        return pd.DataFrame(np.full(len(data[table]), col_def))
 
     def _parse_col_def_column_name(self, data: TabularData, table: str, col_def: str) -> pd.DataFrame:
         """Extract a column from the data. If the column doesn't exist, check if the col_def is a special float value,
@@ -384,11 +969,12 @@ class TabularConverter(BaseConverter[TabularData]):
         """
         assert isinstance(col_def, str)
         table_data = data[table]
+        available = (table_data.dtype.names or ()) if isinstance(table_data, np.ndarray) else table_data
 
         # If multiple columns are given in col_def, return the first column that exists in the dataset
         columns = [col_name.strip() for col_name in col_def.split("|")]
         for col_name in columns:
-            if col_name in table_data or col_name == "index":
+            if col_name in available or col_name == "index":
                 col_data = data.get_column(table_name=table, column_name=col_name)
                 col_data = self._apply_multiplier(table=table, column=col_name, data=col_data)
                 return pd.DataFrame(col_data)
@@ -402,7 +988,9 @@ class TabularConverter(BaseConverter[TabularData]):
 
         return self._parse_col_def_const(data=data, table=table, col_def=const_value)
 
-    def _apply_multiplier(self, table: str, column: str, data: pd.Series) -> pd.Series:
+    def _apply_multiplier(
+        self, table: str, column: str, data: Union[pd.Series, np.ndarray]
+    ) -> Union[pd.Series, np.ndarray]:
         if self._multipliers is None:
             return data
         try:
@@ -413,36 +1001,80 @@ class TabularConverter(BaseConverter[TabularData]):
             return data
 
     def _parse_reference(
-        self, data: TabularData, table: str, other_table: str, query_column: str, key_column: str, value_column: str
+        self,
+        data: TabularData,
+        table: str,
+        other_table: str,
+        query_column: Union[str, List[str]],
+        key_column: Union[str, List[str]],
+        value_column: str,
     ) -> pd.DataFrame:
         """
-        Find and extract a column from a different table.
+        Find and extract a column from a different table. Multi-column keys can be used by supplying a list of query
+        columns and a list of key columns of the same length.
 
         Args:
             data: The data
             table: The current table named
             other_table: The table in which we would like to find a value
-            key_column: The column in the current table that stores the keys
-            query_column: The column in the other table in which we should look for the keys
+            query_column: The column(s) in the current table that stores the keys
+            key_column: The column(s) in the other table in which we should look for the keys
             value_column: The column in the other table which stores the values that we would like to return
 
         Returns:
 
         """
-        queries = self._parse_col_def_column_name(data=data, table=table, col_def=query_column)
-        keys = self._parse_col_def_column_name(data=data, table=other_table, col_def=key_column)
+        query_columns = [query_column] if isinstance(query_column, str) else list(query_column)
+        key_columns = [key_column] if isinstance(key_column, str) else list(key_column)
+        if len(query_columns) != len(key_columns):
+            raise ValueError(
+                f"Invalid reference definition: {len(query_columns)} query columns and {len(key_columns)} key columns"
+            )
+
+        queries = self._get_reference_keys(data=data, table=table, columns=query_columns)
+        keys = self._get_reference_index(data=data, table=other_table, columns=key_columns)
         values = self._parse_col_def_column_name(data=data, table=other_table, col_def=value_column)
-        other = pd.concat([keys, values], axis=1)
-        result = queries.merge(other, how="left", left_on=query_column, right_on=key_column)
-        return result[[value_column]]
+
+        # Missing keys result in missing (NaN) values
+        indexer = keys.get_indexer(queries)
+        result = pd.api.extensions.take(values.iloc[:, 0].to_numpy(), indexer, allow_fill=True)
+        return pd.DataFrame({values.columns[0]: result})
+
+    def _get_reference_index(self, data: TabularData, table: str, columns: List[str]) -> pd.Index:
+        """
+        Get the index of the key column(s) of a table. The index is created only once per conversion, so that
+        multiple references to the same table and key columns share the same lookup table.
+        """
+        cache_key = (table, tuple(columns))
+        if cache_key not in self._reference_index:
+            keys = self._get_reference_keys(data=data, table=table, columns=columns)
+            if not keys.is_unique:
+                duplicates = ", ".join(f"'{key}'" for key in keys[keys.duplicated()].unique())
+                columns_str = " and ".join(f"'{column}'" for column in columns)
+                raise ValueError(
+                    f"Duplicate keys {duplicates} in column{'s' if len(columns) > 1 else ''} {columns_str} "
+                    f"on table '{table}'"
+                )
+            self._reference_index[cache_key] = keys
+        return self._reference_index[cache_key]
+
+    def _get_reference_keys(self, data: TabularData, table: str, columns: List[str]) -> pd.Index:
+        """
+        Get the values of the key (or query) column(s) of a table as an index; a MultiIndex for multiple columns.
+        """
+        key_data = [self._parse_col_def_column_name(data=data, table=table, col_def=column) for column in columns]
+        if len(key_data) == 1:
+            return pd.Index(key_data[0].iloc[:, 0])
+        return pd.MultiIndex.from_arrays([col_data.iloc[:, 0] for col_data in key_data])
 
     def _parse_col_def_filter(
-        self, data: TabularData, table: str, col_def: Dict[str, Any], extra_info: Optional[ExtraInfoLookup]
+        self, data: TabularData, table: str, col_def: Dict[str, Any], extra_info: Optional[ExtraInfoContainer]
     ) -> pd.DataFrame:
         """
         Parse column filters like 'auto_id', 'reference', 'function', etc
         """
         assert isinstance(col_def, dict)
+        n_rows = len(data[table])
         data_frames = []
         for name, sub_def in col_def.items():
             if name == "auto_id":
@@ -453,14 +1085,15 @@ class TabularConverter(BaseConverter[TabularData]):
                     or len(set(sub_def.keys()) & {"table", "name"}) > 2
                 ):
                     raise ValueError(f"Invalid {name} definition: {sub_def}")
-                col_data = self._parse_auto_id(
-                    data=data,
-                    table=table,
-                    ref_table=sub_def.get("table"),
-                    ref_name=sub_def.get("name"),
-                    key_col_def=sub_def["key"],
-                    extra_info=extra_info,
-                )
+                with self._stage("auto_id", table=table, ref_table=sub_def.get("table") or table, rows=n_rows):
+                    col_data = self._parse_auto_id(
+                        data=data,
+                        table=table,
+                        ref_table=sub_def.get("table"),
+                        ref_name=sub_def.get("name"),
+                        key_col_def=sub_def["key"],
+                        extra_info=extra_info,
+                    )
             elif name == "reference":
                 # Check that (only) the required keys are in the definition
                 if not isinstance(sub_def, dict) or {
@@ -470,18 +1103,26 @@ class TabularConverter(BaseConverter[TabularData]):
                     "value_column",
                 } != set(sub_def.keys()):
                     raise ValueError(f"Invalid {name} definition: {sub_def}")
-                return self._parse_reference(
-                    data=data,
-                    table=table,
-                    other_table=sub_def["other_table"],
-                    query_column=sub_def["query_column"],
-                    key_column=sub_def["key_column"],
-                    value_column=sub_def["value_column"],
-                )
+                with self._profile_stage("col_def", node=name, rows=n_rows):
+                    return self._parse_reference(
+                        data=data,
+                        table=table,
+                        other_table=sub_def["other_table"],
+                        query_column=sub_def["query_column"],
+                        key_column=sub_def["key_column"],
+                        value_column=sub_def["value_column"],
+                    )
+            elif name == "expr":
+                if not isinstance(sub_def, str):
+                    raise ValueError(f"Invalid {name} definition: {sub_def}")
+                with self._profile_stage("col_def", node=name, rows=n_rows):
+                    col_data = self._parse_expression(data=data, table=table, expression=sub_def)
             elif isinstance(sub_def, list):
-                col_data = self._parse_pandas_function(data=data, table=table, function=name, col_def=sub_def)
+                with self._profile_stage("col_def", node=name, rows=n_rows):
+                    col_data = self._parse_pandas_function(data=data, table=table, function=name, col_def=sub_def)
             elif isinstance(sub_def, dict):
-                col_data = self._parse_function(data=data, table=table, function=name, col_def=sub_def)
+                with self._profile_stage("col_def", node=name, rows=n_rows):
+                    col_data = self._parse_function(data=data, table=table, function=name, col_def=sub_def)
             else:
                 raise TypeError(f"Invalid {name} definition: {sub_def}")
             data_frames.append(col_data)
@@ -494,7 +1135,7 @@ class TabularConverter(BaseConverter[TabularData]):
         ref_table: Optional[str],
         ref_name: Optional[str],
         key_col_def: Union[str, List[str], Dict[str, str]],
-        extra_info: Optional[ExtraInfoLookup],
+        extra_info: Optional[ExtraInfoContainer],
     ) -> pd.DataFrame:
         """
         Create (or retrieve) a unique numerical id for each object (row) in `data[table]`, based on the `name`
@@ -527,7 +1168,8 @@ class TabularConverter(BaseConverter[TabularData]):
         else:
             raise TypeError(f"Invalid key definition type '{type(key_col_def).__name__}': {key_col_def}")
 
-        col_data = self._parse_col_def(data=data, table=table, col_def=key_col_def, extra_info=None)
+        with self._profile_stage("col_def", node="key", rows=len(data[table])):
+            col_data = self._parse_col_def(data=data, table=table, col_def=key_col_def, extra_info=None)
 
         def auto_id(row: np.ndarray):
             key = dict(zip(key_names, row))
@@ -540,7 +1182,7 @@ class TabularConverter(BaseConverter[TabularData]):
             #    (a counter example is an auto id referring to the nodes table, while the current table is lines)
             # 3. There shouldn't be any extra info for the current pgm_id, because the id attribute is supposed to be
             #    the first argument to be parsed.
-            if extra_info is not None and ref_table_str == table and pgm_id not in extra_info:
+            if isinstance(extra_info, dict) and ref_table_str == table and pgm_id not in extra_info:
                 if ref_name is not None:
                     extra_info[pgm_id] = {"id_reference": {"table": ref_table_str, "name": ref_name, "key": key}}
                 else:
@@ -548,7 +1190,52 @@ class TabularConverter(BaseConverter[TabularData]):
 
             return pgm_id
 
-        return col_data.apply(auto_id, axis=1, raw=True)
+        pgm_ids = col_data.apply(auto_id, axis=1, raw=True)
+
+        # An ExtraInfoTable is filled column-wise, after all ids are known
+        if isinstance(extra_info, ExtraInfoTable) and ref_table_str == table:
+            self._add_id_references(
+                extra_info=extra_info,
+                pgm_ids=pgm_ids.to_numpy(),
+                ref_table=ref_table_str,
+                ref_name=ref_name,
+                keys={name: col_data.iloc[:, i].to_numpy() for i, name in enumerate(key_names)},
+            )
+
+        return pgm_ids
+
+    @staticmethod
+    def _add_id_references(
+        extra_info: ExtraInfoTable,
+        pgm_ids: np.ndarray,
+        ref_table: str,
+        ref_name: Optional[str],
+        keys: Dict[str, np.ndarray],
+    ) -> None:
+        """
+        Store the id references of auto ids in an ExtraInfoTable. Just like for extra info dictionaries, only the
+        first reference of each id is stored, and only if there is no extra info for that id yet.
+
+        Args:
+            extra_info: The extra info table
+            pgm_ids: The generated ids
+            ref_table: The table name to which the ids refer
+            ref_name: A custom textual identifier of the auto ids, or None
+            keys: The key columns that were used to generate the ids
+        """
+        _, first = np.unique(pgm_ids, return_index=True)
+        first = first[~np.isin(pgm_ids[first], extra_info.ids)]
+        first.sort()
+        extra_info.add(
+            ids=pgm_ids[first],
+            columns={
+                "id_reference": {
+                    "table": ref_table,
+                    "name": ref_name,
+                    "key": {name: values[first] for name, values in keys.items()},
+                }
+            },
+        )
 
     def _parse_pandas_function(self, data: TabularData, table: str, function: str, col_def: List[Any]) -> pd.DataFrame:
         """Special vectorized functions.
@@ -616,6 +1303,28 @@ class TabularConverter(BaseConverter[TabularData]):
         col_data = col_data.apply(lambda row, fn=fn_ptr: fn(**dict(zip(key_words, row))), axis=1, raw=True)
         return pd.DataFrame(col_data)
 
+    def _parse_expression(self, data: TabularData, table: str, expression: str) -> pd.DataFrame:
+        """Evaluate an arithmetic expression on the columns of a table, e.g. "R * Length / Parallel".
+
+        Args:
+          data: The data
+          table: The name of the current table
+          expression: The expression; see utils.expressions.Expression for the supported syntax
+
+        Returns:
+
+        """
+        compiled = compile_expression(expression)
+        arrays = self._parse_col_def_arrays(data=data, table=table, col_def=compiled.columns)
+        if arrays is None:
+            arrays = [
+                (col_name, self._parse_col_def_column_name(data=data, table=table, col_def=col_name).iloc[:, 0])
+                for col_name in compiled.columns
+            ]
+        columns = {col_name: np.asarray(col_data) for col_name, (_, col_data) in zip(compiled.columns, arrays)}
+        result = compiled.evaluate(columns)
+        return pd.DataFrame(np.broadcast_to(result, (len(data[table]),)))
+
     def _parse_col_def_composite(self, data: TabularData, table: str, col_def: list) -> pd.DataFrame:
         """Select multiple columns (each is created from a column definition) and return them as a new DataFrame.
 
@@ -631,6 +1340,26 @@ class TabularConverter(BaseConverter[TabularData]):
         columns = [self._parse_col_def(data=data, table=table, col_def=sub_def, extra_info=None) for sub_def in col_def]
         return pd.concat(columns, axis=1)
 
+    def _profile_stage(self, name: str, **context: Any) -> ContextManager:
+        """
+        Measure a (fine grained) stage of the conversion, only if profiling is enabled; see get_profile()
+        """
+        if not self._profile:
+            return nullcontext()
+        return self._stage(name, **context)
+
+    def get_profile(self) -> MappingProfile:
+        """
+        The time spent on each (table, component, attribute, column definition) of the mapping, accumulated over all
+        conversions since the converter was created, or since the instrumentation was cleared.
+
+        Returns:
+            The mapping profile, which can be reported as text, json or folded stacks (for flame graphs)
+        """
+        if not self._profile or self._instrumentation is None:
+            raise ValueError("Profiling is not enabled, use TabularConverter(profile=True)")
+        return MappingProfile(self._instrumentation.stages)
+
     def _get_id(self, table: str, key: Mapping[str, int], name: Optional[str]) -> int:
         """
         Get a unique numerical ID for the supplied name / key combination
@@ -670,3 +1399,24 @@ class TabularConverter(BaseConverter[TabularData]):
             reference["name"] = name
         reference["key"] = key
         return reference
+
+    def save_auto_ids(self, file_path: Path) -> None:
+        """
+        Store the numerical IDs of all objects (i.e. the name / key combinations) in a compact binary (.npz) file, so
+        that they can be reused when converting a new version of the same data; see load_auto_ids().
+        Args:
+            file_path: The file in which the IDs are stored
+        """
+        save_auto_id_state(auto_id=self._auto_id, file_path=file_path)
+
+    def load_auto_ids(self, file_path: Path) -> None:
+        """
+        Reuse the numerical IDs that were stored using save_auto_ids(). Objects with the same name / key combination
+        get the same ID as before and new objects get new IDs; the IDs of removed objects are not reused. This should
+        be done before any data is converted.
+        Args:
+            file_path: The file in which the IDs are stored
+        """
+        if len(self._auto_id) > 0:
+            raise ValueError("Auto ids can only be loaded before any data is converted")
+        self._auto_id = load_auto_id_state(file_path=file_path)
@@ -1,3 +1,41 @@
 # SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
 #
 # SPDX-License-Identifier: MPL-2.0
+"""
+Data stores
+
+The data stores are imported lazily, e.g. `from power_grid_model_io.data_stores import JsonFileStore` doesn't import
+pandas.
+"""
+from typing import TYPE_CHECKING
+
+from power_grid_model_io.utils.modules import lazy_attributes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from power_grid_model_io.data_stores.base_data_store import BaseDataStore
+    from power_grid_model_io.data_stores.chunked_data_store import ChunkedDataStore
+    from power_grid_model_io.data_stores.csv_dir_store import CsvDirStore
+    from power_grid_model_io.data_stores.excel_file_store import ExcelFileStore
+    from power_grid_model_io.data_stores.json_file_store import JsonFileStore
+    from power_grid_model_io.data_stores.vision_excel_file_store import VisionExcelFileStore
+
+__all__ = [
+    "BaseDataStore",
+    "ChunkedDataStore",
+    "CsvDirStore",
+    "ExcelFileStore",
+    "JsonFileStore",
+    "VisionExcelFileStore",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "BaseDataStore": "power_grid_model_io.data_stores.base_data_store",
+        "ChunkedDataStore": "power_grid_model_io.data_stores.chunked_data_store",
+        "CsvDirStore": "power_grid_model_io.data_stores.csv_dir_store",
+        "ExcelFileStore": "power_grid_model_io.data_stores.excel_file_store",
+        "JsonFileStore": "power_grid_model_io.data_stores.json_file_store",
+        "VisionExcelFileStore": "power_grid_model_io.data_stores.vision_excel_file_store",
+    },
+)
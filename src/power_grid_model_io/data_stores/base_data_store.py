@@ -5,7 +5,9 @@
 Abstract data store class
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from functools import partial
 from typing import Generic, TypeVar
 
 import structlog
@@ -44,3 +46,22 @@ class BaseDataStore(Generic[T], ABC):
         Args:
             data: Tha data to store shoul dbe of type <T>
         """
+
+    async def aload(self) -> T:
+        """
+        Load the data asynchronously. By default, load() is called in a separate thread, so that the event loop isn't
+        blocked while the data is being read; stores that support asynchronous I/O can override this method.
+
+        Returns: Loaded data of type <T>
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.load)
+
+    async def asave(self, data: T) -> None:
+        """
+        Save the data asynchronously. By default, save() is called in a separate thread, so that the event loop isn't
+        blocked while the data is being written; stores that support asynchronous I/O can override this method.
+
+        Args:
+            data: Tha data to store should be of type <T>
+        """
+        await asyncio.get_running_loop().run_in_executor(None, partial(self.save, data=data))
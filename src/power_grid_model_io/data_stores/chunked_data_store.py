@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+Abstract chunked data store class
+"""
+
+from abc import ABC, abstractmethod
+from typing import Collection, Iterator, List, Optional
+
+import pandas as pd
+
+from power_grid_model_io.data_stores.base_data_store import BaseDataStore
+from power_grid_model_io.data_types import TabularData
+
+
+class ChunkedDataStore(BaseDataStore[TabularData], ABC):
+    """
+    Abstract chunked data store class
+
+    A tabular data store that can load each table in chunks of rows, so that tables that don't fit in memory can be
+    converted one chunk at a time; see TabularConverter.load_input_data_in_chunks().
+    """
+
+    @abstractmethod  # pragma: no cover
+    def table_names(self) -> List[str]:
+        """
+        The names of the tables that are available in the data store.
+
+        Returns: The table names
+        """
+
+    @abstractmethod  # pragma: no cover
+    def table_columns(self, table_name: str) -> List[str]:
+        """
+        The names of the columns of a table, preferably without loading the table itself.
+
+        Args:
+            table_name: The name of the table
+
+        Returns: The column names
+        """
+
+    @abstractmethod  # pragma: no cover
+    def load_table(self, table_name: str, columns: Optional[Collection[str]] = None) -> pd.DataFrame:
+        """
+        Load a single table, entirely.
+
+        Args:
+            table_name: The name of the table
+            columns: Load only these columns (if they exist); by default, all columns are loaded
+
+        Returns: The table data
+        """
+
+    @abstractmethod  # pragma: no cover
+    def load_chunks(
+        self, table_name: str, chunk_size: int, columns: Optional[Collection[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Load a single table in chunks of rows. The index of each chunk should contain the row numbers of the rows in
+        the entire table, i.e. the index of the first chunk starts at 0, the index of the second chunk starts at
+        chunk_size, etc.
+
+        Args:
+            table_name: The name of the table
+            chunk_size: The (maximum) number of rows per chunk
+            columns: Load only these columns (if they exist); by default, all columns are loaded
+
+        Returns: An iterator over the chunks
+        """
+
+    def load(self) -> TabularData:
+        """
+        Load all tables, entirely.
+
+        Returns: The data of all tables
+        """
+        return TabularData(**{table_name: self.load_table(table_name) for table_name in self.table_names()})
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+CSV Directory Store
+"""
+
+from pathlib import Path
+from typing import Any, Collection, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from power_grid_model_io.data_stores.chunked_data_store import ChunkedDataStore
+from power_grid_model_io.data_types import TabularData
+
+
+class CsvDirStore(ChunkedDataStore):
+    """
+    CSV Directory Store
+
+    A directory of .csv files, one file per table; the file name (without the suffix) is the table name. The first row
+    of each file is expected to contain the column names. Tables can be loaded in chunks of rows.
+    """
+
+    __slots__ = ("_dir_path", "_csv_kwargs")
+
+    def __init__(self, dir_path: Path, **csv_kwargs: Any):
+        """
+        Args:
+            dir_path: The directory that contains the .csv files
+            **csv_kwargs: Extra key word arguments for pandas.read_csv(), e.g. sep=";"
+        """
+        super().__init__()
+        self._dir_path = dir_path
+        self._csv_kwargs = csv_kwargs
+
+    def table_names(self) -> List[str]:
+        """
+        The names of the tables, i.e. the names of the .csv files in the directory (without the suffix).
+
+        Returns: The table names, in alphabetical order
+        """
+        return sorted(file_path.stem for file_path in self._dir_path.glob("*.csv"))
+
+    def table_columns(self, table_name: str) -> List[str]:
+        """
+        The names of the columns of a table; only the header of the .csv file is read.
+
+        Args:
+            table_name: The name of the table
+
+        Returns: The column names
+        """
+        return list(pd.read_csv(self._table_path(table_name), nrows=0, **self._csv_kwargs).columns)
+
+    def load_table(self, table_name: str, columns: Optional[Collection[str]] = None) -> pd.DataFrame:
+        """
+        Load a single .csv file, entirely.
+
+        Args:
+            table_name: The name of the table
+            columns: Load only these columns (if they exist); by default, all columns are loaded
+
+        Returns: The table data
+        """
+        return pd.read_csv(self._table_path(table_name), **self._read_kwargs(columns))
+
+    def load_chunks(
+        self, table_name: str, chunk_size: int, columns: Optional[Collection[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Load a single .csv file in chunks of rows; only one chunk is read into memory at a time.
+
+        Args:
+            table_name: The name of the table
+            chunk_size: The (maximum) number of rows per chunk
+            columns: Load only these columns (if they exist); by default, all columns are loaded
+
+        Returns: An iterator over the chunks
+        """
+        with pd.read_csv(self._table_path(table_name), chunksize=chunk_size, **self._read_kwargs(columns)) as reader:
+            yield from reader
+
+    def save(self, data: TabularData) -> None:
+        """
+        Store each table as a .csv file in the directory. The directory is created if it doesn't exist. The separator
+        supplied in the constructor (if any) is used. A named index, e.g. a (scenario, id) index of batch data, is
+        stored as regular columns; an unnamed (row number) index is not stored.
+
+        Args:
+            data: The data to store
+        """
+        self._dir_path.mkdir(parents=True, exist_ok=True)
+        for table_name, table_data in data.items():
+            if not isinstance(table_data, pd.DataFrame):
+                table_data = pd.DataFrame(table_data)
+            index = any(name is not None for name in table_data.index.names)
+            table_data.to_csv(self._table_path(table_name), sep=self._csv_kwargs.get("sep", ","), index=index)
+
+    def _table_path(self, table_name: str) -> Path:
+        return self._dir_path / f"{table_name}.csv"
+
+    def _read_kwargs(self, columns: Optional[Collection[str]]) -> Dict[str, Any]:
+        if columns is None:
+            return self._csv_kwargs
+        columns = set(columns)
+        return {**self._csv_kwargs, "usecols": lambda column: column in columns}
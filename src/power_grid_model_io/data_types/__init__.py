@@ -3,7 +3,29 @@
 # SPDX-License-Identifier: MPL-2.0
 """
 Common data types used in the Power Grid Model project
+
+The data types are imported lazily, e.g. `from power_grid_model_io.data_types import StructuredData` doesn't import
+pandas.
 """
+from typing import TYPE_CHECKING
+
+from power_grid_model_io.utils.modules import lazy_attributes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from power_grid_model_io.data_types._data_types import ExtraInfo, ExtraInfoLookup, StructuredData
+    from power_grid_model_io.data_types.extra_info_table import ExtraInfoContainer, ExtraInfoTable
+    from power_grid_model_io.data_types.tabular_data import TabularData
+
+__all__ = ["ExtraInfo", "ExtraInfoContainer", "ExtraInfoLookup", "ExtraInfoTable", "StructuredData", "TabularData"]
 
-from power_grid_model_io.data_types._data_types import ExtraInfo, ExtraInfoLookup, StructuredData
-from power_grid_model_io.data_types.tabular_data import TabularData
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ExtraInfo": "power_grid_model_io.data_types._data_types",
+        "ExtraInfoContainer": "power_grid_model_io.data_types.extra_info_table",
+        "ExtraInfoLookup": "power_grid_model_io.data_types._data_types",
+        "ExtraInfoTable": "power_grid_model_io.data_types.extra_info_table",
+        "StructuredData": "power_grid_model_io.data_types._data_types",
+        "TabularData": "power_grid_model_io.data_types.tabular_data",
+    },
+)
@@ -0,0 +1,296 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+The ExtraInfoTable class stores extra info column-wise, while acting as a read-only ExtraInfoLookup
+"""
+
+from typing import Any, Dict, Iterator, List, Mapping, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from power_grid_model_io.data_types._data_types import ExtraInfo, ExtraInfoLookup
+
+ExtraInfoPath = Tuple[str, ...]
+"""
+The (flattened) location of a value in a nested ExtraInfo dictionary, e.g. ("id_reference", "table")
+"""
+
+ExtraInfoColumns = Dict[ExtraInfoPath, np.ndarray]
+
+
+class ExtraInfoTable(Mapping[int, ExtraInfo]):
+    """
+    An ExtraInfoTable stores extra info column-wise: one sorted array of power-grid-model ids and one array per
+    (flattened) extra info attribute. Nested dictionaries, like the id_reference, are stored as separate columns.
+
+    For backward compatibility, the table can be used as a read-only ExtraInfoLookup; the ExtraInfo dictionary of
+    an id is only created when it is requested:
+
+        extra_info = ExtraInfoTable()
+        extra_info.add(ids=[1, 2], columns={"name": ["a", "b"], "id_reference": {"table": "nodes", "index": [4, 5]}})
+        extra_info[2] --> {"name": "b", "id_reference": {"table": "nodes", "index": 5}}
+
+    Missing values (None or NaN) are not stored, just like the tabular converter skips missing extra info values.
+    """
+
+    def __init__(self) -> None:
+        self._ids: np.ndarray = np.array([], dtype=np.int64)
+        self._columns: ExtraInfoColumns = {}
+        self._pending: List[Tuple[np.ndarray, ExtraInfoColumns]] = []
+
+    @classmethod
+    def from_lookup(cls, lookup: Mapping[int, ExtraInfo]) -> "ExtraInfoTable":
+        """
+        Create an ExtraInfoTable from an ExtraInfoLookup dictionary
+
+        Args:
+            lookup: A dictionary of ExtraInfo dictionaries, indexed by power-grid-model id
+
+        Returns:
+            The extra info, stored column-wise
+        """
+        rows: Dict[ExtraInfoPath, Tuple[List[int], List[Any]]] = {}
+
+        def collect(pgm_id: int, extra: Dict[str, Any], path: ExtraInfoPath):
+            for key, value in extra.items():
+                if isinstance(value, dict):
+                    collect(pgm_id, value, path + (key,))
+                    continue
+                key_path = path + (key,)
+                if key_path not in rows:
+                    rows[key_path] = ([], [])
+                ids, values = rows[key_path]
+                ids.append(pgm_id)
+                values.append(value)
+
+        for pgm_id, extra in lookup.items():
+            collect(pgm_id, extra, ())
+
+        table = cls()
+        for path, (ids, values) in rows.items():
+            table._pending.append((np.array(ids, dtype=np.int64), {path: _to_column(values)}))
+        return table
+
+    def add(self, ids: Union[np.ndarray, pd.Index, List[int]], columns: Mapping[str, Any]) -> None:
+        """
+        Add (or overwrite) extra info for a number of objects. The columns may be nested dictionaries; each value
+        should be a list, array or Series with one value per id, or a single value that applies to all ids. Missing
+        values (None or NaN) don't overwrite existing values, just like updating an ExtraInfo dictionary with only the
+        values that are not missing.
+
+        Args:
+            ids: The power-grid-model ids of the objects
+            columns: The extra info, one (nested) column per attribute
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        flat: ExtraInfoColumns = {}
+        for path, value in _flatten_dict(columns):
+            if isinstance(value, (pd.Series, pd.Index)):
+                value = value.to_numpy()
+            elif isinstance(value, list):
+                value = _to_column(value)
+            if isinstance(value, np.ndarray):
+                if value.shape != ids.shape:
+                    raise ValueError(
+                        f"The extra info column '{'.'.join(path)}' contains {len(value)} values, expected {len(ids)}"
+                    )
+            else:
+                value = _to_column([value] * len(ids))
+            flat[path] = value
+        self._pending.append((ids, flat))
+
+    def merge(self, lookup: Mapping[int, ExtraInfo]) -> None:
+        """
+        Add (or overwrite) the extra info from an ExtraInfoLookup dictionary (or another ExtraInfoTable); like
+        add(), existing extra info is merged per attribute.
+
+        Args:
+            lookup: A dictionary of ExtraInfo dictionaries, indexed by power-grid-model id
+        """
+        # pylint: disable=protected-access
+        table = lookup if isinstance(lookup, ExtraInfoTable) else ExtraInfoTable.from_lookup(lookup)
+        table._consolidate()
+        self._pending.append((table._ids, table._columns))
+
+    @property
+    def ids(self) -> np.ndarray:
+        """
+        The (sorted) ids of all objects that have extra info
+        """
+        self._consolidate()
+        return self._ids
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Get the extra info as a DataFrame, indexed by power-grid-model id. The paths of nested values are joined by
+        dots, e.g. "id_reference.table".
+
+        Returns:
+            A DataFrame with one row per object and one column per extra info attribute
+        """
+        self._consolidate()
+        return pd.DataFrame(
+            {".".join(path): column for path, column in self._columns.items()},
+            index=pd.Index(self._ids, name="id"),
+        )
+
+    def join(self, ids: Union[np.ndarray, pd.Series, List[int]]) -> pd.DataFrame:
+        """
+        Get the extra info of a number of objects (e.g. all objects of a component in the output data) at once
+
+        Args:
+            ids: The power-grid-model ids of the objects
+
+        Returns:
+            A DataFrame (see to_frame()) with one row for each id, in the same order; the values of objects
+            without extra info are missing (NaN)
+        """
+        return self.to_frame().reindex(np.asarray(ids, dtype=np.int64))
+
+    def to_lookup(self) -> ExtraInfoLookup:
+        """
+        Materialize all extra info as an ExtraInfoLookup dictionary
+
+        Returns:
+            A dictionary of ExtraInfo dictionaries, indexed by power-grid-model id
+        """
+        self._consolidate()
+        lookup: ExtraInfoLookup = {pgm_id: {} for pgm_id in self._ids.tolist()}
+        for path, column in self._columns.items():
+            present = ~pd.isna(column)
+            for pgm_id, value in zip(self._ids[present].tolist(), column[present].tolist()):
+                node = lookup[pgm_id]
+                for key in path[:-1]:
+                    node = node.setdefault(key, {})  # type: ignore[assignment]
+                node[path[-1]] = value
+        return lookup
+
+    def __getitem__(self, pgm_id: int) -> ExtraInfo:
+        pos = self._position(pgm_id)
+        if pos is None:
+            raise KeyError(pgm_id)
+        extra: ExtraInfo = {}
+        for path, column in self._columns.items():
+            value = column[pos]
+            if _is_missing(value):
+                continue
+            if isinstance(value, np.generic):
+                value = value.item()
+            node = extra
+            for key in path[:-1]:
+                node = node.setdefault(key, {})  # type: ignore[assignment]
+            node[path[-1]] = value
+        return extra
+
+    def __contains__(self, pgm_id: object) -> bool:
+        return isinstance(pgm_id, (int, np.integer)) and self._position(int(pgm_id)) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        self._consolidate()
+        return iter(self._ids.tolist())
+
+    def __len__(self) -> int:
+        self._consolidate()
+        return len(self._ids)
+
+    def _position(self, pgm_id: int):
+        self._consolidate()
+        pos = int(np.searchsorted(self._ids, pgm_id))
+        if pos < len(self._ids) and self._ids[pos] == pgm_id:
+            return pos
+        return None
+
+    def _consolidate(self) -> None:
+        """
+        Merge the pending blocks of extra info into the columns; values of later blocks overwrite earlier values
+        """
+        if not self._pending:
+            return
+
+        blocks = [(self._ids, self._columns)] + self._pending
+        self._pending = []
+
+        ids = np.unique(np.concatenate([block_ids for block_ids, _ in blocks]))
+        paths: Dict[ExtraInfoPath, None] = {}
+        for _, block_columns in blocks:
+            paths.update(dict.fromkeys(block_columns))
+
+        columns: ExtraInfoColumns = {}
+        for path in paths:
+            parts = [(block_ids, block_columns[path]) for block_ids, block_columns in blocks if path in block_columns]
+            columns[path] = _merge_parts(ids, parts)
+
+        # Only keep the objects that have at least one value
+        present = np.zeros(len(ids), dtype=bool)
+        for column in columns.values():
+            present |= ~pd.isna(column)
+        if not present.all():
+            ids = ids[present]
+            columns = {path: column[present] for path, column in columns.items()}
+
+        self._ids = ids
+        self._columns = columns
+
+
+def _merge_parts(ids: np.ndarray, parts: List[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+    """
+    Combine the values of one attribute from multiple blocks into a single column, aligned with the (sorted) ids.
+    Numerical columns are kept numerical if all blocks are of the same kind (e.g. all integers); otherwise the values
+    are stored as they are, in an object column, so that an integer doesn't become a float. Missing integers are only
+    possible in an object column. Missing values (None or NaN) don't overwrite the values of earlier blocks.
+    """
+    kinds = {values.dtype.kind for _, values in parts}
+    if len(kinds) == 1 and kinds <= set("iuf"):
+        dtype = np.result_type(*[values.dtype for _, values in parts])
+        column = np.full(len(ids), fill_value=np.nan if dtype.kind == "f" else 0, dtype=dtype)
+    else:
+        column = np.full(len(ids), fill_value=None, dtype=object)
+
+    covered = np.zeros(len(ids), dtype=bool)
+    for part_ids, values in parts:
+        present = ~pd.isna(values)
+        pos = np.searchsorted(ids, part_ids[present])
+        column[pos] = values[present] if column.dtype != object else values[present].astype(object)
+        covered[pos] = True
+
+    if column.dtype.kind in "iu" and not covered.all():
+        column = column.astype(object)
+        column[~covered] = None
+    return column
+
+
+def _flatten_dict(values: Mapping[str, Any], path: ExtraInfoPath = ()) -> Iterator[Tuple[ExtraInfoPath, Any]]:
+    for key, value in values.items():
+        if isinstance(value, dict):
+            yield from _flatten_dict(value, path + (key,))
+        else:
+            yield path + (key,), value
+
+
+def _to_column(values: List[Any]) -> np.ndarray:
+    """
+    Store a list of values as a numerical array if all values are integers, or if all values are floats; otherwise
+    the values are stored as they are, in an object array.
+    """
+    integers = (int, np.integer)
+    floats = (float, np.floating)
+    if all(isinstance(value, integers) and not isinstance(value, bool) for value in values) or all(
+        isinstance(value, floats) for value in values
+    ):
+        return np.array(values)
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        column[i] = value
+    return column
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, (float, np.floating)) and np.isnan(value))
+
+
+ExtraInfoContainer = Union[ExtraInfoLookup, ExtraInfoTable]
+"""
+Extra info can be stored per object in an ExtraInfoLookup dictionary, or column-wise in an ExtraInfoTable
+"""
@@ -6,7 +6,8 @@ The TabularData class is a wrapper around Dict[str, Union[pd.DataFrame, np.ndarr
 which supports unit conversions and value substitutions
 """
 
-from typing import Dict, Iterable, Optional, Tuple, Union
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Iterable, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -14,6 +15,7 @@ import structlog
 
 from power_grid_model_io.mappings.unit_mapping import UnitMapping
 from power_grid_model_io.mappings.value_mapping import ValueMapping
+from power_grid_model_io.utils.instrumentation import Instrumentation
 
 
 class TabularData:
@@ -42,6 +44,7 @@ class TabularData:
         self._data: Dict[str, Union[pd.DataFrame, np.ndarray]] = tables
         self._units: Optional[UnitMapping] = None
         self._substitution: Optional[ValueMapping] = None
+        self._instrumentation: Optional[Instrumentation] = None
         self._log = structlog.get_logger(type(self).__name__)
 
     def set_unit_multipliers(self, units: UnitMapping) -> None:
@@ -62,6 +65,15 @@ class TabularData:
         """
         self._substitution = substitution
 
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]) -> None:
+        """
+        Measure the unit conversions
+
+        Args:
+            instrumentation: The instrumentation that records the metrics of each unit conversion, or None
+        """
+        self._instrumentation = instrumentation
+
     def get_column(self, table_name: str, column_name: str) -> pd.Series:
         """
         Select a column from a table, while applying unit conversions and value substitutions
@@ -87,7 +99,8 @@ class TabularData:
 
         # If unit information is available, convert the unit
         if not isinstance(column_data, pd.Series):
-            column_data = self._apply_unit_conversion(table_data=table_data, table=table_name, field=column_name)
+            with self._stage("unit_conversion", table=table_name, field=column_name):
+                column_data = self._apply_unit_conversion(table_data=table_data, table=table_name, field=column_name)
             if not isinstance(column_data, pd.Series):
                 raise TypeError(
                     f"The '{column_name}' column should now be unitless, "
@@ -96,28 +109,76 @@ class TabularData:
 
         return self._apply_value_substitution(column_data=column_data, table=table_name, field=column_name)
 
-    def _apply_value_substitution(self, column_data: pd.Series, table: str, field: str) -> pd.Series:
+    def get_column_array(self, table_name: str, column_name: str) -> np.ndarray:
+        """
+        Select a column from a table as a NumPy array, while applying value substitutions. For NumPy structured
+        arrays, the column is returned without using pandas at all; if no substitutions apply, the returned array is
+        a view on the original data.
+
+        Args:
+            table_name: The name of the table as supplied in the constructor
+            column_name: The name of the column
+
+        Returns:
+            The required column, with value substitutions (and unit conversions) applied
+        """
+        table_data = self._data[table_name]
+        if not isinstance(table_data, np.ndarray):
+            return self.get_column(table_name=table_name, column_name=column_name).to_numpy()
+        return self._apply_value_substitution(column_data=table_data[column_name], table=table_name, field=column_name)
+
+    def _apply_value_substitution(
+        self, column_data: Union[pd.Series, np.ndarray], table: str, field: str
+    ) -> Union[pd.Series, np.ndarray]:
 
         if self._substitution is None:  # No substitution defined, at all
             return column_data
 
         # Find substitutions, ignore if none is found
         try:
-            substitutions = self._substitution.get_substitutions(attr=field, table=table)
+            keys, values = self._substitution.get_substitution_table(attr=field, table=table)
         except KeyError:
             return column_data
 
-        def sub(value):
-            try:
-                return substitutions[value]
-            except KeyError as ex:
-                raise KeyError(
-                    f"Unknown substitution for value '{value}' in column '{field}' in table '{table}'"
-                ) from ex
+        # Categorical columns only need to be substituted once for each category
+        if isinstance(column_data, pd.Series) and isinstance(column_data.dtype, pd.CategoricalDtype):
+            codes = column_data.cat.codes.to_numpy()
+            indexer = self._get_substitution_indexer(keys, column_data.cat.categories)
+            indexer = np.where(codes >= 0, indexer[codes], -1)
+        else:
+            indexer = self._get_substitution_indexer(keys, column_data)
+
+        # Check all values at once, so that all unknown values can be reported in a single error
+        unknown = indexer < 0
+        if unknown.any():
+            unknown_values = pd.unique(column_data[unknown].astype(object))
+            raise KeyError(
+                f"Unknown substitution for value{'s' if len(unknown_values) > 1 else ''} "
+                + ", ".join(f"'{value}'" for value in unknown_values)
+                + f" in column '{field}' in table '{table}'"
+            )
 
         # Apply substitutions
-        self._log.debug("Apply value substitutions", table=table, field=field, substitutions=substitutions)
-        return column_data.map(sub)
+        self._log.debug("Apply value substitutions", table=table, field=field, n_substitutions=len(keys))
+        if isinstance(column_data, np.ndarray):
+            return values[indexer]
+        return pd.Series(values[indexer], index=column_data.index, name=column_data.name)
+
+    @staticmethod
+    def _get_substitution_indexer(keys: pd.Index, column_data: Union[pd.Index, pd.Series, np.ndarray]) -> np.ndarray:
+        """
+        Find the position of each value in the substitution keys, or -1 if there is no substitution. The index lookup
+        distinguishes between bool and int values, unlike the dictionary of substitutions (True == 1), so values that
+        aren't found in the index are looked up in a dictionary of the keys as well.
+        """
+        indexer = keys.get_indexer(column_data)
+        unknown = indexer < 0
+        if unknown.any():
+            positions = dict(zip(keys, range(len(keys))))
+            codes, unique_values = pd.factorize(np.asarray(column_data, dtype=object)[unknown])
+            fallback = np.array([positions.get(value, -1) for value in unique_values] + [-1], dtype=indexer.dtype)
+            indexer[unknown] = fallback[codes]
+        return indexer
 
     def _apply_unit_conversion(self, table_data: pd.DataFrame, table: str, field: str) -> pd.Series:
         unit = table_data[field].columns[0]
@@ -155,6 +216,11 @@ class TabularData:
 
         return table_data[pd.MultiIndex.from_tuples([(field, si_unit)])[0]]
 
+    def _stage(self, name: str, **context: Any) -> ContextManager:
+        if self._instrumentation is None:
+            return nullcontext()
+        return self._instrumentation.stage(name, **context)
+
     def __contains__(self, table_name: str) -> bool:
         """
         Mimic the dictionary 'in' operator
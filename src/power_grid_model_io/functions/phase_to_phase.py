@@ -6,13 +6,14 @@ These functions can be used in the mapping files to apply functions to vision da
 """
 
 import math
+from functools import lru_cache
 from typing import Tuple
-import structlog
 
+import structlog
 from power_grid_model import WindingType
 
 from power_grid_model_io.functions import get_winding
-from power_grid_model_io.utils.regex import PVS_EFFICIENCY_TYPE_RE, TRAFO_CONNECTION_RE, TRAFO3_CONNECTION_RE
+from power_grid_model_io.utils.regex import PVS_EFFICIENCY_TYPE_RE, TRAFO3_CONNECTION_RE, TRAFO_CONNECTION_RE
 
 _LOG = structlog.get_logger(__file__)
 
@@ -147,12 +148,16 @@ def reactive_power_to_susceptance(q: float, u_nom: float) -> float:
     return q / u_nom / u_nom
 
 
+@lru_cache
 def _split_connection_string(conn_str: str) -> Tuple[str, str, int]:
     """
     Helper function to split the conn_str into three parts:
      * winding_from
      * winding_to
      * clock
+
+    The get_winding_* and get_clock functions are applied to each row, so the (few) distinct connection strings are
+    cached; each string is parsed only once.
     """
     match = TRAFO_CONNECTION_RE.fullmatch(conn_str)
     if not match:
@@ -160,6 +165,7 @@ def _split_connection_string(conn_str: str) -> Tuple[str, str, int]:
     return match.group(1), match.group(2), int(match.group(3))
 
 
+@lru_cache
 def _split_connection_string_3w(conn_str: str) -> Tuple[str, str, int, str, int]:
     """
     Helper function to split the conn_str into three parts:
@@ -168,6 +174,8 @@ def _split_connection_string_3w(conn_str: str) -> Tuple[str, str, int, str, int]
      * clock 12
      * winding_3
      * clock 13
+
+    Just like _split_connection_string(), each distinct connection string is parsed only once.
     """
     match = TRAFO3_CONNECTION_RE.fullmatch(conn_str)
     if not match:
@@ -7,12 +7,19 @@ RegEx attribute based mapping class
 
 import re
 from functools import lru_cache
-from typing import Dict, Generic, Optional, TypeVar
+from typing import Dict, Generic, List, Optional, TypeVar
 
 import structlog
 
 T = TypeVar("T")
 
+NUMBERED_BACK_REFERENCE_RE = re.compile(r"\\[1-9]")
+
+MAPPING_CACHE_SIZE = 1024
+"""
+The maximum number of (attribute, table) lookups that are cached per mapping
+"""
+
 
 # pylint: disable=too-few-public-methods
 class FieldMapping(Generic[T]):
@@ -23,13 +30,41 @@ class FieldMapping(Generic[T]):
     def __init__(self, mapping: Optional[Dict[str, T]] = None):
         self._log = structlog.get_logger(type(self).__name__)
         self._values: Dict[str, T] = mapping or {}
-        self._values_re: Dict[re.Pattern, T] = {re.compile(pattern): value for pattern, value in self._values.items()}
+        self._keys: List[str] = list(self._values.keys())
+        self._values_re: List[re.Pattern] = []
+
+        # All patterns are combined into a single regular expression, so that a lookup always takes a single match.
+        # The alternatives are tried in order, so the first matching pattern is used, just like a loop over the
+        # individual patterns. Patterns that can't be combined (e.g. using global flags or numbered back references)
+        # are matched one by one.
+        self._combined_re: Optional[re.Pattern] = None
+        try:
+            if not any(NUMBERED_BACK_REFERENCE_RE.search(pattern) for pattern in self._keys):
+                self._combined_re = re.compile("|".join(f"(?P<_{i}>{pattern})" for i, pattern in enumerate(self._keys)))
+        except re.error:
+            pass
+        if self._combined_re is None:
+            self._values_re = [re.compile(pattern) for pattern in self._keys]
+
+        # Each mapping has its own (bounded) cache, which is released together with the mapping itself
+        self._find_key = lru_cache(maxsize=MAPPING_CACHE_SIZE)(self._find_key_uncached)
 
-    @lru_cache
     def _get_mapping(self, attr: str, table: Optional[str] = None) -> T:
         """
         Find the mapping for a given attribute.
         """
+        key = self._find_key(attr, table)
+
+        # If no match was found, raise a key error
+        if key is None:
+            raise KeyError(attr)
+
+        return self._values[key]
+
+    def _find_key_uncached(self, attr: str, table: Optional[str] = None) -> Optional[str]:
+        """
+        Find the key (i.e. attribute name or pattern) in the mapping that matches a given attribute.
+        """
 
         # If a table is supplied, first try to find a table specific match
         keys = []
@@ -40,13 +75,17 @@ class FieldMapping(Generic[T]):
         # First check if there is an exact match
         for key in keys:
             if key in self._values:
-                return self._values[key]
+                return key
 
         # Otherwise, use the values as regular expressions
         for key in keys:
-            for pattern in self._values_re.keys():
-                if pattern.fullmatch(key):
-                    return self._values_re[pattern]
+            if self._combined_re is not None:
+                match = self._combined_re.fullmatch(key)
+                if match is not None and match.lastgroup is not None:
+                    return self._keys[int(match.lastgroup[1:])]
+            else:
+                for i, pattern in enumerate(self._values_re):
+                    if pattern.fullmatch(key):
+                        return self._keys[i]
 
-        # If no match was found, raise a key error
-        raise KeyError(keys.pop())
+        return None
@@ -4,14 +4,17 @@
 """
 Tabular data mapping helper class
 """
-from typing import Dict, Generator, List, Tuple, Union
+from typing import Any, Collection, Dict, Generator, List, Mapping, Set, Tuple, Union
 
 import structlog
 
+from power_grid_model_io.utils.expressions import compile_expression
+
 AttributeValue = Union[int, float, str, Dict, List]
 InstanceAttributes = Dict[str, AttributeValue]
 Components = Dict[str, Union[InstanceAttributes, List[InstanceAttributes]]]
 Tables = Dict[str, Components]
+ColumnDependencies = Dict[str, Set[Tuple[str, ...]]]
 
 
 class TabularMapping:
@@ -51,3 +54,121 @@ class TabularMapping:
             else:
                 for instance in instances:
                     yield component, instance
+
+    def column_dependencies(self) -> ColumnDependencies:
+        """
+        Analyse the mapping (without any data) and collect the source columns that are used by each table, including
+        the columns of `|` alternatives, composite column definitions, function arguments, expressions, auto_id keys
+        and references (the key and value columns of a reference belong to the other table).
+
+        Constant values (e.g. 'inf') are not included. Note that 'index' refers to the row numbers of a table, unless
+        the table contains a column called 'index'.
+
+        Returns:
+            For each table, a set of column alternatives, i.e. tuples of column names of which (at least) one should
+            exist. E.g. {"Nodes": {("Number",), ("Unom", "U_nom")}} for the column definitions "Number" and
+            "Unom | U_nom".
+        """
+        dependencies: ColumnDependencies = {}
+        for table in self.tables():
+            dependencies.setdefault(table, set())
+            for _, attributes in self.instances(table=table):
+                for col_def in attributes.values():
+                    self._add_col_def_dependencies(dependencies=dependencies, table=table, col_def=col_def)
+        return dependencies
+
+    def required_columns(self) -> Dict[str, Set[str]]:
+        """
+        The names of all source columns that are used by each table, e.g. to load only those columns from a file. For
+        `|` alternatives, all alternatives are included.
+
+        Returns:
+            For each table, the set of column names
+        """
+        return {
+            table: {column for alternatives in dependencies for column in alternatives}
+            for table, dependencies in self.column_dependencies().items()
+        }
+
+    def missing_columns(self, columns: Mapping[str, Collection[str]]) -> Dict[str, List[str]]:
+        """
+        Check which columns that are used by the mapping don't exist, e.g. based on the header of each table, before
+        loading the (entire) data. Tables that don't exist at all are not checked, as they are skipped during the
+        conversion.
+
+        Args:
+            columns: The column names of each available table
+
+        Returns:
+            For each table with missing columns, the missing column definitions (e.g. "Unom | U_nom"), sorted by name
+        """
+        missing: Dict[str, List[str]] = {}
+        for table, dependencies in self.column_dependencies().items():
+            if table not in columns:
+                continue
+            available = set(columns[table]) | {"index"}
+            table_missing = sorted(
+                " | ".join(alternatives)
+                for alternatives in dependencies
+                if not any(column in available for column in alternatives)
+            )
+            if table_missing:
+                missing[table] = table_missing
+        return missing
+
+    def _add_col_def_dependencies(self, dependencies: ColumnDependencies, table: str, col_def: Any) -> None:
+        """
+        Add the columns of a single column definition to the dependencies, following the same rules as the
+        TabularConverter uses to interpret the column definitions
+        """
+        if isinstance(col_def, (int, float)):
+            return
+        if isinstance(col_def, str):
+            self._add_column_dependency(dependencies=dependencies, table=table, col_def=col_def)
+        elif isinstance(col_def, list):
+            for sub_def in col_def:
+                self._add_col_def_dependencies(dependencies=dependencies, table=table, col_def=sub_def)
+        elif isinstance(col_def, dict):
+            for name, sub_def in col_def.items():
+                self._add_filter_dependencies(dependencies=dependencies, table=table, name=name, sub_def=sub_def)
+        else:
+            raise TypeError(f"Invalid column definition: {col_def}")
+
+    def _add_filter_dependencies(self, dependencies: ColumnDependencies, table: str, name: str, sub_def: Any) -> None:
+        """
+        Add the columns of a column filter (e.g. 'auto_id', 'reference', 'expr' or a function) to the dependencies
+        """
+        if name == "auto_id" and isinstance(sub_def, dict) and "key" in sub_def:
+            key_def = sub_def["key"]
+            key_def = list(key_def.values()) if isinstance(key_def, dict) else key_def
+            self._add_col_def_dependencies(dependencies=dependencies, table=table, col_def=key_def)
+        elif name == "reference" and isinstance(sub_def, dict):
+            other_table = sub_def.get("other_table", table)
+            self._add_col_def_dependencies(
+                dependencies=dependencies, table=table, col_def=sub_def.get("query_column", [])
+            )
+            self._add_col_def_dependencies(
+                dependencies=dependencies, table=other_table, col_def=sub_def.get("key_column", [])
+            )
+            self._add_col_def_dependencies(
+                dependencies=dependencies, table=other_table, col_def=sub_def.get("value_column", [])
+            )
+        elif name == "expr" and isinstance(sub_def, str):
+            for column in compile_expression(sub_def).columns:
+                dependencies.setdefault(table, set()).add((column,))
+        elif isinstance(sub_def, dict):
+            self._add_col_def_dependencies(dependencies=dependencies, table=table, col_def=list(sub_def.values()))
+        else:
+            self._add_col_def_dependencies(dependencies=dependencies, table=table, col_def=sub_def)
+
+    @staticmethod
+    def _add_column_dependency(dependencies: ColumnDependencies, table: str, col_def: str) -> None:
+        """
+        Add a column name (or `|` separated alternatives) to the dependencies, unless it is a constant value like 'inf'
+        """
+        alternatives = tuple(column.strip() for column in col_def.split("|"))
+        try:
+            float(col_def)
+            return
+        except ValueError:
+            dependencies.setdefault(table, set()).add(alternatives)
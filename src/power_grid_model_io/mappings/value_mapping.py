@@ -5,7 +5,10 @@
 Value substitution helper class
 """
 
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
 
 from power_grid_model_io.mappings.field_mapping import FieldMapping
 
@@ -14,6 +17,9 @@ Value = Union[int, float, str, bool]
 #             attr      key    value
 Values = Dict[str, Dict[Value, Value]]
 
+#                          keys      values
+SubstitutionTable = Tuple[pd.Index, np.ndarray]
+
 
 # pylint: disable=too-few-public-methods
 class ValueMapping(FieldMapping[Dict[Value, Value]]):
@@ -27,9 +33,25 @@ class ValueMapping(FieldMapping[Dict[Value, Value]]):
             self._log.debug(
                 "Set value mapping", n_attributes=len(mapping), n_mappings=sum(len(m) for m in mapping.values())
             )
+        self._tables: Dict[str, SubstitutionTable] = {}
 
     def get_substitutions(self, attr: str, table: Optional[str] = None) -> Dict[Value, Value]:
         """
         Find the substitutions for a given attribute.
         """
         return self._get_mapping(attr=attr, table=table)
+
+    def get_substitution_table(self, attr: str, table: Optional[str] = None) -> SubstitutionTable:
+        """
+        Find the substitutions for a given attribute, compiled into an index of the original values and an array of
+        the substitute values, in the same order. Each substitution table is compiled only once.
+        """
+        key = self._find_key(attr, table)
+        if key is None:
+            raise KeyError(attr)
+        if key not in self._tables:
+            substitutions = self._values[key]
+            keys = pd.Index(list(substitutions.keys()), tupleize_cols=False)
+            values = pd.Series(list(substitutions.values()), dtype=None if substitutions else object).to_numpy()
+            self._tables[key] = (keys, values)
+        return self._tables[key]
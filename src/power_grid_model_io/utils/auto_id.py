@@ -5,7 +5,7 @@
 Automatic ID generator class
 """
 import collections
-from typing import Any, Dict, Hashable, List, Optional, Union
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Union
 
 
 class AutoID:
@@ -119,3 +119,21 @@ class AutoID:
             The original item
         """
         return self._items[idx]
+
+    def __len__(self) -> int:
+        """
+        The number of ids that were generated
+
+        Returns:
+            The number of ids
+        """
+        return len(self._items)
+
+    def items(self) -> Iterator[Any]:
+        """
+        The original items of all generated ids, ordered by numerical id (i.e. the n-th item belongs to id n)
+
+        Returns:
+            An iterator over the items
+        """
+        return iter(self._items)
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+Save and load the state of the automatic ID generator of the tabular converter
+
+The state is stored in a compressed NumPy (.npz) file. The auto ids are grouped by table, name and key columns; for each
+group, the ids and the key values are stored as (typed) arrays, so that no pickling is required. Key columns with values
+of mixed types are stored as json strings.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from power_grid_model_io.utils.auto_id import AutoID
+from power_grid_model_io.utils.json import JsonEncoder
+
+GroupKey = Tuple[str, Optional[str], Tuple[str, ...]]
+
+
+def save_auto_id_state(auto_id: AutoID, file_path: Path) -> None:
+    """
+    Store all ids of an AutoID, as generated by the TabularConverter, i.e. with (table, key, name) items.
+
+    Args:
+        auto_id: The automatic ID generator
+        file_path: The .npz file in which the state should be stored
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    meta = []
+    for i, ((table, name, key_names), (ids, values)) in enumerate(_group_items(auto_id).items()):
+        arrays[f"ids_{i}"] = np.array(ids, dtype=np.int64)
+        encodings = []
+        for j, column in enumerate(values):
+            arrays[f"key_{i}_{j}"], encoding = _encode_column(column)
+            encodings.append(encoding)
+        meta.append({"table": table, "name": name, "key_names": list(key_names), "encodings": encodings})
+    arrays["meta"] = np.array(json.dumps(meta))
+
+    with file_path.open(mode="wb") as file_pointer:
+        np.savez_compressed(file_pointer, **arrays)
+
+
+def load_auto_id_state(file_path: Path) -> AutoID:
+    """
+    Create an AutoID that contains all the ids that were stored using save_auto_id_state(). Ids that are generated for
+    new items will not clash with the stored ids.
+
+    Args:
+        file_path: The .npz file in which the state is stored
+
+    Returns:
+        An automatic ID generator, in the same state as it was stored
+    """
+    items: Dict[int, Tuple[str, Dict[str, Any], Optional[str]]] = {}
+    with np.load(file_path, allow_pickle=False) as data:
+        meta = json.loads(str(data["meta"]))
+        for i, group in enumerate(meta):
+            columns = [_decode_column(data[f"key_{i}_{j}"], encoding) for j, encoding in enumerate(group["encodings"])]
+            ids = data[f"ids_{i}"].tolist()
+            for pgm_id, values in zip(ids, zip(*columns) if columns else [()] * len(ids)):
+                items[pgm_id] = (group["table"], dict(zip(group["key_names"], values)), group["name"])
+
+    auto_id = AutoID()
+    for expected_id, pgm_id in enumerate(sorted(items)):
+        if pgm_id != expected_id:
+            raise ValueError(f"Invalid auto id state in {file_path}; id {expected_id} is missing")
+        table, key, name = items[pgm_id]
+        auto_id(item=(table, key, name), key=(table, tuple(sorted(key.items())), name))
+    return auto_id
+
+
+def _group_items(auto_id: AutoID) -> Dict[GroupKey, Tuple[List[int], List[List[Any]]]]:
+    """
+    Group the ids by table, name and key columns, and collect the key values per column
+    """
+    groups: Dict[GroupKey, Tuple[List[int], List[List[Any]]]] = {}
+    for pgm_id, item in enumerate(auto_id.items()):
+        if not isinstance(item, tuple) or len(item) != 3 or not isinstance(item[1], dict):
+            raise TypeError(f"Invalid auto id item {item!r}; expected a (table, key, name) tuple")
+        table, key, name = item
+        ids, values = groups.setdefault((table, name, tuple(key)), ([], [[] for _ in key]))
+        ids.append(pgm_id)
+        for column, value in zip(values, key.values()):
+            column.append(value.item() if isinstance(value, np.generic) else value)
+    return groups
+
+
+def _encode_column(values: List[Any]) -> Tuple[np.ndarray, str]:
+    """
+    Store values of a single type (int, float, bool or str) as a typed array; other values as json strings
+    """
+    value_types = {type(value) for value in values}
+    if len(value_types) == 1 and value_types <= {int, float, bool, str}:
+        return np.array(values), "array"
+    return np.array([json.dumps(value, cls=JsonEncoder) for value in values], dtype=np.str_), "json"
+
+
+def _decode_column(array: np.ndarray, encoding: str) -> List[Any]:
+    if encoding == "json":
+        return [json.loads(value) for value in array.tolist()]
+    return array.tolist()
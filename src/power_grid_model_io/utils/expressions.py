@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+Arithmetic expressions on columns, which are parsed once and evaluated column-wise using NumPy
+"""
+
+import ast
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Union
+
+import numpy as np
+
+QUOTED_COLUMN_RE = re.compile(r"`([^`]+)`")
+"""
+Column names that are not valid Python identifiers (e.g. "Load.P" or "Cable length") can be quoted with backticks
+"""
+
+EXPRESSION_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "exp": np.exp,
+    "log": np.log,
+    "log10": np.log10,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "arctan": np.arctan,
+    "minimum": np.minimum,
+    "maximum": np.maximum,
+}
+"""
+The (element-wise) functions that can be used in expressions
+"""
+
+EXPRESSION_CACHE_SIZE = 1024
+"""
+The maximum number of compiled expressions that are cached by compile_expression()
+"""
+
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub)
+
+
+class Expression:
+    """
+    An arithmetic expression on columns, e.g. "R * Length / Parallel" or "sqrt(`Load.P` ** 2 + `Load.Q` ** 2)"
+
+    The expression is parsed and validated once; only numbers, column names, arithmetic operators (+, -, *, /, //, %,
+    **) and the functions in EXPRESSION_FUNCTIONS are allowed. Column names are all other names in the expression;
+    names that are not valid Python identifiers should be quoted with backticks.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+
+        # Replace the quoted column names by placeholders, so that the expression can be parsed by Python
+        quoted: List[str] = []
+
+        def quote(match: re.Match) -> str:
+            quoted.append(match.group(1))
+            return f"_quoted_{len(quoted) - 1}"
+
+        try:
+            tree = ast.parse(QUOTED_COLUMN_RE.sub(quote, expression).strip(), mode="eval")
+        except SyntaxError as ex:
+            raise ValueError(f"Invalid expression '{expression}': {ex.msg}") from ex
+
+        self.columns: List[str] = []
+        _ColumnTransformer(expression=expression, quoted=quoted, columns=self.columns).visit(tree)
+        self._code = compile(ast.fix_missing_locations(tree), filename="<expression>", mode="eval")
+
+    def evaluate(self, columns: Mapping[str, np.ndarray]) -> Union[np.ndarray, float]:
+        """
+        Evaluate the expression column-wise
+
+        Args:
+            columns: The data of (at least) all columns used in the expression
+
+        Returns:
+            The resulting column; or a single value if the expression doesn't use any columns
+        """
+        namespace: Dict[str, Any] = {f"_column_{i}": columns[name] for i, name in enumerate(self.columns)}
+        namespace.update({f"_function_{name}": fn for name, fn in EXPRESSION_FUNCTIONS.items()})
+        return eval(self._code, {"__builtins__": {}}, namespace)  # pylint: disable=eval-used
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.expression!r})"
+
+
+class _ColumnTransformer(ast.NodeTransformer):
+    """
+    Validate the nodes of an expression and replace all names by internal names; the column names are collected in
+    order of appearance.
+    """
+
+    def __init__(self, expression: str, quoted: List[str], columns: List[str]):
+        self._expression = expression
+        self._quoted = quoted
+        self._columns = columns
+
+    def visit_Call(self, node: ast.Call) -> ast.Call:  # pylint: disable=invalid-name
+        """
+        Only (positional) calls to the supported functions are allowed
+        """
+        if not isinstance(node.func, ast.Name) or node.func.id not in EXPRESSION_FUNCTIONS or node.keywords:
+            raise ValueError(f"Invalid expression '{self._expression}': unsupported function call")
+        node.func = ast.Name(id=f"_function_{node.func.id}", ctx=ast.Load())
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:  # pylint: disable=invalid-name
+        """
+        All names, other than function names, refer to columns
+        """
+        name = node.id
+        if name.startswith("_quoted_"):
+            name = self._quoted[int(name[len("_quoted_") :])]
+        if name not in self._columns:
+            self._columns.append(name)
+        return ast.Name(id=f"_column_{self._columns.index(name)}", ctx=ast.Load())
+
+    def visit_Constant(self, node: ast.Constant) -> ast.Constant:  # pylint: disable=invalid-name
+        """
+        Only numerical constants are allowed
+        """
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"Invalid expression '{self._expression}': unsupported value {node.value!r}")
+        return node
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        if not isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load) + _OPERATORS):
+            raise ValueError(f"Invalid expression '{self._expression}': unsupported syntax ({type(node).__name__})")
+        return super().generic_visit(node)
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression: str) -> Expression:
+    """
+    Parse and validate an expression; recently used expressions (see EXPRESSION_CACHE_SIZE) are not parsed again.
+
+    Args:
+        expression: An arithmetic expression on columns, e.g. "R * Length / Parallel"
+
+    Returns:
+        The compiled expression
+    """
+    return Expression(expression)
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+A one dimensional (structured) array to which chunks of data can be appended
+"""
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+class GrowableArray:
+    """
+    A one dimensional (structured) array to which chunks of data can be appended, without keeping a list of all chunks
+    and concatenating them at the end.
+
+    In memory, the capacity of the underlying buffer is doubled whenever it is full, so the amortized cost of appending
+    is proportional to the size of the appended chunk. If a file path is supplied, the chunks are appended to a binary
+    file instead and the resulting array is memory-mapped, so that it doesn't have to fit in memory.
+    """
+
+    __slots__ = ("_dtype", "_buffer", "_size", "_file_path")
+
+    def __init__(self, dtype: np.dtype, capacity: int = 1024, file_path: Optional[Path] = None):
+        """
+        Args:
+            dtype: The data type of the array, e.g. a power-grid-model component dtype
+            capacity: The initial number of elements for which memory is allocated (in memory only)
+            file_path: A file in which the data is stored; an existing file will be overwritten
+        """
+        self._dtype = np.dtype(dtype)
+        self._size = 0
+        self._file_path = file_path
+        if file_path is None:
+            self._buffer = np.empty(max(capacity, 1), dtype=self._dtype)
+        else:
+            self._buffer = np.empty(0, dtype=self._dtype)
+            file_path.write_bytes(b"")
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        The data type of the array
+        """
+        return self._dtype
+
+    def append(self, data: np.ndarray) -> None:
+        """
+        Append a chunk of data
+
+        Args:
+            data: A one dimensional array of the same data type
+        """
+        if data.dtype != self._dtype:
+            raise TypeError(f"Can't append data of type {data.dtype} to an array of type {self._dtype}")
+        if self._file_path is not None:
+            with self._file_path.open(mode="ab") as file_pointer:
+                data.tofile(file_pointer)
+            self._size += len(data)
+            return
+        if self._size + len(data) > len(self._buffer):
+            capacity = max(2 * len(self._buffer), self._size + len(data))
+            buffer = np.empty(capacity, dtype=self._dtype)
+            buffer[: self._size] = self._buffer[: self._size]
+            self._buffer = buffer
+        self._buffer[self._size : self._size + len(data)] = data
+        self._size += len(data)
+
+    def to_array(self) -> np.ndarray:
+        """
+        The data that was appended so far, as a single array. In memory, this is a view on the underlying buffer (no
+        data is copied); otherwise it is a memory-mapped array of the file.
+
+        Returns: The data
+        """
+        if self._file_path is None:
+            return self._buffer[: self._size]
+        if self._size == 0:
+            return np.empty(0, dtype=self._dtype)
+        return np.memmap(self._file_path, dtype=self._dtype, mode="r+", shape=(self._size,))
@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+Instrumentation of the conversion stages: wall time, CPU time and (optionally) allocated memory
+"""
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import structlog
+
+
+# pylint: disable=too-many-instance-attributes
+@dataclass
+class StageMetrics:
+    """
+    The metrics of a single (completed) stage
+    """
+
+    name: str
+    """The name of the stage, e.g. "parse" or "auto_id" """
+
+    path: Tuple[str, ...]
+    """The names of the enclosing stages and the stage itself, e.g. ("load_input_data", "parse", "table")"""
+
+    context: Dict[str, Any]
+    """Extra information about the stage, e.g. {"table": "Nodes", "component": "node"}"""
+
+    wall_time: float
+    """The elapsed wall time, in seconds"""
+
+    cpu_time: float
+    """The CPU time of the process, in seconds"""
+
+    allocated_bytes: Optional[int] = None
+    """The net amount of allocated memory (only if memory tracing is enabled)"""
+
+    self_time: float = 0.0
+    """The elapsed wall time, excluding the wall time of the nested stages, in seconds"""
+
+    parents: Tuple[Dict[str, Any], ...] = ()
+    """The context of each enclosing stage, outermost first"""
+
+
+@dataclass
+class _ActiveStage:
+    """
+    A stage that has not been completed yet
+    """
+
+    name: str
+    context: Dict[str, Any]
+    child_wall_time: float = 0.0
+
+
+@dataclass
+class StageSummary:
+    """
+    The aggregated metrics of all stages with the same name
+    """
+
+    count: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    allocated_bytes: Optional[int] = None
+
+
+class Instrumentation:
+    """
+    Record the wall time, CPU time and (optionally) the allocated memory of each stage of a conversion:
+
+        instrumentation = Instrumentation(trace_memory=True)
+        converter.set_instrumentation(instrumentation)
+        converter.load_input_data()
+        instrumentation.summary() --> {"load_data": StageSummary(...), "parse": StageSummary(...), ...}
+
+    Each completed stage is logged as a structured event (at debug level) and passed to the hooks, e.g. to ship the
+    metrics to a metrics system. Stages can be nested, even in multiple threads; each thread has its own stack of
+    enclosing stages.
+    """
+
+    def __init__(self, trace_memory: bool = False, hooks: Optional[List[Callable[[StageMetrics], None]]] = None):
+        """
+        Args:
+            trace_memory: Measure the allocated memory of each stage, using tracemalloc. Note that tracing memory
+                allocations slows down the conversion significantly. If tracing wasn't started yet, it is stopped
+                again when the outermost stage has been completed.
+            hooks: Functions that are called with the metrics of each completed stage
+        """
+        self._log = structlog.get_logger(type(self).__name__)
+        self._trace_memory = trace_memory
+        self._hooks: List[Callable[[StageMetrics], None]] = list(hooks or [])
+        self._stages: List[StageMetrics] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._n_traced_stages = 0
+        self._started_tracing = False
+
+    def add_hook(self, hook: Callable[[StageMetrics], None]) -> None:
+        """
+        Add a function that is called with the metrics of each completed stage
+
+        Args:
+            hook: The function
+        """
+        self._hooks.append(hook)
+
+    @property
+    def stages(self) -> List[StageMetrics]:
+        """
+        The metrics of all completed stages, in order of completion
+        """
+        with self._lock:
+            return list(self._stages)
+
+    @contextmanager
+    def stage(self, name: str, **context: Any) -> Iterator[None]:
+        """
+        Measure a stage
+
+        Args:
+            name: The name of the stage
+            **context: Extra information about the stage, e.g. table="Nodes"
+        """
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        stack: List[_ActiveStage] = self._local.stack
+        active = _ActiveStage(name=name, context=context)
+        stack.append(active)
+        path = tuple(stage.name for stage in stack)
+        parents = tuple(stage.context for stage in stack[:-1])
+
+        start_memory = self._start_tracing()
+        start_cpu = time.process_time()
+        start_wall = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start_wall
+            cpu_time = time.process_time() - start_cpu
+            allocated_bytes = None
+            if start_memory is not None:
+                allocated_bytes = tracemalloc.get_traced_memory()[0] - start_memory
+                self._stop_tracing()
+            stack.pop()
+            if stack:
+                stack[-1].child_wall_time += wall_time
+            self._record(
+                StageMetrics(
+                    name=name,
+                    path=path,
+                    context=context,
+                    wall_time=wall_time,
+                    cpu_time=cpu_time,
+                    allocated_bytes=allocated_bytes,
+                    self_time=wall_time - active.child_wall_time,
+                    parents=parents,
+                )
+            )
+
+    def summary(self) -> Dict[str, StageSummary]:
+        """
+        Aggregate the metrics of all stages by name. Note that the metrics of nested stages are also included in the
+        metrics of the enclosing stages.
+
+        Returns:
+            The aggregated metrics per stage name, in order of first completion
+        """
+        summary: Dict[str, StageSummary] = {}
+        for metrics in self.stages:
+            stage_summary = summary.setdefault(metrics.name, StageSummary())
+            stage_summary.count += 1
+            stage_summary.wall_time += metrics.wall_time
+            stage_summary.cpu_time += metrics.cpu_time
+            if metrics.allocated_bytes is not None:
+                stage_summary.allocated_bytes = (stage_summary.allocated_bytes or 0) + metrics.allocated_bytes
+        return summary
+
+    def clear(self) -> None:
+        """
+        Remove the metrics of all completed stages
+        """
+        with self._lock:
+            self._stages = []
+
+    def _start_tracing(self) -> Optional[int]:
+        if not self._trace_memory:
+            return None
+        with self._lock:
+            self._n_traced_stages += 1
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            return tracemalloc.get_traced_memory()[0]
+
+    def _stop_tracing(self) -> None:
+        """
+        Stop tracing memory allocations when the last active stage (in any thread) has been completed, but only if the
+        tracing was started by this instrumentation, so that the rest of the process isn't slowed down
+        """
+        with self._lock:
+            self._n_traced_stages -= 1
+            if self._n_traced_stages == 0 and self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    def _record(self, metrics: StageMetrics) -> None:
+        with self._lock:
+            self._stages.append(metrics)
+        self._log.debug(
+            "Stage completed",
+            stage=metrics.name,
+            wall_time=metrics.wall_time,
+            cpu_time=metrics.cpu_time,
+            allocated_bytes=metrics.allocated_bytes,
+            **metrics.context,
+        )
+        for hook in self._hooks:
+            hook(metrics)
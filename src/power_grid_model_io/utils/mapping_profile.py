@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+Mapping profile: the time spent on each entry of a tabular mapping, e.g. Nodes > node > id > auto_id
+"""
+import json
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from power_grid_model_io.utils.instrumentation import StageMetrics
+
+SORT_KEYS = ("wall_time", "self_time", "calls", "rows", "location")
+
+
+@dataclass
+class MappingProfileEntry:
+    """
+    The aggregated metrics of a single mapping entry
+    """
+
+    location: Tuple[str, ...]
+    """The location of the entry in the mapping, e.g. ("Nodes", "node", "id", "auto_id", "key")"""
+
+    calls: int = 0
+    """The number of times the entry was converted"""
+
+    rows: int = 0
+    """The total number of rows (of the table) that were converted"""
+
+    wall_time: float = 0.0
+    """The total wall time, including the nested entries, in seconds"""
+
+    self_time: float = 0.0
+    """The total wall time, excluding the nested entries, in seconds"""
+
+
+def _labels(name: str, context: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    The labels of a stage in the mapping location
+    """
+    if name == "table":
+        return str(context["table"]), str(context["component"])
+    if name == "attribute":
+        return (str(context["attribute"]),)
+    if name == "col_def":
+        return (str(context["node"]),)
+    return (name,)
+
+
+class MappingProfile:
+    """
+    The time spent on each (table, component, attribute, column definition) of a tabular mapping, based on the
+    stages recorded by a TabularConverter(profile=True):
+
+        converter = TabularConverter(mapping_file=mapping_file, profile=True)
+        converter.load_input_data(data)
+        print(converter.get_profile().to_text(limit=10))
+
+    Note that the nesting of the stages is determined per thread, so nested entries are attributed correctly even if
+    multiple conversions run in parallel.
+    """
+
+    def __init__(self, stages: Iterable[StageMetrics]):
+        """
+        Args:
+            stages: The metrics of the completed stages; stages outside a "table" stage are ignored
+        """
+        self._entries: Dict[Tuple[str, ...], MappingProfileEntry] = {}
+        for metrics in stages:
+            location = self._location(metrics)
+            if location is None:
+                continue
+            entry = self._entries.setdefault(location, MappingProfileEntry(location=location))
+            entry.calls += 1
+            entry.rows += int(metrics.context.get("rows", 0))
+            entry.wall_time += metrics.wall_time
+            entry.self_time += metrics.self_time
+
+    @staticmethod
+    def _location(metrics: StageMetrics) -> Optional[Tuple[str, ...]]:
+        """
+        The location of a stage in the mapping, or None if the stage is not (part of) a "table" stage
+        """
+        if "table" not in metrics.path:
+            return None
+        start = metrics.path.index("table")
+        contexts = metrics.parents + (metrics.context,)
+        location: Tuple[str, ...] = ()
+        for name, context in zip(metrics.path[start:], contexts[start:]):
+            location += _labels(name, context)
+        return location
+
+    @property
+    def entries(self) -> List[MappingProfileEntry]:
+        """
+        The aggregated metrics of all mapping entries, in order of first completion
+        """
+        return list(self._entries.values())
+
+    def sorted_entries(self, sort_by: str = "self_time") -> List[MappingProfileEntry]:
+        """
+        Sort the entries; the most expensive entries first, or alphabetically by location
+
+        Args:
+            sort_by: One of "wall_time", "self_time", "calls", "rows" or "location"
+
+        Returns:
+            The sorted entries
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Invalid sort key '{sort_by}', choose from: {', '.join(SORT_KEYS)}")
+        return sorted(self._entries.values(), key=lambda entry: getattr(entry, sort_by), reverse=sort_by != "location")
+
+    def to_text(self, sort_by: str = "self_time", limit: Optional[int] = None) -> str:
+        """
+        A human readable report, one line per mapping entry
+
+        Args:
+            sort_by: One of "wall_time", "self_time", "calls", "rows" or "location"
+            limit: The maximum number of entries, e.g. only the 10 most expensive entries
+
+        Returns:
+            The report
+        """
+        lines = [f"{'wall time':>11} {'self time':>11} {'calls':>7} {'rows':>10}  mapping entry"]
+        for entry in self.sorted_entries(sort_by=sort_by)[:limit]:
+            lines.append(
+                f"{entry.wall_time:>10.4f}s {entry.self_time:>10.4f}s {entry.calls:>7} {entry.rows:>10}  "
+                + " > ".join(entry.location)
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """
+        The aggregated metrics of all mapping entries, as a list of dictionaries
+        """
+        return [{**asdict(entry), "location": list(entry.location)} for entry in self._entries.values()]
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """
+        The aggregated metrics of all mapping entries, as a json string
+        """
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_folded(self) -> str:
+        """
+        The self time (in microseconds) of each mapping entry, as 'folded stacks', which can be converted to a flame
+        graph by tools like flamegraph.pl or speedscope. Entries without any self time are omitted.
+        """
+        lines = []
+        for entry in self._entries.values():
+            microseconds = round(entry.self_time * 1e6)
+            if microseconds > 0:
+                frames = ";".join(label.replace(";", ":") for label in entry.location)
+                lines.append(f"{frames} {microseconds}")
+        return "\n".join(lines)
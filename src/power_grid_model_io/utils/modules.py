@@ -4,8 +4,9 @@
 """
 Module utilities, expecially useful for loading optional dependencies
 """
+import sys
 from importlib import import_module
-from typing import Callable
+from typing import Any, Callable, List, Mapping, Tuple
 
 
 def get_function(fn_name: str) -> Callable:
@@ -24,3 +25,33 @@ def get_function(fn_name: str) -> Callable:
     except AttributeError as ex:
         raise AttributeError(f"Function '{function_name}' does not exist in module '{module_path}'!") from ex
     return fn_ptr
+
+
+def lazy_attributes(
+    module_name: str, attributes: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Create the module level __getattr__ and __dir__ functions (PEP 562) of a package, so that the (heavy) modules that
+    define the attributes of the package are only imported when the attributes are actually used:
+
+        __getattr__, __dir__ = lazy_attributes(__name__, {"PgmJsonConverter": "...converters.pgm_json_converter"})
+
+    Args:
+        module_name: The name of the package, i.e. __name__
+        attributes: For each attribute name, the name of the module in which it is defined
+
+    Returns:
+        The __getattr__ and __dir__ functions
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'")
+        value = getattr(import_module(attributes[name]), name)
+        setattr(sys.modules[module_name], name, value)  # Next time, the attribute is found without calling __getattr__
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+Utilities to apply (expensive) functions to the unique values of a column only
+"""
+from typing import Any, Callable, List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+
+def apply_unique(
+    values: Union[pd.Series, np.ndarray], fn: Callable[[Any], Sequence[Any]], columns: List[str]
+) -> pd.DataFrame:
+    """
+    Apply a function to each unique value in a column and broadcast the results back to the original rows.
+
+    The values are factorized first, so that the function is called exactly once for each distinct value (in order
+    of appearance). The function should return one value for each of the requested columns.
+
+    Args:
+        values: The (categorical) values, e.g. transformer vector groups
+        fn: The function that parses a single value into a tuple of len(columns) values
+        columns: The names of the resulting columns
+
+    Returns: A DataFrame with one row per value and one column per result value
+    """
+    codes, uniques = pd.factorize(values)
+    if np.any(codes < 0):
+        raise ValueError(f"Missing values are not supported (columns: {', '.join(columns)})")
+    parsed = np.array([fn(value) for value in uniques]).reshape(len(uniques), len(columns))
+    index = values.index if isinstance(values, pd.Series) else None
+    return pd.DataFrame(parsed.take(codes, axis=0), columns=columns, index=index)
@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+Performance benchmarks of the converters, using synthetic grids of 1k up to 1M nodes.
+
+The benchmarks are not part of the unit tests; run them explicitly (without coverage):
+
+    pytest tests/benchmarks --no-cov --bench-sizes=1k,10k,100k,1M
+
+Each benchmark reports the (fastest) wall time and the peak memory. Use --bench-save=baseline.json to store the
+results and --bench-compare=baseline.json (with --bench-tolerance=0.25) to fail on regressions compared to a stored
+baseline, e.g. before and after upgrading a dependency.
+"""
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+Measure the wall time and peak memory of a function and compare the results to a stored baseline
+"""
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The result of a single benchmark; the wall time is the fastest of a number of runs, the peak memory is the maximum
+    amount of memory that was allocated (by Python and NumPy) during a separate run.
+    """
+
+    wall_time: float
+    peak_memory: int
+
+
+def measure(fn: Callable[[], Any], repeat: int = 3) -> BenchmarkResult:
+    """
+    Measure the wall time and the peak memory of a function
+
+    Args:
+        fn: The function to benchmark
+        repeat: The number of (timed) runs
+
+    Returns:
+        The fastest wall time and the peak memory
+    """
+    wall_times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        wall_times.append(time.perf_counter() - start)
+
+    # Memory tracing slows down the function, so the peak memory is measured in a separate run
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(wall_time=min(wall_times), peak_memory=peak_memory)
+
+
+def parse_size(size: str) -> int:
+    """
+    Parse a grid size, e.g. "1000", "10k" or "1M"
+    """
+    size = size.strip()
+    multiplier = {"k": 1_000, "M": 1_000_000}.get(size[-1:], 1)
+    return int(size[:-1] if multiplier > 1 else size) * multiplier
+
+
+def load_results(file_path: Path) -> Dict[str, BenchmarkResult]:
+    """
+    Load benchmark results (e.g. a baseline) from a json file
+    """
+    with file_path.open(mode="r", encoding="utf-8") as file_pointer:
+        return {name: BenchmarkResult(**result) for name, result in json.load(file_pointer).items()}
+
+
+def save_results(results: Dict[str, BenchmarkResult], file_path: Path) -> None:
+    """
+    Store benchmark results in a json file, so they can be used as a baseline later on
+    """
+    with file_path.open(mode="w", encoding="utf-8") as file_pointer:
+        json.dump({name: asdict(result) for name, result in sorted(results.items())}, file_pointer, indent=2)
+
+
+def compare_results(result: BenchmarkResult, baseline: Optional[BenchmarkResult], tolerance: float) -> List[str]:
+    """
+    Compare a benchmark result to the baseline
+
+    Args:
+        result: The current benchmark result
+        baseline: The baseline result, if available
+        tolerance: The relative margin, e.g. 0.25 allows a result to be 25% slower than the baseline
+
+    Returns:
+        A (possibly empty) list of regressions
+    """
+    if baseline is None:
+        return []
+    regressions = []
+    if result.wall_time > baseline.wall_time * (1.0 + tolerance):
+        regressions.append(f"wall time {result.wall_time:.3f}s > baseline {baseline.wall_time:.3f}s")
+    if result.peak_memory > baseline.peak_memory * (1.0 + tolerance):
+        regressions.append(
+            f"peak memory {result.peak_memory / 2**20:.1f}MiB > baseline {baseline.peak_memory / 2**20:.1f}MiB"
+        )
+    return regressions
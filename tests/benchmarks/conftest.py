@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+from .benchmark import BenchmarkResult, compare_results, load_results, measure, parse_size, save_results
+
+RESULTS_KEY = pytest.StashKey[Dict[str, BenchmarkResult]]()
+
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-sizes", default="1k,10k", help="Comma separated grid sizes, e.g. 1k,10k,100k,1M")
+    group.addoption("--bench-repeat", type=int, default=3, help="Number of timed runs per benchmark")
+    group.addoption("--bench-save", type=Path, default=None, help="Store the results in a json file")
+    group.addoption("--bench-compare", type=Path, default=None, help="Compare the results to a json baseline")
+    group.addoption("--bench-tolerance", type=float, default=0.25, help="Allowed relative regression")
+
+
+def pytest_configure(config: pytest.Config):
+    config.stash[RESULTS_KEY] = {}
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    if "n_nodes" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--bench-sizes").split(",")
+        metafunc.parametrize("n_nodes", [parse_size(size) for size in sizes], ids=[size.strip() for size in sizes])
+
+
+@pytest.fixture(scope="session")
+def baseline(request: pytest.FixtureRequest) -> Dict[str, BenchmarkResult]:
+    file_path = request.config.getoption("--bench-compare")
+    return load_results(file_path) if file_path is not None else {}
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest, baseline: Dict[str, BenchmarkResult]) -> Callable[[Callable], Any]:
+    """
+    Measure a function, store the result and fail if it is slower (or uses more memory) than the baseline
+    """
+
+    def run(fn: Callable[[], Any]) -> BenchmarkResult:
+        name = request.node.name
+        result = measure(fn, repeat=request.config.getoption("--bench-repeat"))
+        request.config.stash[RESULTS_KEY][name] = result
+        regressions = compare_results(
+            result, baseline.get(name), tolerance=request.config.getoption("--bench-tolerance")
+        )
+        if regressions:
+            pytest.fail(f"Performance regression in {name}: " + ", ".join(regressions))
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config):
+    results = config.stash.get(RESULTS_KEY, {})
+    if not results:
+        return
+    terminalreporter.section("benchmarks")
+    width = max(len(name) for name in results)
+    terminalreporter.write_line(f"{'name':<{width}} {'wall time':>12} {'peak memory':>14}")
+    for name, result in sorted(results.items()):
+        terminalreporter.write_line(
+            f"{name:<{width}} {result.wall_time:>11.3f}s {result.peak_memory / 2**20:>11.1f}MiB"
+        )
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    file_path = session.config.getoption("--bench-save")
+    results = session.config.stash.get(RESULTS_KEY, {})
+    if file_path is not None and results:
+        save_results(results, file_path)
@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+Synthetic (radial) grids of any size, in Vision, pandapower and power-grid-model format
+
+Each grid consists of n_nodes nodes, one source at the first node, a cable from each other node to a random node with
+a lower number (which results in a radial network) and a load at each other node. The same seed always results in the
+same grid.
+"""
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+import pandapower as pp
+import pandas as pd
+from power_grid_model import initialize_array
+from power_grid_model.data_types import SingleDataset
+
+from power_grid_model_io.data_types import TabularData
+
+U_NOM_KV = 11.0
+SK_NOM_MVA = 1000.0
+
+
+def _random_tree(n_nodes: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate the (zero based) from and to nodes of a random radial network; each node, except for the first node, is
+    connected to a random node that precedes it.
+    """
+    rng = np.random.default_rng(seed)
+    to_nodes = np.arange(1, n_nodes)
+    from_nodes = np.floor(rng.random(n_nodes - 1) * to_nodes).astype(np.int64)
+    return from_nodes, to_nodes
+
+
+def _vision_table(columns: Dict[Tuple[str, str], np.ndarray]) -> pd.DataFrame:
+    return pd.DataFrame(columns)
+
+
+def generate_vision_data(n_nodes: int, seed: int = 0) -> TabularData:
+    """
+    Generate a Vision style grid, i.e. the tables Nodes, Cables, Loads and Sources, with (name, unit) column headers
+
+    Args:
+        n_nodes: The number of nodes in the grid
+        seed: The random seed
+
+    Returns:
+        The grid, as if it was read from a Vision Excel export
+    """
+    from_nodes, to_nodes = _random_tree(n_nodes=n_nodes, seed=seed)
+    numbers = np.arange(1, n_nodes + 1)
+    n_cables = n_nodes - 1
+    length = 0.1 + np.random.default_rng(seed).random(n_cables)
+
+    nodes = _vision_table(
+        {
+            ("Number", ""): numbers,
+            ("Name", ""): np.char.add("node_", numbers.astype(str)),
+            ("ID", ""): np.full(n_nodes, np.nan),
+            ("Unom", "kV"): np.full(n_nodes, U_NOM_KV),
+            ("Simultaneity", ""): np.ones(n_nodes),
+        }
+    )
+    cables = _vision_table(
+        {
+            ("Number", ""): np.arange(1, n_cables + 1),
+            ("Name", ""): np.char.add("cable_", np.arange(1, n_cables + 1).astype(str)),
+            ("ID", ""): np.full(n_cables, np.nan),
+            ("From.Number", ""): numbers[from_nodes],
+            ("From.Switch state", ""): np.full(n_cables, "in", dtype=object),
+            ("To.Number", ""): numbers[to_nodes],
+            ("To.Switch state", ""): np.full(n_cables, "in", dtype=object),
+            ("Inom'", "A"): np.full(n_cables, 300.0),
+            ("R", "Ohm"): 0.2 * length,
+            ("X", "Ohm"): 0.08 * length,
+            ("C", "µF"): 0.3 * length,
+            ("R0", "Ohm"): 0.8 * length,
+            ("X0", "Ohm"): 0.3 * length,
+            ("C0", "µF"): 0.3 * length,
+        }
+    )
+    loads = _vision_table(
+        {
+            ("Subnumber", ""): np.ones(n_cables, dtype=np.int64),
+            ("Name", ""): np.char.add("load_", numbers[1:].astype(str)),
+            ("ID", ""): np.full(n_cables, np.nan),
+            ("Node.Number", ""): numbers[1:],
+            ("Switch state", ""): np.full(n_cables, "in", dtype=object),
+            ("P", "MW"): np.full(n_cables, 0.001),
+            ("Q", "Mvar"): np.full(n_cables, 0.0002),
+            ("Behaviour", ""): np.full(n_cables, "Default", dtype=object),
+        }
+    )
+    sources = _vision_table(
+        {
+            ("Subnumber", ""): np.array([1]),
+            ("Name", ""): np.array(["source_1"]),
+            ("ID", ""): np.array([np.nan]),
+            ("Node.Number", ""): numbers[:1],
+            ("Switch state", ""): np.array(["in"], dtype=object),
+            ("Uref", "pu"): np.array([1.0]),
+            ('Sk"nom', "MVA"): np.array([SK_NOM_MVA]),
+            ("R/X", ""): np.array([0.1]),
+            ("Z0/Z1", ""): np.array([3.0]),
+        }
+    )
+    return TabularData(Nodes=nodes, Cables=cables, Loads=loads, Sources=sources)
+
+
+def write_vision_excel(data: TabularData, file_path: Path) -> None:
+    """
+    Store Vision style data as an Excel file, with the names of the columns in the first row and the units in the
+    second row, like a Vision Excel export.
+
+    Args:
+        data: Vision style data, e.g. generated by generate_vision_data()
+        file_path: The Excel file
+    """
+    with pd.ExcelWriter(path=file_path) as excel_writer:  # pylint: disable=abstract-class-instantiated
+        for sheet_name, sheet_data in data.items():
+            units = pd.DataFrame([sheet_data.columns.get_level_values(1)], columns=range(sheet_data.shape[1]))
+            values = pd.DataFrame(sheet_data.to_numpy(), columns=range(sheet_data.shape[1]))
+            sheet = pd.concat([units.replace("", np.nan), values], ignore_index=True)
+            sheet.columns = sheet_data.columns.get_level_values(0)
+            sheet.to_excel(excel_writer=excel_writer, sheet_name=sheet_name, index=False)
+
+
+def generate_pandapower_net(n_nodes: int, seed: int = 0) -> pp.pandapowerNet:
+    """
+    Generate a pandapower network
+
+    Args:
+        n_nodes: The number of buses in the network
+        seed: The random seed
+
+    Returns:
+        The pandapower network
+    """
+    from_nodes, to_nodes = _random_tree(n_nodes=n_nodes, seed=seed)
+    length = 0.1 + np.random.default_rng(seed).random(n_nodes - 1)
+
+    net = pp.create_empty_network(f_hz=50.0)
+    buses = np.array(pp.create_buses(net, nr_buses=n_nodes, vn_kv=U_NOM_KV))
+    pp.create_lines_from_parameters(
+        net,
+        from_buses=buses[from_nodes],
+        to_buses=buses[to_nodes],
+        length_km=length,
+        r_ohm_per_km=0.2,
+        x_ohm_per_km=0.08,
+        c_nf_per_km=300.0,
+        max_i_ka=0.3,
+    )
+    pp.create_loads(net, buses=buses[1:], p_mw=0.001, q_mvar=0.0002)
+    pp.create_ext_grid(net, bus=buses[0], vm_pu=1.0, s_sc_max_mva=SK_NOM_MVA, rx_max=0.1)
+    return net
+
+
+def generate_pgm_input_data(n_nodes: int, seed: int = 0) -> SingleDataset:
+    """
+    Generate power-grid-model input data
+
+    Args:
+        n_nodes: The number of nodes in the grid
+        seed: The random seed
+
+    Returns:
+        The power-grid-model input data
+    """
+    from_nodes, to_nodes = _random_tree(n_nodes=n_nodes, seed=seed)
+    n_lines = n_nodes - 1
+    length = 0.1 + np.random.default_rng(seed).random(n_lines)
+
+    node = initialize_array("input", "node", n_nodes)
+    node["id"] = np.arange(n_nodes)
+    node["u_rated"] = U_NOM_KV * 1e3
+
+    line = initialize_array("input", "line", n_lines)
+    line["id"] = np.arange(n_nodes, n_nodes + n_lines)
+    line["from_node"] = from_nodes
+    line["to_node"] = to_nodes
+    line["from_status"] = 1
+    line["to_status"] = 1
+    line["r1"] = 0.2 * length
+    line["x1"] = 0.08 * length
+    line["c1"] = 0.3e-6 * length
+    line["tan1"] = 0.0
+    line["i_n"] = 300.0
+
+    sym_load = initialize_array("input", "sym_load", n_lines)
+    sym_load["id"] = np.arange(n_nodes + n_lines, n_nodes + 2 * n_lines)
+    sym_load["node"] = to_nodes
+    sym_load["status"] = 1
+    sym_load["type"] = 0
+    sym_load["p_specified"] = 1e3
+    sym_load["q_specified"] = 200.0
+
+    source = initialize_array("input", "source", 1)
+    source["id"] = n_nodes + 2 * n_lines
+    source["node"] = 0
+    source["status"] = 1
+    source["u_ref"] = 1.0
+    source["sk"] = SK_NOM_MVA * 1e6
+    source["rx_ratio"] = 0.1
+
+    return {"node": node, "line": line, "sym_load": sym_load, "source": source}
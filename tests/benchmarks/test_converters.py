@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from power_grid_model import PowerGridModel
+from power_grid_model.data_types import SingleDataset
+from power_grid_model.utils import export_json_data
+
+from power_grid_model_io.converters.pandapower_converter import PandaPowerConverter
+from power_grid_model_io.converters.pgm_json_converter import PgmJsonConverter
+from power_grid_model_io.converters.tabular_converter import TabularConverter
+from power_grid_model_io.converters.vision_excel_converter import DEFAULT_MAPPING_FILE, VisionExcelConverter
+from power_grid_model_io.data_stores.excel_file_store import ExcelFileStore
+
+from .grid_generator import generate_pandapower_net, generate_pgm_input_data, generate_vision_data, write_vision_excel
+
+MAX_EXCEL_NODES = 100_000  # Excel sheets are limited to 1,048,576 rows (and writing large files takes ages)
+
+vision_data = lru_cache(maxsize=1)(generate_vision_data)
+pandapower_net = lru_cache(maxsize=1)(generate_pandapower_net)
+pgm_input_data = lru_cache(maxsize=1)(generate_pgm_input_data)
+
+
+@lru_cache(maxsize=1)
+def pgm_output_data(n_nodes: int) -> SingleDataset:
+    return PowerGridModel(pgm_input_data(n_nodes)).calculate_power_flow()
+
+
+def test_tabular_converter__load(n_nodes: int, benchmark: Callable):
+    # Arrange
+    data = vision_data(n_nodes)
+    mapping_file = Path(str(DEFAULT_MAPPING_FILE).format(language="en"))
+
+    # Act / Assert
+    benchmark(lambda: TabularConverter(mapping_file=mapping_file).load_input_data(data))
+
+
+def test_tabular_converter__save(n_nodes: int, benchmark: Callable, tmp_path: Path):
+    # Arrange
+    if n_nodes > MAX_EXCEL_NODES:
+        pytest.skip(f"Excel files are only benchmarked up to {MAX_EXCEL_NODES} nodes")
+    data = pgm_input_data(n_nodes)
+    destination = ExcelFileStore(file_path=tmp_path / "input.xlsx")
+
+    # Act / Assert
+    benchmark(lambda: TabularConverter(destination=destination).save(data))
+
+
+def test_vision_excel_converter__load(n_nodes: int, benchmark: Callable, tmp_path: Path):
+    # Arrange
+    if n_nodes > MAX_EXCEL_NODES:
+        pytest.skip(f"Vision Excel files are only benchmarked up to {MAX_EXCEL_NODES} nodes")
+    file_path = tmp_path / "vision.xlsx"
+    write_vision_excel(vision_data(n_nodes), file_path=file_path)
+
+    # Act / Assert
+    benchmark(lambda: VisionExcelConverter(source_file=file_path).load_input_data())
+
+
+def test_pandapower_converter__load(n_nodes: int, benchmark: Callable):
+    # Arrange
+    net = pandapower_net(n_nodes)
+
+    # Act / Assert
+    benchmark(lambda: PandaPowerConverter().load_input_data(net))
+
+
+def test_pandapower_converter__save(n_nodes: int, benchmark: Callable):
+    # Arrange
+    input_data, extra_info = PandaPowerConverter().load_input_data(pandapower_net(n_nodes))
+    output_data = PowerGridModel(input_data).calculate_power_flow()
+
+    # Act / Assert
+    benchmark(lambda: PandaPowerConverter().convert(output_data, extra_info=extra_info))
+
+
+def test_pgm_json_converter__load(n_nodes: int, benchmark: Callable, tmp_path: Path):
+    # Arrange
+    file_path = tmp_path / "input.json"
+    export_json_data(json_file=file_path, data=pgm_input_data(n_nodes), compact=True)
+
+    # Act / Assert
+    benchmark(lambda: PgmJsonConverter(source_file=file_path).load_input_data())
+
+
+def test_pgm_json_converter__save(n_nodes: int, benchmark: Callable, tmp_path: Path):
+    # Arrange
+    data = pgm_output_data(n_nodes)
+    file_path = tmp_path / "output.json"
+
+    # Act / Assert
+    benchmark(lambda: PgmJsonConverter(destination_file=file_path).save(data))
@@ -0,0 +1,242 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+import argparse
+import json
+import logging
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from power_grid_model_io.cli import convert
+from power_grid_model_io.cli.convert import (
+    ConversionOptions,
+    ConversionResult,
+    convert_file,
+    convert_files,
+    create_converter,
+    expand_paths,
+    load_source,
+    run,
+)
+from power_grid_model_io.converters.pandapower_converter import PandaPowerConverter
+from power_grid_model_io.converters.pgm_json_converter import PgmJsonConverter
+from power_grid_model_io.converters.tabular_converter import TabularConverter
+from power_grid_model_io.converters.vision_excel_converter import VisionExcelConverter
+
+PGM_JSON_FILE = Path(__file__).parents[2] / "data" / "vision" / "pgm_input_data_en.json"
+MAPPING_FILE = Path(__file__).parents[2] / "data" / "config" / "mapping.yaml"
+
+
+@pytest.fixture
+def source_files(tmp_path: Path):
+    (tmp_path / "src" / "sub").mkdir(parents=True)
+    files = [tmp_path / "src" / "a.json", tmp_path / "src" / "sub" / "b.json"]
+    for file_path in files:
+        shutil.copy(PGM_JSON_FILE, file_path)
+    return files
+
+
+def test_expand_paths(tmp_path: Path, source_files):
+    # Act
+    paths = expand_paths([str(tmp_path / "src" / "**" / "*.json"), str(source_files[0]), "missing.json"])
+
+    # Assert
+    assert paths == [source_files[0], source_files[1], Path("missing.json")]
+
+
+def test_create_converter(tmp_path: Path):
+    # Act / Assert
+    assert isinstance(create_converter(ConversionOptions("vision", tmp_path)), VisionExcelConverter)
+    assert isinstance(create_converter(ConversionOptions("tabular", tmp_path, MAPPING_FILE)), TabularConverter)
+    assert isinstance(create_converter(ConversionOptions("pandapower", tmp_path)), PandaPowerConverter)
+    assert isinstance(create_converter(ConversionOptions("pgm_json", tmp_path)), PgmJsonConverter)
+    with pytest.raises(ValueError, match="A mapping file is required"):
+        create_converter(ConversionOptions("tabular", tmp_path))
+    with pytest.raises(ValueError, match="Invalid converter type 'foo'"):
+        create_converter(ConversionOptions("foo", tmp_path))
+
+
+@pytest.mark.parametrize(
+    ("converter_type", "target"),
+    [
+        ("vision", "power_grid_model_io.data_stores.VisionExcelFileStore"),
+        ("tabular", "power_grid_model_io.data_stores.ExcelFileStore"),
+        ("pgm_json", "power_grid_model_io.data_stores.JsonFileStore"),
+    ],
+)
+def test_load_source(converter_type: str, target: str, tmp_path: Path):
+    # Arrange
+    options = ConversionOptions(converter_type, tmp_path)
+
+    # Act
+    with patch(target) as store:
+        data = load_source(options=options, file_path=Path("grid.file"))
+
+    # Assert
+    store.assert_called_once_with(file_path=Path("grid.file"))
+    assert data is store.return_value.load.return_value
+
+
+@patch("power_grid_model_io.cli.convert.get_function")
+def test_load_source__pandapower(get_function: MagicMock, tmp_path: Path):
+    # Act
+    data = load_source(options=ConversionOptions("pandapower", tmp_path), file_path=Path("net.json"))
+
+    # Assert
+    get_function.assert_called_once_with("pandapower.from_json")
+    get_function.return_value.assert_called_once_with("net.json")
+    assert data is get_function.return_value.return_value
+
+
+def test_convert_file(tmp_path: Path, source_files):
+    # Arrange
+    options = ConversionOptions("pgm_json", tmp_path / "out")
+    converter = MagicMock()
+    converter.__deepcopy__ = MagicMock(return_value=PgmJsonConverter())
+
+    # Act
+    result = convert_file(converter=converter, options=options, file_path=source_files[0])
+
+    # Assert
+    assert result.ok
+    assert result.destination == tmp_path / "out" / "a.json"
+    converter.load_input_data.assert_not_called()  # the converter itself is not used, but a copy
+    with result.destination.open(encoding="utf-8") as file_pointer:
+        assert json.load(file_pointer) == json.loads(PGM_JSON_FILE.read_text(encoding="utf-8"))
+
+
+def test_convert_file__error(tmp_path: Path):
+    # Arrange
+    options = ConversionOptions("pgm_json", tmp_path / "out")
+
+    # Act
+    result = convert_file(converter=PgmJsonConverter(), options=options, file_path=tmp_path / "missing.json")
+
+    # Assert
+    assert not result.ok
+    assert result.error is not None and result.error.startswith("FileNotFoundError: ")
+    assert not result.destination.exists()
+
+
+@patch("power_grid_model_io.cli.convert.structlog")
+def test_convert_files(mock_structlog: MagicMock, tmp_path: Path, source_files):
+    # Arrange
+    options = ConversionOptions("pgm_json", tmp_path / "out")
+    progress = MagicMock()
+
+    # Act
+    results = convert_files(
+        file_paths=source_files + [tmp_path / "c.json"], options=options, progress=progress, log_level=logging.WARNING
+    )
+
+    # Assert
+    mock_structlog.make_filtering_bound_logger.assert_called_once_with(logging.WARNING)
+    mock_structlog.configure.assert_called_once()
+    assert [result.ok for result in results] == [True, True, False]
+    assert [call.args[:2] for call in progress.call_args_list] == [(1, 3), (2, 3), (3, 3)]
+    assert (tmp_path / "out" / "a.json").exists()
+    assert (tmp_path / "out" / "b.json").exists()
+
+
+def test_convert_files__workers(tmp_path: Path, source_files):
+    # Arrange
+    options = ConversionOptions("pgm_json", tmp_path / "out")
+
+    # Act
+    results = convert_files(file_paths=source_files, options=options, workers=2, log_level=logging.WARNING)
+
+    # Assert
+    assert sorted(result.destination.name for result in results if result.ok) == ["a.json", "b.json"]
+
+
+def test_convert_files__duplicate_destinations(tmp_path: Path):
+    # Arrange
+    options = ConversionOptions("pgm_json", tmp_path / "out")
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="Multiple source files would be converted to: .*a.json"):
+        convert_files(file_paths=[tmp_path / "a.json", tmp_path / "sub" / "a.json"], options=options)
+
+
+@patch("power_grid_model_io.cli.convert.structlog")
+def test_worker(mock_structlog: MagicMock, tmp_path: Path, source_files):
+    # Arrange
+    options = ConversionOptions("pgm_json", tmp_path / "out")
+
+    # Act
+    try:
+        convert._init_worker(options=options, log_level=logging.INFO)
+        result = convert._convert_file_in_worker(options=options, file_path=source_files[0])
+    finally:
+        convert._WORKER_CONVERTER = None
+
+    # Assert
+    mock_structlog.make_filtering_bound_logger.assert_called_once_with(logging.INFO)
+    assert result.ok
+
+
+@patch("power_grid_model_io.cli.convert.convert_files")
+def test_run(mock_convert_files: MagicMock, tmp_path: Path, capsys):
+    # Arrange
+    args = argparse.Namespace(
+        files=["a.json"], converter_type="pgm_json", output_dir=tmp_path, mapping_file=None, language="en", workers=4
+    )
+    args.verbose = False
+    results = [
+        ConversionResult(source=Path("a.json"), destination=tmp_path / "a.json", wall_time=1.0),
+        ConversionResult(source=Path("b.json"), destination=tmp_path / "b.json", wall_time=1.0, error="KeyError: 'x'"),
+    ]
+
+    def fake_convert_files(file_paths, options, workers, progress, log_level):
+        for i, result in enumerate(results):
+            progress(i + 1, len(results), result)
+        return results
+
+    mock_convert_files.side_effect = fake_convert_files
+
+    # Act
+    exit_code = run(args)
+
+    # Assert
+    assert exit_code == 1
+    kwargs = mock_convert_files.call_args.kwargs
+    assert kwargs["file_paths"] == [Path("a.json")]
+    assert kwargs["options"] == ConversionOptions("pgm_json", tmp_path)
+    assert kwargs["workers"] == 4
+    assert kwargs["log_level"] == logging.WARNING
+    stderr = capsys.readouterr().err.splitlines()
+    assert stderr[0] == f"[1/2] a.json -> {tmp_path / 'a.json'} (1.00s)"
+    assert stderr[1] == "[2/2] b.json FAILED: KeyError: 'x'"
+    assert stderr[2] == "Converted 1 of 2 files"
+
+
+@patch("power_grid_model_io.cli.convert.convert_files")
+def test_run__success(mock_convert_files: MagicMock, tmp_path: Path):
+    # Arrange
+    args = argparse.Namespace(
+        files=[], converter_type="vision", output_dir=tmp_path, mapping_file=None, language="nl", workers=1
+    )
+    args.verbose = True
+    mock_convert_files.return_value = []
+
+    # Act
+    exit_code = run(args)
+
+    # Assert
+    assert exit_code == 0
+    assert mock_convert_files.call_args.kwargs["log_level"] == logging.DEBUG
+
+
+def test_run__missing_mapping_file(tmp_path: Path, capsys):
+    # Arrange
+    args = argparse.Namespace(files=[], converter_type="tabular", output_dir=tmp_path, mapping_file=None)
+
+    # Act
+    exit_code = run(args)
+
+    # Assert
+    assert exit_code == 2
+    assert "--mapping" in capsys.readouterr().err
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from power_grid_model_io.cli.main import main
+
+
+@patch("power_grid_model_io.cli.convert.run")
+def test_main__convert(mock_run: MagicMock):
+    # Arrange
+    mock_run.return_value = 0
+
+    # Act
+    exit_code = main(["convert", "--type", "tabular", "-m", "mapping.yaml", "-o", "out", "-w", "3", "a.xlsx", "*.xls"])
+
+    # Assert
+    assert exit_code == 0
+    args = mock_run.call_args.args[0]
+    assert args.files == ["a.xlsx", "*.xls"]
+    assert args.converter_type == "tabular"
+    assert args.mapping_file == Path("mapping.yaml")
+    assert args.output_dir == Path("out")
+    assert args.workers == 3
+    assert args.language == "en"
+    assert not args.verbose
+
+
+def test_main__no_command():
+    # Act / Assert
+    with pytest.raises(SystemExit):
+        main([])
@@ -2,13 +2,16 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+import asyncio
 from typing import Dict, List
-from unittest.mock import ANY, MagicMock
+from unittest.mock import ANY, AsyncMock, MagicMock
 
 import numpy as np
 import pytest
 
 from power_grid_model_io.converters.base_converter import BaseConverter
+from power_grid_model_io.data_types import ExtraInfoTable
+from power_grid_model_io.utils.instrumentation import Instrumentation
 
 
 class DummyConverter(BaseConverter[Dict[str, List[Dict[str, int]]]]):
@@ -54,6 +57,23 @@ def test_load_input_data__dict(converter: DummyConverter):
     assert extra_info == {1: "Foo"}
 
 
+def test_load_input_data__columnar_extra_info(converter: DummyConverter):
+    # Arrange
+    def add_extra_info(data, data_type, extra_info):
+        extra_info.add(ids=[1], columns={"name": "Foo"})
+        return {"foo": 1}
+
+    converter._parse_data.side_effect = add_extra_info  # type: ignore
+
+    # Act
+    data, extra_info = converter.load_input_data(data={"node": [{"id": 1}]}, columnar_extra_info=True)
+
+    # Assert
+    assert data == {"foo": 1}
+    assert isinstance(extra_info, ExtraInfoTable)
+    assert extra_info.to_lookup() == {1: {"name": "Foo"}}
+
+
 def test_load_input_data__list(converter: DummyConverter):
     # Arrange
     converter._parse_data.return_value = []  # type: ignore
@@ -130,6 +150,59 @@ def test_save_data(converter: DummyConverter):
     destination2.save.assert_called_once()
 
 
+def test_aload_input_data(converter: DummyConverter):
+    # Arrange
+    source = MagicMock()
+    source.aload = AsyncMock(return_value={"node": [{"id": 1}]})
+    converter._source = source
+    converter._parse_data.return_value = {"foo": 1}  # type: ignore
+
+    # Act
+    data, extra_info = asyncio.run(converter.aload_input_data(columnar_extra_info=True))
+
+    # Assert
+    source.aload.assert_awaited_once()
+    source.load.assert_not_called()
+    converter._parse_data.assert_called_once_with(  # type: ignore
+        data={"node": [{"id": 1}]}, data_type="input", extra_info=ANY
+    )
+    assert data == {"foo": 1}
+    assert isinstance(extra_info, ExtraInfoTable)
+
+
+def test_aload_input_data__data(converter: DummyConverter):
+    # Arrange
+    converter._parse_data.return_value = {"foo": 1}  # type: ignore
+
+    # Act
+    data, extra_info = asyncio.run(converter.aload_input_data(data={"node": [{"id": 1}]}))
+
+    # Assert
+    assert data == {"foo": 1}
+    assert extra_info == {}
+
+
+def test_asave(converter: DummyConverter):
+    # No destination supplied
+    with pytest.raises(ValueError, match="No destination supplied!"):
+        asyncio.run(converter.asave(data={"foo": np.array([1])}))
+
+    # Destination supplied as argument
+    destination = MagicMock()
+    destination.asave = AsyncMock()
+    asyncio.run(converter.asave(data={"foo": np.array([1])}, destination=destination))
+    destination.asave.assert_awaited_once_with(data={"node": [{"id": 1}, {"id": 2}]})
+    destination.save.assert_not_called()
+
+    # Destination supplied at instantiation
+    destination2 = MagicMock()
+    destination2.asave = AsyncMock()
+    converter_2 = DummyConverter(destination=destination2)
+    converter_2._serialize_data = MagicMock()
+    asyncio.run(converter_2.asave(data={"foo": np.array([1])}))
+    destination2.asave.assert_awaited_once()
+
+
 def test_load_data(converter: DummyConverter):
     # No data supplied
     with pytest.raises(ValueError, match="No data supplied!"):
@@ -142,3 +215,27 @@ def test_load_data(converter: DummyConverter):
     converter_2 = DummyConverter(source=source)
     converter_2._load_data(data=None)
     source.load.assert_called_once()
+
+
+def test_instrumentation(converter: DummyConverter):
+    # Arrange
+    source = MagicMock()
+    destination = MagicMock()
+    converter._source = source
+    instrumentation = Instrumentation()
+    converter.set_instrumentation(instrumentation)
+
+    # Act
+    converter.load_input_data()
+    converter.load_update_data()
+    converter.save(data={"foo": np.array([1])}, destination=destination)
+
+    # Assert
+    assert [(metrics.name, metrics.context) for metrics in instrumentation.stages] == [
+        ("store_load", {"store": "MagicMock"}),
+        ("parse", {"data_type": "input"}),
+        ("store_load", {"store": "MagicMock"}),
+        ("parse", {"data_type": "update"}),
+        ("serialize", {}),
+        ("store_save", {"store": "MagicMock"}),
+    ]
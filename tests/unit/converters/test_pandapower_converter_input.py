@@ -2,7 +2,8 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
-from typing import Callable
+import threading
+from typing import Callable, Tuple
 from unittest.mock import ANY, MagicMock, call, patch
 
 import numpy as np
@@ -11,7 +12,8 @@ import pandas as pd
 import pytest
 from power_grid_model import Branch3Side, BranchSide, LoadGenType, WindingType, initialize_array
 
-from power_grid_model_io.converters.pandapower_converter import PandaPowerConverter
+from power_grid_model_io.converters.pandapower_converter import PandaPowerConverter, _run_concurrently, _sort_components
+from power_grid_model_io.data_types import ExtraInfoTable
 
 from ...utils import MockDf, MockFn, assert_struct_array_equal
 
@@ -135,6 +137,200 @@ def test_parse_data__update_data():
         converter._parse_data(data={}, data_type="update", extra_info=None)
 
 
+def test_parse_data__unknown_data_type():
+    # Arrange
+    converter = PandaPowerConverter()
+
+    # Act/Assert
+    with pytest.raises(ValueError, match="not implemented"):
+        converter._parse_data(data={}, data_type="sym_output", extra_info=None)
+
+
+@patch("power_grid_model_io.converters.pandapower_converter.PandaPowerConverter._create_input_data")
+def test_parse_data__snapshot(create_input_data_mock: MagicMock):
+    # Arrange
+    converter = PandaPowerConverter(incremental=True)
+    bus = pd.DataFrame([[110.0]], columns=["vn_kv"])
+
+    # Act
+    converter._parse_data(data={"bus": bus, "foo": pd.DataFrame()}, data_type="input", extra_info=None)
+
+    # Assert
+    assert list(converter.pp_input_snapshot.keys()) == ["bus"]
+    assert converter.pp_input_snapshot["bus"] is not bus
+    pd.testing.assert_frame_equal(converter.pp_input_snapshot["bus"], bus)
+
+
+@patch("power_grid_model_io.converters.pandapower_converter.PandaPowerConverter._create_input_data")
+def test_parse_data__no_snapshot(create_input_data_mock: MagicMock):
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.pp_input_snapshot = {"bus": pd.DataFrame()}
+
+    # Act
+    converter._parse_data(data={"bus": pd.DataFrame([[110.0]], columns=["vn_kv"])}, data_type="input")
+
+    # Assert
+    assert converter.pp_input_snapshot == {}
+
+
+def test_create_update_data__not_incremental(pp_update_net: pp.pandapowerNet):
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.load_input_data(pp_update_net)
+
+    # Act/Assert
+    with pytest.raises(ValueError, match="incremental=True"):
+        converter.load_update_data(pp_update_net)
+
+
+@pytest.fixture
+def pp_update_net() -> pp.pandapowerNet:
+    #  (ext #1) - [0] -/- [1] ----- [2] - (load #5)
+    #                               -/-
+    #                               [3]
+    net = pp.create_empty_network()
+    pp.create_buses(net, nr_buses=4, vn_kv=10.0)
+    pp.create_ext_grid(net, index=1, bus=0)
+    pp.create_line_from_parameters(
+        net,
+        index=2,
+        from_bus=0,
+        to_bus=1,
+        length_km=1.0,
+        r_ohm_per_km=0.1,
+        x_ohm_per_km=0.1,
+        c_nf_per_km=10.0,
+        max_i_ka=1.0,
+    )
+    pp.create_line_from_parameters(
+        net,
+        index=3,
+        from_bus=1,
+        to_bus=2,
+        length_km=1.0,
+        r_ohm_per_km=0.1,
+        x_ohm_per_km=0.1,
+        c_nf_per_km=10.0,
+        max_i_ka=1.0,
+    )
+    pp.create_load(net, index=5, bus=2, p_mw=1.0, q_mvar=0.1)
+    pp.create_switch(net, index=7, bus=0, element=2, et="l", closed=True)
+    pp.create_switch(net, index=8, bus=2, element=3, et="b", closed=True)
+    return net
+
+
+def test_create_update_data(pp_update_net: pp.pandapowerNet):
+    # Arrange
+    converter = PandaPowerConverter(incremental=True)
+    input_data, _ = converter.load_input_data(pp_update_net)
+    line_ids = input_data["line"]["id"].copy()
+    pp_update_net.load.loc[5, "p_mw"] = 2.0
+    pp_update_net.switch.loc[7, "closed"] = False
+    pp_update_net.switch.loc[8, "closed"] = False
+
+    # Act
+    update_data = converter.load_update_data(pp_update_net)
+
+    # Assert
+    assert set(update_data.keys()) == {"line", "link", "sym_load"}
+    assert_struct_array_equal(update_data["line"], [{"id": line_ids[0], "from_status": 0, "to_status": 1}])
+    assert_struct_array_equal(
+        update_data["link"], [{"id": converter.get_id("switch", 8, "bus_to_bus"), "from_status": 0, "to_status": 0}]
+    )
+    assert_struct_array_equal(
+        update_data["sym_load"],
+        [{"id": converter.get_id("load", 5, "const_power"), "status": 1, "p_specified": 2e6, "q_specified": 1e5}],
+    )
+
+    # The input data is patched, while the ids are kept
+    np.testing.assert_array_equal(converter.pgm_input_data["line"]["id"], line_ids)
+    np.testing.assert_array_equal(converter.pgm_input_data["line"]["from_status"], [0, 1])
+    np.testing.assert_array_equal(converter.pgm_input_data["link"]["from_status"], [0])
+    assert converter.pgm_input_data["sym_load"]["p_specified"][0] == 2e6
+
+    # The edited network is the new reference
+    assert converter.load_update_data(pp_update_net) == {}
+
+
+@pytest.mark.parametrize("drop_links", [False, True])
+def test_create_update_data__no_bus_bus_switches(pp_update_net: pp.pandapowerNet, drop_links: bool):
+    # Arrange
+    pp_update_net.switch.drop(index=8, inplace=True)
+    converter = PandaPowerConverter(incremental=True)
+    input_data, _ = converter.load_input_data(pp_update_net)
+    assert input_data["link"].size == 0
+    if drop_links:
+        del converter.pgm_input_data["link"]
+    pp_update_net.switch.loc[7, "closed"] = False
+
+    # Act
+    update_data = converter.load_update_data(pp_update_net)
+
+    # Assert
+    assert set(update_data.keys()) == {"line"}
+    assert_struct_array_equal(
+        update_data["line"], [{"id": input_data["line"]["id"][0], "from_status": 0, "to_status": 1}]
+    )
+
+
+def test_create_update_data__no_input_data():
+    # Arrange
+    converter = PandaPowerConverter(incremental=True)
+
+    # Act/Assert
+    with pytest.raises(ValueError, match="after the input data has been converted"):
+        converter._create_update_data(data={})
+
+
+def test_create_update_data__added_objects(pp_update_net: pp.pandapowerNet):
+    # Arrange
+    converter = PandaPowerConverter(incremental=True)
+    converter.load_input_data(pp_update_net)
+    pp.create_load(pp_update_net, bus=1, p_mw=1.0)
+
+    # Act/Assert
+    with pytest.raises(ValueError, match="added to or removed from 'load'"):
+        converter.load_update_data(pp_update_net)
+
+
+def test_create_update_data__fixed_attributes(pp_update_net: pp.pandapowerNet):
+    # Arrange
+    converter = PandaPowerConverter(incremental=True)
+    converter.load_input_data(pp_update_net)
+    converter._log = MagicMock()
+    pp_update_net.bus.loc[1, "vn_kv"] = 20.0
+
+    # Act
+    update_data = converter.load_update_data(pp_update_net)
+
+    # Assert
+    assert update_data == {}
+    np.testing.assert_array_equal(converter.pgm_input_data["node"]["u_rated"], [10e3, 20e3, 10e3, 10e3])
+    converter._log.warning.assert_called_once_with(ANY, component="node", attributes=["u_rated"])
+
+
+def test_differs():
+    # Arrange
+    old_values = np.array([[1.0, np.nan], [2.0, np.nan], [3.0, 4.0]])
+    new_values = np.array([[1.0, np.nan], [2.0, 3.0], [3.0, 5.0]])
+
+    # Act
+    actual = PandaPowerConverter._differs(old_values, new_values)
+
+    # Assert
+    np.testing.assert_array_equal(actual, [False, True, True])
+
+
+@pytest.mark.parametrize("shape", [(0,), (0, 3)])
+def test_differs__empty(shape: Tuple[int, ...]):
+    # Act
+    actual = PandaPowerConverter._differs(np.empty(shape), np.empty(shape))
+
+    # Assert
+    assert actual.shape == (0,)
+
+
 def test_fill_extra_info():
     # Arrange
     converter = PandaPowerConverter()
@@ -164,6 +360,40 @@ def test_fill_extra_info():
     assert extra_info[7] == {"from_node": 1, "to_node": 2}
 
 
+def test_fill_extra_info__table():
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.idx_lookup[("bus", None)] = pd.Series([101, 102], index=[0, 1])
+    converter.pgm_input_data["line"] = initialize_array("input", "line", 1)
+    converter.pgm_input_data["line"]["id"] = [2]
+    converter.pgm_input_data["line"]["from_node"] = [0]
+    converter.pgm_input_data["line"]["to_node"] = [1]
+    extra_info = ExtraInfoTable()
+
+    # Act
+    converter._fill_extra_info(extra_info=extra_info)
+
+    # Assert
+    assert extra_info.to_lookup() == {
+        0: {"id_reference": {"table": "bus", "index": 101}},
+        1: {"id_reference": {"table": "bus", "index": 102}},
+        2: {"from_node": 0, "to_node": 1},
+    }
+
+
+def test_fill_extra_info__existing_extra_info():
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.idx_lookup[("bus", None)] = pd.Series([101], index=[0])
+    extra_info = {0: {"name": "foo"}}
+
+    # Act
+    converter._fill_extra_info(extra_info=extra_info)
+
+    # Assert
+    assert extra_info == {0: {"name": "foo", "id_reference": {"table": "bus", "index": 101}}}
+
+
 @patch("power_grid_model_io.converters.pandapower_converter.PandaPowerConverter._extra_info_to_idx_lookup")
 @patch("power_grid_model_io.converters.pandapower_converter.PandaPowerConverter._extra_info_to_pgm_input_data")
 @patch("power_grid_model_io.converters.pandapower_converter.PandaPowerConverter._create_output_data")
@@ -201,7 +431,7 @@ def test_serialize_data__extra_info(
     # Arrange
     converter = PandaPowerConverter()
 
-    extra_info = MagicMock("extra_info")
+    extra_info = ExtraInfoTable()
 
     # Act
     converter._serialize_data(data={}, extra_info=extra_info)
@@ -212,6 +442,29 @@ def test_serialize_data__extra_info(
     extra_info_to_idx_lookup_mock.assert_called_once_with(extra_info)
 
 
+@patch("power_grid_model_io.converters.pandapower_converter.PandaPowerConverter._extra_info_to_idx_lookup")
+@patch("power_grid_model_io.converters.pandapower_converter.PandaPowerConverter._extra_info_to_pgm_input_data")
+@patch("power_grid_model_io.converters.pandapower_converter.PandaPowerConverter._create_output_data")
+def test_serialize_data__extra_info_lookup(
+    create_output_data_mock: MagicMock,
+    extra_info_pgm_input_data_mock: MagicMock,
+    extra_info_to_idx_lookup_mock: MagicMock,
+):
+    # Arrange
+    converter = PandaPowerConverter()
+    extra_info = {1: {"id_reference": {"table": "bus", "index": 101}}}
+
+    # Act
+    converter._serialize_data(data={}, extra_info=extra_info)
+
+    # Assert
+    create_output_data_mock.assert_called_once_with()
+    (table,) = extra_info_to_idx_lookup_mock.call_args.args
+    assert isinstance(table, ExtraInfoTable)
+    assert table.to_lookup() == extra_info
+    extra_info_pgm_input_data_mock.assert_called_once_with(table)
+
+
 def test_extra_info_to_idx_lookup():
     # Arrange
     converter = PandaPowerConverter()
@@ -227,7 +480,7 @@ def test_extra_info_to_idx_lookup():
     }
 
     # Act
-    converter._extra_info_to_idx_lookup(extra_info=extra_info)
+    converter._extra_info_to_idx_lookup(extra_info=ExtraInfoTable.from_lookup(extra_info))
 
     # Assert
     pd.testing.assert_series_equal(converter.idx[("bus", None)], pd.Series([0, 1, 2], index=[101, 102, 103]))
@@ -254,7 +507,7 @@ def test_extra_info_to_pgm_input_data():
     }
 
     # Act
-    converter._extra_info_to_pgm_input_data(extra_info=extra_info)
+    converter._extra_info_to_pgm_input_data(extra_info=ExtraInfoTable.from_lookup(extra_info))
 
     # Assert
     assert "node" not in converter.pgm_input_data
@@ -264,16 +517,64 @@ def test_extra_info_to_pgm_input_data():
     )
 
 
+def test_extra_info_to_pgm_input_data__missing_extra_info():
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.pgm_output_data["line"] = initialize_array("sym_output", "line", 2)
+    converter.pgm_output_data["line"]["id"] = [12, 23]
+    extra_info = ExtraInfoTable.from_lookup({12: {"from_node": 1}})
+
+    # Act
+    converter._extra_info_to_pgm_input_data(extra_info=extra_info)
+
+    # Assert
+    nan = np.iinfo(np.int32).min
+    np.testing.assert_array_equal(converter.pgm_input_data["line"]["id"], [12, 23])
+    np.testing.assert_array_equal(converter.pgm_input_data["line"]["from_node"], [1, nan])
+    np.testing.assert_array_equal(converter.pgm_input_data["line"]["to_node"], [nan, nan])
+
+
+def test_extra_info_to_idx_lookup__no_id_references():
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.idx = {("bus", None): pd.Series(dtype=np.int64)}
+
+    # Act
+    converter._extra_info_to_idx_lookup(extra_info=ExtraInfoTable.from_lookup({6: {"from_node": 0}}))
+
+    # Assert
+    assert converter.idx == {}
+    assert converter.idx_lookup == {}
+
+
+def test_extra_info_to_idx_lookup__without_names():
+    # Arrange
+    converter = PandaPowerConverter()
+    extra_info = ExtraInfoTable.from_lookup({0: {"id_reference": {"table": "bus", "index": 101}}})
+
+    # Act
+    converter._extra_info_to_idx_lookup(extra_info=extra_info)
+
+    # Assert
+    assert list(converter.idx) == [("bus", None)]
+    pd.testing.assert_series_equal(converter.idx_lookup[("bus", None)], pd.Series([101], index=[0]))
+
+
 def test_create_input_data():
     # Arrange
     converter = MagicMock()
+    converter.max_workers = None
+    converter.pgm_input_data = {}
 
     # Act
     PandaPowerConverter._create_input_data(self=converter)  # type: ignore
 
     # Assert
-    assert len(converter.method_calls) == 18
+    assert len(converter.method_calls) == 21
     converter._create_pgm_input_nodes.assert_called_once_with()
+    converter._get_pgm_input_blocks.assert_called_once_with()
+    converter._reserve_ids.assert_called_once_with(converter._get_pgm_input_blocks.return_value)
+    converter._allocate_sym_loads.assert_called_once_with(converter._get_pgm_input_blocks.return_value)
     converter._create_pgm_input_lines.assert_called_once_with()
     converter._create_pgm_input_sources.assert_called_once_with()
     converter._create_pgm_input_sym_loads.assert_called_once_with()
@@ -293,6 +594,163 @@ def test_create_input_data():
     converter._create_pgm_input_dclines.assert_called_once_with()
 
 
+def test_create_input_data__ids():
+    # Arrange
+    pp_net: pp.pandapowerNet = pp.create_empty_network()
+    pp.create_buses(net=pp_net, nr_buses=2, vn_kv=10.0)
+    pp.create_load(pp_net, bus=0, p_mw=1.0)
+    pp.create_ward(pp_net, bus=1, ps_mw=1.0, qs_mvar=0.0, pz_mw=0.0, qz_mvar=0.0)
+    pp.create_ext_grid(pp_net, bus=0)
+    pp.create_switch(pp_net, bus=0, element=1, et="b")
+    pp.create_motor(pp_net, bus=1, pn_mech_mw=1.0, cos_phi=0.9)
+
+    # Act
+    concurrent = PandaPowerConverter(max_workers=None)._parse_data(data=pp_net, data_type="input")
+    serial = PandaPowerConverter()._parse_data(data=pp_net, data_type="input")
+
+    # Assert: the ids are generated in the same order as the components would be converted one by one
+    np.testing.assert_array_equal(concurrent["node"]["id"], [0, 1])
+    np.testing.assert_array_equal(concurrent["source"]["id"], [2])
+    np.testing.assert_array_equal(concurrent["sym_load"]["id"], [3, 4, 5, 7, 8, 9])
+    np.testing.assert_array_equal(concurrent["link"]["id"], [6])
+    for component, data in concurrent.items():
+        assert_struct_array_equal(data, serial[component])
+
+
+def test_create_input_data__component_order():
+    # Arrange
+    pp_net: pp.pandapowerNet = pp.create_empty_network()
+    pp.create_buses(net=pp_net, nr_buses=3, vn_kv=10.0)
+    pp.create_ext_grid(pp_net, bus=0)
+    pp.create_line_from_parameters(
+        pp_net, from_bus=0, to_bus=1, length_km=1.0, r_ohm_per_km=0.1, x_ohm_per_km=0.1, c_nf_per_km=10.0, max_i_ka=1.0
+    )
+    pp.create_transformer(pp_net, hv_bus=1, lv_bus=2, std_type="0.25 MVA 10/0.4 kV")
+    pp_net.trafo["vector_group"] = "Dyn5"
+    pp.create_load(pp_net, bus=2, p_mw=0.1)
+    pp.create_sgen(pp_net, bus=2, p_mw=0.1)
+    pp.create_shunt(pp_net, bus=2, q_mvar=0.1)
+    pp.create_switch(pp_net, bus=0, element=1, et="b")
+    pp.create_asymmetric_load(pp_net, bus=2)
+    pp.create_asymmetric_sgen(pp_net, bus=2)
+    expected = [
+        "node",
+        "line",
+        "source",
+        "sym_load",
+        "shunt",
+        "transformer",
+        "sym_gen",
+        "link",
+        "asym_load",
+        "asym_gen",
+    ]
+
+    # Act
+    serial = list(PandaPowerConverter()._parse_data(data=pp_net, data_type="input"))
+    concurrent = [
+        list(PandaPowerConverter(max_workers=None)._parse_data(data=pp_net, data_type="input")) for _ in range(10)
+    ]
+
+    # Assert
+    assert serial == expected
+    assert all(order == expected for order in concurrent)
+
+
+def test_create_input_data__compact_loads():
+    # Arrange
+    pp_net: pp.pandapowerNet = pp.create_empty_network()
+    pp.create_bus(net=pp_net, vn_kv=10.0)
+    pp.create_load(pp_net, bus=0, p_mw=1.0, const_z_percent=20.0)
+    pp.create_load(pp_net, bus=0, p_mw=2.0)
+    pp.create_ext_grid(pp_net, bus=0)
+    converter = PandaPowerConverter(compact_loads=True)
+
+    # Act
+    pgm_input_data = converter._parse_data(data=pp_net, data_type="input")
+
+    # Assert
+    sym_loads = pgm_input_data["sym_load"]
+    np.testing.assert_array_equal(sym_loads["id"], [2, 3, 4])
+    np.testing.assert_array_equal(
+        sym_loads["type"], [LoadGenType.const_power, LoadGenType.const_power, LoadGenType.const_impedance]
+    )
+    np.testing.assert_array_almost_equal(sym_loads["p_specified"], [0.8e6, 2.0e6, 0.2e6])
+    np.testing.assert_array_equal(pgm_input_data["source"]["id"], [1])
+    assert converter.idx[("load", "const_impedance")].to_dict() == {0: 4}
+    assert converter.idx[("load", "const_current")].empty
+
+
+def test_create_update_data__compact_loads_percentage_to_zero():
+    # Arrange
+    pp_net: pp.pandapowerNet = pp.create_empty_network()
+    pp.create_bus(net=pp_net, vn_kv=10.0)
+    pp.create_load(pp_net, bus=0, p_mw=1.0, const_z_percent=20.0)
+    pp.create_ext_grid(pp_net, bus=0)
+    converter = PandaPowerConverter(incremental=True, compact_loads=True)
+    converter.load_input_data(pp_net)
+    pp_net.load.loc[0, "const_z_percent"] = 0.0
+
+    # Act
+    update_data = converter.load_update_data(pp_net)
+
+    # Assert
+    assert_struct_array_equal(
+        update_data["sym_load"],
+        [
+            {"id": 2, "status": 1, "p_specified": 1e6, "q_specified": 0.0},
+            {"id": 3, "status": 1, "p_specified": 0.0, "q_specified": 0.0},
+        ],
+    )
+    np.testing.assert_array_almost_equal(converter.pgm_input_data["sym_load"]["p_specified"], [1e6, 0.0])
+
+
+def test_create_update_data__compact_loads_percentage_from_zero():
+    # Arrange
+    pp_net: pp.pandapowerNet = pp.create_empty_network()
+    pp.create_bus(net=pp_net, vn_kv=10.0)
+    pp.create_load(pp_net, bus=0, p_mw=1.0, const_z_percent=20.0)
+    pp.create_load(pp_net, bus=0, p_mw=2.0)
+    pp.create_ext_grid(pp_net, bus=0)
+    converter = PandaPowerConverter(incremental=True, compact_loads=True)
+    converter.load_input_data(pp_net)
+    pp_net.load.loc[1, "const_i_percent"] = 10.0
+
+    # Act / Assert
+    with pytest.raises(ValueError, match=r"const_i_percent of load\(s\) \[1\] changed from zero to non-zero"):
+        converter.load_update_data(pp_net)
+
+
+def test_run_concurrently__serial():
+    # Arrange
+    calls = []
+
+    # Act
+    _run_concurrently([lambda: calls.append(threading.get_ident()), lambda: calls.append("second")], max_workers=1)
+
+    # Assert
+    assert calls == [threading.get_ident(), "second"]
+
+
+def test_sort_components():
+    # Act / Assert
+    assert list(_sort_components({"x": 1, "line": 2, "node": 3}, order=["node", "line"])) == ["node", "line", "x"]
+
+
+def test_run_concurrently():
+    # Arrange
+    calls = []
+
+    def fail(message: str):
+        calls.append(message)
+        raise ValueError(message)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="first"):
+        _run_concurrently([lambda: calls.append("ok"), lambda: fail("first"), lambda: fail("second")])
+    assert sorted(calls) == ["first", "ok", "second"]
+
+
 @pytest.mark.parametrize(
     ("create_fn", "table"),
     [
@@ -469,10 +927,7 @@ def test_create_pgm_input_sym_loads(mock_init_array: MagicMock, two_pp_objs, con
     pgm_attr = ["id", "node", "status", "p_specified", "q_specified", "type"]
     pgm = {attr: MagicMock() for attr in pgm_attr}
     mock_init_array.return_value = pgm
-    slices = [slice(None, 2), slice(2, 4), slice(-2, None)]
-    assert slices[0].indices(3 * 2) == (0, 2, 1)
-    assert slices[1].indices(3 * 2) == (2, 4, 1)
-    assert slices[2].indices(3 * 2) == (4, 6, 1)
+    slices = [slice(0, 2), slice(2, 4), slice(4, 6)]
 
     # Act
     converter._create_pgm_input_sym_loads()
@@ -1064,9 +1519,7 @@ def test_create_pgm_input_wards(mock_init_array: MagicMock, two_pp_objs, convert
     pgm_attr = ["id", "node", "status", "p_specified", "q_specified", "type"]
     pgm = {attr: MagicMock() for attr in pgm_attr}
     mock_init_array.return_value = pgm
-    slices = [slice(None, 2), slice(-2, None)]
-    assert slices[0].indices(2 * 2) == (0, 2, 1)
-    assert slices[1].indices(2 * 2) == (2, 4, 1)
+    slices = [slice(0, 2), slice(2, 4)]
 
     # Act
     converter._create_pgm_input_wards()
@@ -1160,6 +1613,9 @@ def test_create_pgm_input_dclines(mock_init_array: MagicMock, two_pp_objs, conve
 def test_create_pgm_input_motors(mock_init_array: MagicMock, two_pp_objs, converter):
     # Arrange
     converter.pp_input_data["motor"] = two_pp_objs
+    pgm_attr = ["id", "node", "status", "p_specified", "q_specified", "type"]
+    pgm = {attr: MagicMock() for attr in pgm_attr}
+    mock_init_array.return_value = pgm
 
     # Act
     converter._create_pgm_input_motors()
@@ -1183,17 +1639,11 @@ def test_create_pgm_input_motors(mock_init_array: MagicMock, two_pp_objs, conver
     assert len(converter._get_pp_attr.call_args_list) == 7
 
     # assignment:
-    pgm: MagicMock = mock_init_array.return_value.__setitem__
-    pgm.assert_any_call("id", ANY)
-    pgm.assert_any_call("node", ANY)
-    pgm.assert_any_call("status", ANY)
-    pgm.assert_any_call("p_specified", ANY)
-    pgm.assert_any_call("q_specified", ANY)
-    pgm.assert_any_call("type", ANY)
-    assert len(pgm.call_args_list) == 6
+    for attr in pgm_attr:
+        pgm[attr].__setitem__.assert_called_once_with(slice(0, 2), ANY)
 
     # result
-    assert converter.pgm_input_data["sym_load"] == mock_init_array.return_value
+    assert converter.pgm_input_data["sym_load"] == pgm
 
 
 def test_create_pgm_input_motors__existing_loads():
@@ -1282,6 +1732,36 @@ def test_generate_ids():
     np.testing.assert_array_equal(pgm_idx_actual, pgm_idx_expected)
 
 
+def test_generate_ids__reserved_ids():
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.next_idx = 10
+    converter._reserved_ids = {("test_table", None): 3}
+
+    # Act
+    pgm_idx_actual = converter._generate_ids("test_table", pd.Index([11, 12]))
+
+    # Assert
+    assert converter.next_idx == 10
+    assert not converter._reserved_ids
+    np.testing.assert_array_equal(pgm_idx_actual, [3, 4])
+
+
+def test_generate_ids__reuse_ids():
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.idx = {("test_table", None): pd.Series([1, 2, 3], index=[11, 12, 13])}
+    converter.next_idx = 4
+    converter._reuse_ids = True
+
+    # Act
+    pgm_idx_actual = converter._generate_ids("test_table", pd.Index([13, 11]))
+
+    # Assert
+    assert converter.next_idx == 4
+    np.testing.assert_array_equal(pgm_idx_actual, [3, 1])
+
+
 def test_get_pgm_ids():
     # Arrange
     converter = PandaPowerConverter()
@@ -1675,3 +2155,52 @@ def test_get_pp_attr_use_default():
 
     # Assert
     np.testing.assert_array_equal(actual, expected)
+
+
+def test_get_pp_attr_no_copy():
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.pp_input_data = {"bus": pd.DataFrame([[110.0], [20.0]], columns=["vn_kv"])}
+
+    # Act
+    actual = converter._get_pp_attr("bus", "vn_kv", 10.0)
+
+    # Assert
+    np.testing.assert_array_equal(actual, [110.0, 20.0])
+    assert np.shares_memory(actual, converter.pp_input_data["bus"]["vn_kv"].to_numpy())
+
+
+def test_get_pp_attr_fill_missing_values():
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.pp_input_data = {
+        "line": pd.DataFrame([[1.0, True], [np.nan, None]], columns=["parallel", "in_service"]),
+    }
+
+    # Act
+    parallel = converter._get_pp_attr("line", "parallel", 1)
+    in_service = converter._get_pp_attr("line", "in_service", True)
+
+    # Assert
+    np.testing.assert_array_equal(parallel, [1.0, 1.0])
+    np.testing.assert_array_equal(in_service, [True, True])
+    assert np.isnan(converter.pp_input_data["line"]["parallel"][1])
+    assert converter.pp_input_data["line"]["in_service"][1] is None
+
+
+def test_get_pp_attr_missing_values_without_default():
+    # Arrange
+    converter = PandaPowerConverter()
+    converter.pp_input_data = {
+        "trafo": pd.DataFrame([[1.0, "hv"], [np.nan, None]], columns=["tap_pos", "tap_side"]),
+    }
+
+    # Act
+    tap_pos = converter._get_pp_attr("trafo", "tap_pos", np.nan)
+    tap_side = converter._get_pp_attr("trafo", "tap_side")
+
+    # Assert
+    np.testing.assert_array_equal(tap_pos, [1.0, np.nan])
+    np.testing.assert_array_equal(tap_side, ["hv", None])
+    with pytest.raises(ValueError, match="Missing 'tap_pos' values for 'trafo'"):
+        converter._get_pp_attr("trafo", "tap_pos")
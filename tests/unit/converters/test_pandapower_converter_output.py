@@ -24,6 +24,8 @@ def converter() -> PandaPowerConverter:
 def test_create_output_data():
     # Arrange
     converter = MagicMock()
+    converter.max_workers = None
+    converter.pp_output_data = {}
 
     # Act
     PandaPowerConverter._create_output_data(self=converter)  # type: ignore
@@ -9,7 +9,7 @@ from power_grid_model.data_types import BatchDataset, SingleDataset
 from structlog.testing import capture_logs
 
 from power_grid_model_io.converters.pgm_json_converter import PgmJsonConverter
-from power_grid_model_io.data_types import ExtraInfoLookup
+from power_grid_model_io.data_types import ExtraInfoLookup, ExtraInfoTable
 
 from ...utils import assert_log_match
 
@@ -112,6 +112,18 @@ def test_parse_component(converter: PgmJsonConverter, structured_input_data):
         converter._parse_component(objects=objects[0], component=component, data_type="input", extra_info=None)
 
 
+def test_parse_component__extra_info_table(converter: PgmJsonConverter, structured_input_data):
+    # Arrange
+    objects = list(structured_input_data.values())
+    extra_info = ExtraInfoTable()
+
+    # Act
+    converter._parse_component(objects=objects[0], component="node", data_type="input", extra_info=extra_info)
+
+    # Assert
+    assert extra_info.to_lookup() == {2: {"some_extra_info": 2.1}}
+
+
 def test_serialize_data(converter: PgmJsonConverter, pgm_input_data: SingleDataset, pgm_batch_data: BatchDataset):
     structured_single_data = converter._serialize_data(data=pgm_input_data, extra_info=None)
     assert structured_single_data == {"node": [{"id": 1}, {"id": 2}]}
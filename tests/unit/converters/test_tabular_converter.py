@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Tuple
 from unittest.mock import MagicMock, call, patch
 
 import numpy as np
@@ -13,9 +13,13 @@ from power_grid_model import initialize_array, power_grid_meta_data
 from power_grid_model.data_types import SingleDataset
 
 from power_grid_model_io.converters.tabular_converter import TabularConverter
-from power_grid_model_io.data_types import ExtraInfoLookup, TabularData
-from power_grid_model_io.mappings.tabular_mapping import InstanceAttributes
+from power_grid_model_io.data_stores.csv_dir_store import CsvDirStore
+from power_grid_model_io.data_types import ExtraInfoLookup, ExtraInfoTable, TabularData
+from power_grid_model_io.mappings.multiplier_mapping import MultiplierMapping
+from power_grid_model_io.mappings.tabular_mapping import InstanceAttributes, TabularMapping
 from power_grid_model_io.mappings.unit_mapping import UnitMapping
+from power_grid_model_io.mappings.value_mapping import ValueMapping
+from power_grid_model_io.utils.instrumentation import Instrumentation
 
 MAPPING_FILE = Path(__file__).parents[2] / "data" / "config" / "mapping.yaml"
 
@@ -214,6 +218,31 @@ def test_convert_col_def_to_attribute(
         )
 
 
+@patch("power_grid_model_io.converters.tabular_converter.TabularConverter._parse_col_def")
+def test_convert_col_def_to_attribute__const(
+    mock_parse_col_def: MagicMock,
+    converter: TabularConverter,
+    tabular_data_no_units_no_substitutions: TabularData,
+    pgm_line_empty: SingleDataset,
+):
+    # Act
+    for attr, col_def in (("tan1", 0), ("r1", 0.25)):
+        converter._convert_col_def_to_attribute(
+            data=tabular_data_no_units_no_substitutions,
+            pgm_data=pgm_line_empty["line"],
+            table="lines",
+            component="line",
+            attr=attr,
+            col_def=col_def,
+            extra_info=None,
+        )
+
+    # Assert
+    mock_parse_col_def.assert_not_called()
+    np.testing.assert_array_equal(pgm_line_empty["line"]["tan1"], [0.0, 0.0])
+    np.testing.assert_array_equal(pgm_line_empty["line"]["r1"], [0.25, 0.25])
+
+
 def test_handle_extra_info(converter: TabularConverter, tabular_data_no_units_no_substitutions: TabularData):
     uuids = np.array([0, 1])
     # possible to call function with extra_info = None
@@ -244,6 +273,442 @@ def test_handle_extra_info__units(converter: TabularConverter, tabular_data: Tab
     assert extra_info == {0: {"u_nom": 10500.0}, 1: {"u_nom": 400.0}}
 
 
+def test_handle_extra_info__none_values(converter: TabularConverter):
+    # Arrange
+    data = TabularData(nodes=pd.DataFrame({"name": ["a", None, np.nan], "rating": [1.5, np.nan, 2.5]}))
+    extra_info: ExtraInfoLookup = {1: {"name": "z"}}
+
+    # Act
+    converter._handle_extra_info(
+        data=data, table="nodes", col_def=["name", "rating"], uuids=np.array([0, 1, 2]), extra_info=extra_info
+    )
+
+    # Assert: like before, only NaN values are skipped; None values are kept
+    assert extra_info == {0: {"name": "a", "rating": 1.5}, 1: {"name": None}, 2: {"rating": 2.5}}
+
+
+def test_handle_extra_info__table(converter: TabularConverter, tabular_data_no_units_no_substitutions: TabularData):
+    # Arrange
+    uuids = np.array([0, 1])
+    extra_info = ExtraInfoTable()
+    extra_info.add(ids=[0], columns={"some_value": "some_key"})
+
+    # Act
+    converter._handle_extra_info(
+        data=tabular_data_no_units_no_substitutions, table="nodes", col_def="u_nom", uuids=uuids, extra_info=extra_info
+    )
+
+    # Assert
+    assert extra_info.to_lookup() == {
+        0: {"some_value": "some_key", "u_nom": 10500.0},
+        1: {"u_nom": 400.0},
+    }
+
+
+def test_parse_col_def_arrays(converter: TabularConverter):
+    # Arrange
+    nodes = np.array([(1, 10.5, 10.5e3), (2, 0.4, 400.0)], dtype=[("id", "i4"), ("u_kv", "f8"), ("u_nom", "f8")])
+    data = TabularData(nodes=nodes, frame=pd.DataFrame(nodes), plain=np.array([1, 2]))
+    converter._multipliers = MultiplierMapping({"u_kv": 1000.0})
+
+    # Act
+    arrays = converter._parse_col_def_arrays(data=data, table="nodes", col_def=["id", "u_rms | u_kv"])
+
+    # Assert
+    assert arrays is not None
+    assert [name for name, _ in arrays] == ["id", "u_kv"]
+    np.testing.assert_array_equal(arrays[0][1], [1, 2])
+    np.testing.assert_array_equal(arrays[1][1], [10.5e3, 400.0])
+    assert converter._parse_col_def_arrays(data=data, table="nodes", col_def="u_rms") is None
+    assert converter._parse_col_def_arrays(data=data, table="nodes", col_def=1.0) is None
+    assert converter._parse_col_def_arrays(data=data, table="nodes", col_def=["id", {"a": "b"}]) is None
+    assert converter._parse_col_def_arrays(data=data, table="plain", col_def="id") is None
+
+
+def test_parse_col_def_arrays__data_frame(converter: TabularConverter, tabular_data: TabularData):
+    # Arrange
+    assert converter._units is not None
+    tabular_data.set_unit_multipliers(converter._units)
+    converter._multipliers = MultiplierMapping({"id_number": 10})
+
+    # Act
+    arrays = converter._parse_col_def_arrays(data=tabular_data, table="nodes", col_def=["id_number", "index", "u_nom"])
+
+    # Assert
+    assert arrays is not None
+    assert [name for name, _ in arrays] == ["id_number", "index", "u_nom"]
+    np.testing.assert_array_equal(arrays[0][1], [10, 20])
+    np.testing.assert_array_equal(arrays[1][1], [0, 1])
+    np.testing.assert_array_equal(arrays[2][1], [10.5e3, 0.4e3])
+    assert converter._parse_col_def_arrays(data=tabular_data, table="nodes", col_def="inf") is None
+
+
+@pytest.mark.parametrize(
+    "col_def",
+    [
+        1.0,
+        "inf",
+        {"auto_id": {"key": "id"}},
+        {"reference": {"query_column": "id", "other_table": "nodes", "key_column": "id", "value_column": "u_kv"}},
+        {"multiply": ["u_kv", "u_nom"]},
+        {"power_grid_model_io.functions.value_or_zero": {"value": "u_kv"}},
+        ["id", {"multiply": ["u_kv", "u_nom"]}],
+    ],
+)
+def test_parse_col_def_arrays__pandas_fallback(converter: TabularConverter, col_def: Any):
+    # Arrange
+    nodes = np.array([(1, 10.5, 10.5e3), (2, 0.4, 400.0)], dtype=[("id", "i4"), ("u_kv", "f8"), ("u_nom", "f8")])
+    data = TabularData(nodes=nodes)
+
+    # Act
+    arrays = converter._parse_col_def_arrays(data=data, table="nodes", col_def=col_def)
+
+    # Assert
+    assert arrays is None
+    assert len(converter._parse_col_def(data=data, table="nodes", col_def=col_def, extra_info={})) == 2
+
+
+@pytest.mark.parametrize(
+    ("attributes", "substitutions", "multipliers", "identity"),
+    [
+        ({"id": "id", "u_rated": "u_rated"}, None, None, True),
+        ({"id": "id", "u_rated": "u_rated"}, {"id": {1: 2}}, {"u_nom": 2.0}, False),
+        ({"id": "id", "u_rated": "u_rated"}, {"x": {1: 2}}, {"u_rated": 2.0}, False),
+        ({"id": "id", "u_rated": "u_rated"}, {"x": {1: 2}}, {"x": 2.0}, True),
+        ({"id": "id", "u_rated": 400.0}, None, None, False),
+        ({"id": "id"}, None, None, False),
+    ],
+)
+def test_convert_table_to_component__identity(
+    converter: TabularConverter, attributes: InstanceAttributes, substitutions, multipliers, identity: bool
+):
+    # Arrange
+    nodes = initialize_array("input", "node", 2)
+    nodes["id"] = [1, 2]
+    nodes["u_rated"] = [10.5e3, 400.0]
+    converter._substitutions = None if substitutions is None else ValueMapping(substitutions)
+    converter._multipliers = None if multipliers is None else MultiplierMapping(multipliers)
+
+    # Act
+    result = converter._convert_table_to_component(
+        data=TabularData(nodes=nodes, frame=pd.DataFrame(nodes)),
+        data_type="input",
+        table="nodes",
+        component="node",
+        attributes=attributes,
+        extra_info=None,
+    )
+
+    # Assert
+    assert (result is nodes) == identity
+    assert result is not None and result.dtype == nodes.dtype
+
+
+def test_parse_data__instrumentation(converter: TabularConverter, tabular_data: TabularData):
+    # Arrange
+    instrumentation = Instrumentation()
+    converter.set_instrumentation(instrumentation)
+    converter._mapping = TabularMapping(
+        {"nodes": {"node": {"id": {"auto_id": {"key": "id_number"}}, "u_rated": "u_nom", "extra": "u_nom"}}}
+    )
+
+    # Act
+    converter.load_input_data(data=tabular_data)
+
+    # Assert
+    assert [(metrics.path, metrics.context) for metrics in instrumentation.stages] == [
+        (("parse", "table", "auto_id"), {"table": "nodes", "ref_table": "nodes", "rows": 2}),
+        (("parse", "table", "extra_info", "unit_conversion"), {"table": "nodes", "field": "u_nom"}),
+        (("parse", "table", "extra_info"), {"table": "nodes", "component": "node"}),
+        (("parse", "table", "unit_conversion"), {"table": "nodes", "field": "u_nom"}),
+        (("parse", "table"), {"table": "nodes", "component": "node", "rows": 2}),
+        (("parse", "merge"), {}),
+        (("parse",), {"data_type": "input"}),
+    ]
+
+
+def test_get_profile(tabular_data: TabularData):
+    # Arrange
+    converter = TabularConverter(mapping_file=MAPPING_FILE, profile=True)
+    converter._mapping = TabularMapping(
+        {
+            "nodes": {"node": {"id": {"auto_id": {"key": "id_number"}}, "u_rated": "u_nom", "extra": ["u_nom", 1.0]}},
+            "loads": {
+                "sym_load": {
+                    "id": {"auto_id": {"key": "id_number"}},
+                    "node": {
+                        "reference": {
+                            "other_table": "nodes",
+                            "query_column": "node_id",
+                            "key_column": "id_number",
+                            "value_column": "id_number",
+                        }
+                    },
+                    "status": {"expr": "switching_status * 1"},
+                    "type": 0,
+                    "p_specified": {"multiply": ["id_number", 1.0]},
+                    "q_specified": {"power_grid_model_io.functions.value_or_zero": {"value": "id_number"}},
+                }
+            },
+        }
+    )
+
+    # Act
+    converter.load_input_data(data=tabular_data)
+    profile = converter.get_profile()
+
+    # Assert
+    locations = [entry.location for entry in profile.entries]
+    assert ("nodes", "node") in locations
+    assert ("nodes", "node", "id", "auto_id", "key", "id_number") in locations
+    assert ("nodes", "node", "u_rated") in locations
+    assert ("nodes", "node", "extra", "extra_info", "u_nom", "unit_conversion") in locations
+    assert ("nodes", "node", "extra", "extra_info", "1.0") in locations
+    assert ("loads", "sym_load", "node", "reference") in locations
+    assert ("loads", "sym_load", "status", "expr") in locations
+    assert ("loads", "sym_load", "type", "0") in locations
+    assert ("loads", "sym_load", "p_specified", "multiply", "1.0") in locations
+    assert ("loads", "sym_load", "q_specified", "power_grid_model_io.functions.value_or_zero", "id_number") in locations
+    auto_id = next(entry for entry in profile.entries if entry.location == ("nodes", "node", "id", "auto_id"))
+    assert (auto_id.calls, auto_id.rows) == (1, 2)
+    assert auto_id.self_time <= auto_id.wall_time
+    constant = next(entry for entry in profile.entries if entry.location == ("loads", "sym_load", "type", "0"))
+    assert (constant.calls, constant.rows) == (1, len(tabular_data["loads"]))
+
+
+def test_get_profile__disabled(converter: TabularConverter):
+    # Arrange
+    converter.set_instrumentation(Instrumentation())
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="Profiling is not enabled"):
+        converter.get_profile()
+
+
+def test_parse_data__numpy(converter: TabularConverter):
+    # Arrange
+    nodes = np.array([(1, 10.5e3, "a"), (2, 400.0, "b")], dtype=[("id_number", "i4"), ("u_nom", "f8"), ("name", "U8")])
+    frames = TabularData(nodes=pd.DataFrame(nodes))
+    arrays = TabularData(nodes=nodes)
+    converter._mapping = TabularMapping(
+        {"nodes": {"node": {"id": "id_number", "u_rated": "u_nom", "extra": ["name", "u_nom"]}}}
+    )
+    converter._units = None
+    frames_extra_info: ExtraInfoLookup = {}
+    arrays_extra_info: ExtraInfoLookup = {}
+
+    # Act
+    with patch.object(TabularData, "get_column", wraps=arrays.get_column) as get_column:
+        result = converter._parse_data(data=arrays, data_type="input", extra_info=arrays_extra_info)
+    expected = converter._parse_data(data=frames, data_type="input", extra_info=frames_extra_info)
+
+    # Assert
+    get_column.assert_not_called()
+    np.testing.assert_array_equal(result["node"], expected["node"])
+    assert (
+        arrays_extra_info == frames_extra_info == {1: {"name": "a", "u_nom": 10.5e3}, 2: {"name": "b", "u_nom": 400.0}}
+    )
+
+
+CHUNKED_MAPPING = {
+    "nodes": {
+        "node": {
+            "id": {"auto_id": {"key": "id_number"}},
+            "u_rated": "u_nom",
+            "extra": [
+                "id_number",
+                {
+                    "reference": {
+                        "other_table": "areas",
+                        "query_column": "area",
+                        "key_column": "code",
+                        "value_column": "name",
+                    }
+                },
+            ],
+        }
+    },
+    "lines": {
+        "line": {
+            "id": {"auto_id": {"key": "id_number"}},
+            "from_node": {"auto_id": {"table": "nodes", "key": {"id_number": "from_node_side"}}},
+            "to_node": {"auto_id": {"table": "nodes", "key": {"id_number": "to_node_side"}}},
+            "from_status": 1,
+            "to_status": 1,
+            "extra": ["index"],
+        }
+    },
+}
+
+
+@pytest.fixture
+def chunked_store(tmp_path: Path) -> CsvDirStore:
+    store = CsvDirStore(tmp_path / "csv")
+    store.save(
+        TabularData(
+            nodes=pd.DataFrame(
+                {"id_number": [1, 2, 3, 4, 5], "u_nom": [10.5e3, 400.0, 400.0, 400.0, 400.0], "area": list("abacb")}
+            ),
+            lines=pd.DataFrame({"id_number": [1, 2, 3], "from_node_side": [1, 2, 3], "to_node_side": [2, 3, 5]}),
+            areas=pd.DataFrame({"code": ["a", "b", "c"], "name": ["North", "South", "East"]}),
+        )
+    )
+    return store
+
+
+@pytest.mark.parametrize("columnar_extra_info", [False, True])
+def test_load_input_data_in_chunks(chunked_store: CsvDirStore, columnar_extra_info: bool):
+    # Arrange
+    converter = TabularConverter()
+    converter._mapping = TabularMapping(CHUNKED_MAPPING)
+    reference = TabularConverter()
+    reference._mapping = TabularMapping(CHUNKED_MAPPING)
+    expected, expected_extra_info = reference.load_input_data(
+        data=chunked_store.load(), columnar_extra_info=columnar_extra_info
+    )
+
+    # Act
+    result, extra_info = converter.load_input_data_in_chunks(
+        source=chunked_store, chunk_size=2, reference_tables=["areas"], columnar_extra_info=columnar_extra_info
+    )
+
+    # Assert
+    assert result.keys() == expected.keys()
+    for component, component_data in expected.items():
+        for attr in component_data.dtype.names:
+            np.testing.assert_array_equal(result[component][attr], component_data[attr])
+    np.testing.assert_array_equal(result["line"]["to_node"], [1, 2, 4])
+    if isinstance(extra_info, ExtraInfoTable):
+        assert isinstance(expected_extra_info, ExtraInfoTable)
+        extra_info, expected_extra_info = extra_info.to_lookup(), expected_extra_info.to_lookup()
+    assert extra_info == expected_extra_info
+    assert extra_info[0]["name"] == "North"
+    assert extra_info[7]["index"] == 2
+
+
+def test_load_input_data__columnar_extra_info_equivalence():
+    # Arrange
+    mapping = {
+        "nodes": {
+            "node": {"id": {"auto_id": {"key": "id_number"}}, "u_rated": 400.0, "extra": ["id_number", "rating"]}
+        },
+        "lines": {
+            "line": {
+                "id": {"auto_id": {"key": "id_number"}},
+                "from_node": {"auto_id": {"table": "nodes", "key": "from_node_side"}},
+                "to_node": {"auto_id": {"table": "nodes", "key": "to_node_side"}},
+                "extra": ["id_number", "rating"],
+            },
+        },
+    }
+    data = TabularData(
+        nodes=pd.DataFrame({"id_number": [1, 2], "rating": [10, 20]}),
+        lines=pd.DataFrame({"id_number": [3], "from_node_side": [1], "to_node_side": [2], "rating": [np.nan]}),
+    )
+
+    def typed(lookup):
+        return {
+            pgm_id: {key: (type(value).__name__, value) for key, value in extra.items()}
+            for pgm_id, extra in lookup.items()
+        }
+
+    converters = [TabularConverter(), TabularConverter()]
+    for converter in converters:
+        converter._mapping = TabularMapping(mapping)
+
+    # Act
+    _, extra_info = converters[0].load_input_data(data=data)
+    _, columnar_extra_info = converters[1].load_input_data(data=data, columnar_extra_info=True)
+
+    # Assert
+    assert isinstance(columnar_extra_info, ExtraInfoTable)
+    assert typed(columnar_extra_info.to_lookup()) == typed(extra_info)
+    assert typed(extra_info)[0]["rating"] == ("int", 10)
+    assert "rating" not in extra_info[2]
+
+
+def test_load_input_data_in_chunks__memmap(chunked_store: CsvDirStore, tmp_path: Path):
+    # Arrange
+    converter = TabularConverter()
+    converter._mapping = TabularMapping(CHUNKED_MAPPING)
+
+    # Act
+    result, _ = converter.load_input_data_in_chunks(
+        source=chunked_store, chunk_size=2, reference_tables=["areas"], memmap_dir=tmp_path
+    )
+
+    # Assert
+    assert isinstance(result["node"], np.memmap)
+    assert (tmp_path / "node.bin").exists()
+    np.testing.assert_array_equal(result["node"]["id"], [0, 1, 2, 3, 4])
+    np.testing.assert_array_equal(result["line"]["id"], [5, 6, 7])
+
+
+def test_load_input_data_in_chunks__missing_and_empty_tables(converter: TabularConverter):
+    # Arrange
+    source = MagicMock()
+    source.table_names.return_value = ["nodes"]
+    source.table_columns.return_value = ["id_number", "u_nom", "name"]
+    source.load_chunks.return_value = [pd.DataFrame(columns=["id_number", "u_nom"])]
+
+    # Act
+    result, extra_info = converter.load_input_data_in_chunks(source=source)
+
+    # Assert
+    source.table_columns.assert_called_once_with("nodes")
+    source.load_chunks.assert_called_once_with(table_name="nodes", chunk_size=100_000, columns=["id_number", "u_nom"])
+    source.load_table.assert_not_called()
+    assert result == {}
+    assert extra_info == {}
+
+
+def test_load_input_data_in_chunks__index_only(chunked_store: CsvDirStore):
+    # Arrange
+    converter = TabularConverter()
+    converter._mapping = TabularMapping({"nodes": {"node": {"id": {"auto_id": {"key": "index"}}, "u_rated": 400.0}}})
+
+    # Act
+    result, _ = converter.load_input_data_in_chunks(source=chunked_store, chunk_size=2)
+
+    # Assert
+    np.testing.assert_array_equal(result["node"]["id"], [0, 1, 2, 3, 4])
+    np.testing.assert_array_equal(result["node"]["u_rated"], [400.0] * 5)
+
+
+def test_get_column_projection():
+    # Arrange
+    source = MagicMock()
+    source.table_columns.return_value = ["id_number", "u_nom"]
+
+    # Act / Assert
+    assert TabularConverter._get_column_projection(source, "nodes", {"u_nom", "index", "area"}) == ["area", "u_nom"]
+    assert TabularConverter._get_column_projection(source, "nodes", {"index"}) == ["id_number"]
+    assert TabularConverter._get_column_projection(source, "nodes", None) == ["id_number"]
+    source.table_columns.return_value = []
+    assert TabularConverter._get_column_projection(source, "nodes", {"index"}) is None
+
+
+def test_load_input_data_in_chunks__missing_columns(chunked_store: CsvDirStore):
+    # Arrange
+    converter = TabularConverter()
+    converter._mapping = TabularMapping(
+        {"nodes": {"node": {"id": "id_number", "u_rated": "u_rated | u_nom", "extra": ["name", "area"]}}}
+    )
+
+    # Act / Assert
+    with pytest.raises(KeyError, match="Missing columns: 'nodes': 'name'"):
+        converter.load_input_data_in_chunks(source=chunked_store)
+
+
+def test_required_columns(converter: TabularConverter):
+    # Act
+    columns = converter.required_columns()
+
+    # Assert
+    assert columns["nodes"] == {"id_number", "u_nom"}
+    assert converter.missing_columns({"nodes": ["id_number"]}) == {"nodes": ["u_nom"]}
+
+
 def test_merge_pgm_data(converter: TabularConverter):
     nodes_1 = initialize_array("input", "node", 2)
     nodes_1["id"] = [0, 1]
@@ -260,9 +725,6 @@ def test_merge_pgm_data(converter: TabularConverter):
 def test_serialize_data(converter: TabularConverter, pgm_node_empty: SingleDataset):
     with pytest.raises(NotImplementedError, match=r"Extra info can not \(yet\) be stored for tabular data"):
         converter._serialize_data(data=pgm_node_empty, extra_info={})
-    with pytest.raises(NotImplementedError, match=r"Batch data can not \(yet\) be stored for tabular data"):
-        converter._serialize_data(data=[], extra_info=None)  # type: ignore
-
     pgm_node_empty["node"]["id"] = [1, 2]
     pgm_node_empty["node"]["u_rated"] = [3.0, 4.0]
     tabular_data = converter._serialize_data(data=pgm_node_empty, extra_info=None)
@@ -409,6 +871,81 @@ def test_parse_reference(converter: TabularConverter, tabular_data_no_units_no_s
     assert_frame_equal(df_lines_from_node_long, pd.DataFrame([400.0, 10.5e3], columns=["u_nom"]))
 
 
+def test_parse_reference__missing_key(converter: TabularConverter):
+    # Arrange
+    nodes = pd.DataFrame(data=[[1, 7], [2, 8]], columns=["id_number", "u_nom"])
+    lines = pd.DataFrame(data=[[2], [3], [1]], columns=["from_node_side"])
+    data = TabularData(nodes=nodes, lines=lines)
+
+    # Act
+    result = converter._parse_reference(
+        data=data,
+        table="lines",
+        other_table="nodes",
+        query_column="from_node_side",
+        key_column="id_number",
+        value_column="u_nom",
+    )
+
+    # Assert
+    assert_frame_equal(result, pd.DataFrame([8.0, np.nan, 7.0], columns=["u_nom"]))
+
+
+def test_parse_reference__multi_column_keys(converter: TabularConverter):
+    # Arrange
+    nodes = pd.DataFrame(
+        data=[[1, "a", 10.5e3], [1, "b", 400.0], [2, "a", 20.0e3]], columns=["id_number", "sub", "u_nom"]
+    )
+    lines = pd.DataFrame(data=[[2, "a"], [1, "b"], [1, "a"]], columns=["from_node_side", "from_sub"])
+    data = TabularData(nodes=nodes, lines=lines)
+
+    # Act
+    result = converter._parse_reference(
+        data=data,
+        table="lines",
+        other_table="nodes",
+        query_column=["from_node_side", "from_sub"],
+        key_column=["id_number", "sub"],
+        value_column="u_nom",
+    )
+
+    # Assert
+    assert_frame_equal(result, pd.DataFrame([20.0e3, 400.0, 10.5e3], columns=["u_nom"]))
+    with pytest.raises(ValueError, match="Duplicate keys '1' in column 'id_number' on table 'nodes'"):
+        converter._parse_reference(
+            data=data,
+            table="lines",
+            other_table="nodes",
+            query_column="from_node_side",
+            key_column="id_number",
+            value_column="u_nom",
+        )
+    with pytest.raises(ValueError, match="1 query columns and 2 key columns"):
+        converter._parse_reference(
+            data=data,
+            table="lines",
+            other_table="nodes",
+            query_column="from_node_side",
+            key_column=["id_number", "sub"],
+            value_column="u_nom",
+        )
+
+
+def test_parse_reference__index_reuse(converter: TabularConverter, tabular_data_no_units_no_substitutions: TabularData):
+    # Arrange
+    data = tabular_data_no_units_no_substitutions
+    kwargs = {"table": "lines", "other_table": "nodes", "query_column": "from_node_side", "key_column": "id_number"}
+
+    # Act
+    with patch.object(converter, "_get_reference_keys", wraps=converter._get_reference_keys) as get_keys:
+        converter._parse_reference(data=data, value_column="u_nom", **kwargs)
+        converter._parse_reference(data=data, value_column="id_number", **kwargs)
+
+    # Assert
+    assert [call.kwargs["table"] for call in get_keys.call_args_list] == ["lines", "nodes", "lines"]
+    assert list(converter._reference_index) == [("nodes", ("id_number",))]
+
+
 def test_parse_col_def_filter(converter: TabularConverter):
     # Act/Assert:
     with pytest.raises(AssertionError):
@@ -534,6 +1071,38 @@ def test_parse_col_def_filter__reference(mock_parse_reference: MagicMock, conver
         converter._parse_col_def_filter(data=data, table="", col_def={"reference": {"a": 1, "b": 2}}, extra_info=None)
 
 
+def test_parse_col_def_filter__expr(converter: TabularConverter, tabular_data_no_units_no_substitutions: TabularData):
+    # Arrange
+    nodes = tabular_data_no_units_no_substitutions["nodes"]
+    data = TabularData(nodes=nodes, nodes_np=nodes.to_records(index=False))
+
+    # Act
+    result = converter._parse_col_def_filter(
+        data=data, table="nodes", col_def={"expr": "u_nom / 1000 + `id_number`"}, extra_info=None
+    )
+    result_np = converter._parse_col_def_filter(
+        data=data, table="nodes_np", col_def={"expr": "u_nom / 1000 + `id_number`"}, extra_info=None
+    )
+    result_const = converter._parse_col_def_filter(data=data, table="nodes", col_def={"expr": "2 * 3"}, extra_info=None)
+
+    # Assert
+    assert_frame_equal(result, pd.DataFrame([11.5, 2.4]))
+    assert_frame_equal(result_np, pd.DataFrame([11.5, 2.4]))
+    assert_frame_equal(result_const, pd.DataFrame([6, 6]))
+
+
+def test_parse_col_def_filter__expr__invalid(converter: TabularConverter, tabular_data_no_units_no_substitutions):
+    # Act / Assert
+    with pytest.raises(ValueError, match=r"Invalid expr definition: \['a'\]"):
+        converter._parse_col_def_filter(
+            data=tabular_data_no_units_no_substitutions, table="nodes", col_def={"expr": ["a"]}, extra_info=None
+        )
+    with pytest.raises(KeyError, match="Could not find column 'u_rated' on table 'nodes'"):
+        converter._parse_col_def_filter(
+            data=tabular_data_no_units_no_substitutions, table="nodes", col_def={"expr": "2 * u_rated"}, extra_info=None
+        )
+
+
 @patch("power_grid_model_io.converters.tabular_converter.TabularConverter._get_id")
 def test_parse_auto_id(
     mock_get_id: MagicMock, converter: TabularConverter, tabular_data_no_units_no_substitutions: TabularData
@@ -575,6 +1144,28 @@ def test_parse_auto_id__extra_info(
     assert extra_info[102] == {"id_reference": {"table": "nodes", "key": {"id_number": 2}}}
 
 
+@patch("power_grid_model_io.converters.tabular_converter.TabularConverter._get_id")
+def test_parse_auto_id__extra_info_table(
+    mock_get_id: MagicMock, converter: TabularConverter, tabular_data_no_units_no_substitutions: TabularData
+):
+    # ref_table: None, ref_name: str, key_col_def: str, extra_info: ExtraInfoTable
+    mock_get_id.side_effect = [101, 102]
+    extra_info = ExtraInfoTable()
+    extra_info.add(ids=[102], columns={"name": "existing"})
+    converter._parse_auto_id(
+        data=tabular_data_no_units_no_substitutions,
+        table="nodes",
+        ref_table=None,
+        ref_name="internal_node",
+        key_col_def="id_number",
+        extra_info=extra_info,
+    )
+    assert extra_info.to_lookup() == {
+        101: {"id_reference": {"table": "nodes", "name": "internal_node", "key": {"id_number": 1}}},
+        102: {"name": "existing"},
+    }
+
+
 @patch("power_grid_model_io.converters.tabular_converter.TabularConverter._get_id")
 def test_parse_auto_id__reference_column(
     mock_get_id: MagicMock, converter: TabularConverter, tabular_data_no_units_no_substitutions: TabularData
@@ -889,3 +1480,346 @@ def test_lookup_id(converter: TabularConverter):
     assert converter.lookup_id(pgm_id=2) == {"table": "node", "key": {"a": 1, "c": 2}}
     assert converter.lookup_id(pgm_id=3) == {"table": "foo", "key": {"a": 1, "b": 2}}
     assert converter.lookup_id(pgm_id=4) == {"table": "node", "name": "bar", "key": {"a": 1, "b": 2}}
+
+
+def test_save_load_auto_ids(tmp_path: Path):
+    # Arrange
+    file_path = tmp_path / "auto_ids.npz"
+    mapping = TabularMapping({"nodes": {"node": {"id": {"auto_id": {"key": "id_number"}}, "u_rated": "u_nom"}}})
+    old_data = TabularData(nodes=pd.DataFrame({"id_number": [1, 2, 3], "u_nom": 400.0}))
+    new_data = TabularData(nodes=pd.DataFrame({"id_number": [4, 3, 1], "u_nom": 400.0}))
+    old_converter = TabularConverter()
+    old_converter._mapping = mapping
+    old_converter.load_input_data(data=old_data)
+    new_converter = TabularConverter()
+    new_converter._mapping = mapping
+
+    # Act
+    old_converter.save_auto_ids(file_path=file_path)
+    new_converter.load_auto_ids(file_path=file_path)
+    input_data, _ = new_converter.load_input_data(data=new_data)
+
+    # Assert
+    np.testing.assert_array_equal(input_data["node"]["id"], [3, 2, 0])
+    assert new_converter.lookup_id(1) == {"table": "nodes", "key": {"id_number": 2}}
+    with pytest.raises(ValueError, match="Auto ids can only be loaded before any data is converted"):
+        old_converter.load_auto_ids(file_path=file_path)
+
+
+@pytest.fixture
+def profile_converter() -> TabularConverter:
+    converter = TabularConverter()
+    converter._mapping = TabularMapping(
+        {"loads": {"sym_load": {"id": {"auto_id": {"key": ["node", "sub"]}}, "status": 1, "p_specified": 0.0}}}
+    )
+    converter.load_input_data(data=TabularData(loads=pd.DataFrame({"node": [1, 1, 2], "sub": [1, 2, 1]})))
+    return converter
+
+
+LOAD_REFERENCE = {"table": "loads", "key": {"node": "n", "sub": "s"}}
+
+
+@pytest.fixture
+def wide_profiles() -> TabularData:
+    p = pd.DataFrame({"n": [2, 1, 1], "s": [1, 1, 2], "t0": [1.0, 2.0, 3.0], "t1": [4.0, np.nan, 6.0]})
+    q = pd.DataFrame({"n": [1, 1, 2], "s": [2, 1, 1], "t0": [0.3, 0.2, 0.1], "t1": [0.6, np.nan, 0.4]})
+    return TabularData(p=p, q=q)
+
+
+def test_load_batch_update_data__wide(profile_converter: TabularConverter, wide_profiles: TabularData):
+    # Act
+    result = profile_converter.load_batch_update_data(
+        data=wide_profiles,
+        component="sym_load",
+        id_reference=LOAD_REFERENCE,
+        profiles={"p_specified": "p", "q_specified": "q"},
+    )
+
+    # Assert
+    batch = result["sym_load"]
+    assert batch.shape == (2, 3)
+    np.testing.assert_array_equal(batch["id"], [[2, 0, 1], [2, 0, 1]])
+    np.testing.assert_array_equal(batch["p_specified"], [[1.0, 2.0, 3.0], [4.0, np.nan, 6.0]])
+    np.testing.assert_array_equal(batch["q_specified"], [[0.1, 0.2, 0.3], [0.4, np.nan, 0.6]])
+    np.testing.assert_array_equal(batch["status"], -128)
+
+
+def test_load_batch_update_data__wide_sparse(profile_converter: TabularConverter, wide_profiles: TabularData):
+    # Act
+    result = profile_converter.load_batch_update_data(
+        data=wide_profiles,
+        component="sym_load",
+        id_reference=LOAD_REFERENCE,
+        profiles={"p_specified": "p"},
+        sparse=True,
+    )
+
+    # Assert
+    batch = result["sym_load"]
+    assert isinstance(batch, dict)
+    np.testing.assert_array_equal(batch["indptr"], [0, 3, 5])
+    np.testing.assert_array_equal(batch["data"]["id"], [2, 0, 1, 2, 1])
+    np.testing.assert_array_equal(batch["data"]["p_specified"], [1.0, 2.0, 3.0, 4.0, 6.0])
+
+
+def test_load_batch_update_data__wide_units_and_alternative_keys(profile_converter: TabularConverter):
+    # Arrange
+    columns = pd.MultiIndex.from_tuples([("NodeNr", ""), ("s", ""), ("t0", "kW"), ("t1", "kW")])
+    p = pd.DataFrame([[1, 1, 1.0, 2.0], [1, 2, 3.0, 4.0], [2, 1, 5.0, 6.0]], columns=columns)
+    data = TabularData(p=p)
+    data.set_unit_multipliers(UnitMapping({"W": {"kW": 1000.0}}))
+    reference = {"table": "loads", "key": {"node": "Node | NodeNr", "sub": "s"}}
+
+    # Act
+    result = profile_converter.load_batch_update_data(
+        data=data, component="sym_load", id_reference=reference, profiles={"p_specified": "p"}
+    )
+
+    # Assert
+    batch = result["sym_load"]
+    assert batch.shape == (2, 3)
+    np.testing.assert_array_equal(batch["id"], [[0, 1, 2], [0, 1, 2]])
+    np.testing.assert_array_equal(batch["p_specified"], [[1000.0, 3000.0, 5000.0], [2000.0, 4000.0, 6000.0]])
+
+
+def test_load_batch_update_data__wide_errors(profile_converter: TabularConverter, wide_profiles: TabularData):
+    # Arrange
+    duplicates = TabularData(p=pd.DataFrame({"node": [1, 1], "sub": [1, 1], "t0": [1.0, 2.0]}))
+    reference = {"table": "loads", "key": ["node", "sub"]}
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="Invalid id reference"):
+        profile_converter.load_batch_update_data(
+            data=wide_profiles, component="sym_load", id_reference={"table": "loads"}, profiles={"p_specified": "p"}
+        )
+    with pytest.raises(ValueError, match="Duplicate objects in profile table 'p'"):
+        profile_converter.load_batch_update_data(
+            data=duplicates, component="sym_load", id_reference=reference, profiles={"p_specified": "p"}
+        )
+    with pytest.raises(ValueError, match="should contain the same objects and time steps"):
+        profile_converter.load_batch_update_data(
+            data=TabularData(p=wide_profiles["p"], q=wide_profiles["q"][["n", "s", "t0"]]),
+            component="sym_load",
+            id_reference=LOAD_REFERENCE,
+            profiles={"p_specified": "p", "q_specified": "q"},
+        )
+    with pytest.raises(ValueError, match="No profiles supplied for sym_load"):
+        profile_converter.load_batch_update_data(
+            data=wide_profiles, component="sym_load", id_reference=LOAD_REFERENCE, profiles={}
+        )
+    with pytest.raises(KeyError, match="'loads', {'node': 3}"):
+        profile_converter.load_batch_update_data(
+            data=TabularData(p=pd.DataFrame({"node": [3], "t0": [1.0]})),
+            component="sym_load",
+            id_reference={"table": "loads", "key": "node"},
+            profiles={"p_specified": "p"},
+        )
+
+
+@pytest.fixture
+def long_profiles() -> TabularData:
+    return TabularData(
+        profiles=pd.DataFrame(
+            {"n": [2, 1, 1, 2], "s": [1, 1, 2, 1], "time": [1, 0, 0, 0], "p": [1.0, 2.0, 3.0, 4.0], "pf": 0.5}
+        )
+    )
+
+
+def test_load_batch_update_data__long(profile_converter: TabularConverter, long_profiles: TabularData):
+    # Act
+    result = profile_converter.load_batch_update_data(
+        data=long_profiles,
+        component="sym_load",
+        id_reference=LOAD_REFERENCE,
+        profiles={"p_specified": "p", "q_specified": {"multiply": ["p", "pf"]}},
+        table="profiles",
+        time_column="time",
+    )
+
+    # Assert
+    batch = result["sym_load"]
+    assert batch.shape == (2, 3)
+    np.testing.assert_array_equal(batch["id"], [[2, 0, 1], [2, 0, 1]])
+    np.testing.assert_array_equal(batch["p_specified"], [[4.0, 2.0, 3.0], [1.0, np.nan, np.nan]])
+    np.testing.assert_array_equal(batch["q_specified"], [[2.0, 1.0, 1.5], [0.5, np.nan, np.nan]])
+
+
+def test_load_batch_update_data__long_sparse(profile_converter: TabularConverter, long_profiles: TabularData):
+    # Act
+    result = profile_converter.load_batch_update_data(
+        data=long_profiles,
+        component="sym_load",
+        id_reference=LOAD_REFERENCE,
+        profiles={"p_specified": "p"},
+        table="profiles",
+        time_column="time",
+        sparse=True,
+    )
+
+    # Assert
+    batch = result["sym_load"]
+    assert isinstance(batch, dict)
+    np.testing.assert_array_equal(batch["indptr"], [0, 3, 4])
+    np.testing.assert_array_equal(batch["data"]["id"], [2, 0, 1, 2])
+    np.testing.assert_array_equal(batch["data"]["p_specified"], [4.0, 2.0, 3.0, 1.0])
+
+
+def test_load_batch_update_data__long_sparse_nan(profile_converter: TabularConverter, long_profiles: TabularData):
+    # Arrange
+    profiles = long_profiles["profiles"].copy()
+    profiles.loc[1, "p"] = np.nan
+    profiles["q"] = [np.nan, np.nan, np.nan, 0.4]
+
+    # Act
+    result = profile_converter.load_batch_update_data(
+        data=TabularData(profiles=profiles),
+        component="sym_load",
+        id_reference=LOAD_REFERENCE,
+        profiles={"p_specified": "p", "q_specified": "q"},
+        table="profiles",
+        time_column="time",
+        sparse=True,
+    )
+
+    # Assert
+    batch = result["sym_load"]
+    assert isinstance(batch, dict)
+    np.testing.assert_array_equal(batch["indptr"], [0, 2, 3])
+    np.testing.assert_array_equal(batch["data"]["id"], [2, 1, 2])
+    np.testing.assert_array_equal(batch["data"]["p_specified"], [4.0, 3.0, 1.0])
+    np.testing.assert_array_equal(batch["data"]["q_specified"], [0.4, np.nan, np.nan])
+
+
+def test_load_batch_update_data__long_errors(profile_converter: TabularConverter, long_profiles: TabularData):
+    # Arrange
+    profiles = long_profiles["profiles"]
+    duplicates = TabularData(profiles=pd.concat([profiles, profiles]))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="A time column is required"):
+        profile_converter.load_batch_update_data(
+            data=long_profiles,
+            component="sym_load",
+            id_reference=LOAD_REFERENCE,
+            profiles={"p_specified": "p"},
+            table="profiles",
+        )
+    with pytest.raises(ValueError, match="Missing time values in the profiles of sym_load"):
+        profile_converter.load_batch_update_data(
+            data=TabularData(profiles=profiles.assign(time=[1.0, 0.0, np.nan, 0.0])),
+            component="sym_load",
+            id_reference=LOAD_REFERENCE,
+            profiles={"p_specified": "p"},
+            table="profiles",
+            time_column="time",
+        )
+    with pytest.raises(ValueError, match="Duplicate time steps for the same object in the profiles of sym_load"):
+        profile_converter.load_batch_update_data(
+            data=duplicates,
+            component="sym_load",
+            id_reference=LOAD_REFERENCE,
+            profiles={"p_specified": "p"},
+            table="profiles",
+            time_column="time",
+        )
+
+
+@pytest.fixture
+def batch_output() -> np.ndarray:
+    output = initialize_array("sym_output", "node", (3, 2))
+    output["id"] = [1, 2]
+    output["u"] = [[10.0, 20.0], [11.0, 21.0], [12.0, 22.0]]
+    return output
+
+
+def test_serialize_data__batch(converter: TabularConverter, batch_output: np.ndarray):
+    # Act
+    tabular_data = converter._serialize_data(data={"node": batch_output}, extra_info=None)
+
+    # Assert
+    node = tabular_data["node"]
+    assert list(node.columns) == ["scenario"] + list(batch_output.dtype.names)
+    np.testing.assert_array_equal(node["scenario"], [0, 0, 1, 1, 2, 2])
+    np.testing.assert_array_equal(node["id"], [1, 2, 1, 2, 1, 2])
+    np.testing.assert_array_equal(node["u"], [10.0, 20.0, 11.0, 21.0, 12.0, 22.0])
+
+
+def test_convert_batch__dense(converter: TabularConverter, batch_output: np.ndarray):
+    # Act
+    tabular_data = converter.convert_batch(
+        data={"node": batch_output}, columns={"node": ["u"]}, scenarios=slice(1, None)
+    )
+
+    # Assert
+    expected = pd.DataFrame({"scenario": [1, 1, 2, 2], "id": [1, 2, 1, 2], "u": [11.0, 21.0, 12.0, 22.0]})
+    assert_frame_equal(tabular_data["node"], expected, check_dtype=False)
+
+
+def test_is_batch(batch_output: np.ndarray):
+    assert TabularConverter._is_batch([])
+    assert TabularConverter._is_batch({"node": batch_output})
+    assert TabularConverter._is_batch({"line": {"indptr": np.array([0]), "data": batch_output[0]}})
+    assert not TabularConverter._is_batch({"node": batch_output[0]})
+
+
+def test_convert_batch__sparse(converter: TabularConverter):
+    # Arrange
+    line = initialize_array("sym_output", "line", 4)
+    line["id"] = [5, 6, 7, 8]
+    line["loading"] = [0.5, 0.6, 0.7, 0.8]
+    data = {"line": {"indptr": np.array([0, 1, 3, 3, 4]), "data": line}}
+
+    # Act
+    tabular_data = converter.convert_batch(data=data, columns={"line": ["loading"]}, scenarios=slice(1, None))
+
+    # Assert
+    expected = pd.DataFrame({"scenario": [1, 1, 3], "id": [6, 7, 8], "loading": [0.6, 0.7, 0.8]})
+    assert_frame_equal(tabular_data["line"], expected, check_dtype=False)
+
+
+def test_convert_batch__list(converter: TabularConverter, batch_output: np.ndarray):
+    # Arrange
+    line = initialize_array("sym_output", "line", 1)
+    line["id"] = 5
+    data = [{"node": batch_output[0]}, {"node": batch_output[1], "line": line}, {"node": batch_output[2]}]
+
+    # Act
+    tabular_data = converter.convert_batch(data=data, columns={"node": ["u"]}, scenarios=slice(0, 2))
+
+    # Assert
+    assert "line" not in tabular_data
+    expected = pd.DataFrame({"scenario": [0, 0, 1, 1], "id": [1, 2, 1, 2], "u": [10.0, 20.0, 11.0, 21.0]})
+    assert_frame_equal(tabular_data["node"], expected, check_dtype=False)
+
+
+def test_convert_batch__list_unselected_component(converter: TabularConverter, batch_output: np.ndarray):
+    # Arrange
+    line = initialize_array("sym_output", "line", 1)
+    line["id"] = 5
+    data = [{"node": batch_output[0], "line": line}, {"node": batch_output[1]}]
+
+    # Act
+    all_columns = converter.convert_batch(data=data, scenarios=slice(1, 2))
+    tabular_data = converter.convert_batch(data=data, columns={"node": ["u"], "line": []}, scenarios=slice(1, 2))
+
+    # Assert
+    assert list(all_columns.keys()) == ["node"]
+    assert "line" not in tabular_data
+    expected = pd.DataFrame({"scenario": [1, 1], "id": [1, 2], "u": [11.0, 21.0]})
+    assert_frame_equal(tabular_data["node"], expected, check_dtype=False)
+
+
+def test_convert_batch__asym_scenario_index(converter: TabularConverter):
+    # Arrange
+    output = initialize_array("asym_output", "node", (2, 1))
+    output["id"] = 1
+    output["u"] = [[[1.0, 2.0, 3.0]], [[4.0, 5.0, 6.0]]]
+
+    # Act
+    tabular_data = converter.convert_batch(data={"node": output}, columns={"node": ["u"]}, scenario_index=True)
+
+    # Assert
+    expected = pd.DataFrame(
+        {"scenario": [0, 1], "id": [1, 1], "u_a": [1.0, 4.0], "u_b": [2.0, 5.0], "u_c": [3.0, 6.0]}
+    ).set_index(["scenario", "id"])
+    assert_frame_equal(tabular_data["node"], expected, check_dtype=False, check_index_type=False)
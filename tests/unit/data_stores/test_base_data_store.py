@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
 #
 # SPDX-License-Identifier: MPL-2.0
+import asyncio
+import threading
 
 import pytest
 
@@ -10,3 +12,42 @@ from power_grid_model_io.data_stores.base_data_store import BaseDataStore
 def test_abstract_methods():
     with pytest.raises(TypeError, match=r"with abstract methods load, save"):
         BaseDataStore()
+
+
+class DummyStore(BaseDataStore[dict]):
+    def __init__(self):
+        super().__init__()
+        self.data = {"foo": 1}
+        self.threads = []
+
+    def load(self) -> dict:
+        self.threads.append(threading.get_ident())
+        return self.data
+
+    def save(self, data: dict) -> None:
+        self.threads.append(threading.get_ident())
+        self.data = data
+
+
+def test_aload():
+    # Arrange
+    store = DummyStore()
+
+    # Act
+    data = asyncio.run(store.aload())
+
+    # Assert
+    assert data == {"foo": 1}
+    assert store.threads != [threading.get_ident()]
+
+
+def test_asave():
+    # Arrange
+    store = DummyStore()
+
+    # Act
+    asyncio.run(store.asave({"bar": 2}))
+
+    # Assert
+    assert store.data == {"bar": 2}
+    assert store.threads != [threading.get_ident()]
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from power_grid_model_io.data_stores.chunked_data_store import ChunkedDataStore
+from power_grid_model_io.data_stores.csv_dir_store import CsvDirStore
+from power_grid_model_io.data_types import TabularData
+
+
+@pytest.fixture
+def nodes() -> pd.DataFrame:
+    return pd.DataFrame({"id": [1, 2, 3, 4, 5], "u_rated": [10.5e3, 400.0, 400.0, 400.0, 400.0]})
+
+
+def test_abstract_methods():
+    with pytest.raises(
+        TypeError, match=r"with abstract methods load_chunks, load_table, save, table_columns, table_names"
+    ):
+        ChunkedDataStore()
+
+
+def test_save_load(tmp_path: Path, nodes: pd.DataFrame):
+    # Arrange
+    store = CsvDirStore(tmp_path / "csv", sep=";")
+    lines = np.array([(1, 2), (3, 4)], dtype=[("from_node", "i8"), ("to_node", "i8")])
+
+    # Act
+    store.save(TabularData(nodes=nodes, lines=lines))
+    data = store.load()
+
+    # Assert
+    assert store.table_names() == ["lines", "nodes"]
+    assert (tmp_path / "csv" / "nodes.csv").read_text().split("\n")[0] == "id;u_rated"
+    assert_frame_equal(data["nodes"], nodes)
+    assert_frame_equal(data["lines"], pd.DataFrame(lines))
+
+
+def test_load_chunks(tmp_path: Path, nodes: pd.DataFrame):
+    # Arrange
+    store = CsvDirStore(tmp_path)
+    store.save(TabularData(nodes=nodes))
+
+    # Act
+    chunks = list(store.load_chunks(table_name="nodes", chunk_size=2))
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [chunk.index[0] for chunk in chunks] == [0, 2, 4]
+    assert_frame_equal(pd.concat(chunks), nodes)
+
+
+def test_table_columns(tmp_path: Path, nodes: pd.DataFrame):
+    # Arrange
+    store = CsvDirStore(tmp_path)
+    store.save(TabularData(nodes=nodes))
+
+    # Act / Assert
+    assert store.table_columns("nodes") == ["id", "u_rated"]
+
+
+def test_load__columns(tmp_path: Path, nodes: pd.DataFrame):
+    # Arrange
+    store = CsvDirStore(tmp_path)
+    store.save(TabularData(nodes=nodes))
+
+    # Act
+    table = store.load_table("nodes", columns=["u_rated", "name"])
+    chunks = list(store.load_chunks("nodes", chunk_size=3, columns={"id"}))
+
+    # Assert
+    assert_frame_equal(table, nodes[["u_rated"]])
+    assert_frame_equal(pd.concat(chunks), nodes[["id"]])
+
+
+def test_save__named_index(tmp_path: Path):
+    # Arrange
+    data = pd.DataFrame({"scenario": [0, 0, 1], "id": [1, 2, 1], "u": [1.0, 2.0, 3.0]}).set_index(["scenario", "id"])
+    store = CsvDirStore(dir_path=tmp_path)
+
+    # Act
+    store.save(TabularData(node=data))
+
+    # Assert
+    assert_frame_equal(store.load_table("node"), data.reset_index())
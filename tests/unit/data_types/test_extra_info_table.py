@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from power_grid_model_io.data_types import ExtraInfoTable
+
+
+@pytest.fixture()
+def extra_info() -> ExtraInfoTable:
+    table = ExtraInfoTable()
+    table.add(
+        ids=np.array([2, 1]),
+        columns={"name": ["b", "a"], "id_reference": {"table": "nodes", "index": pd.Series([5, 4])}},
+    )
+    table.add(ids=[3], columns={"name": [np.nan], "length_km": [1.5]})
+    return table
+
+
+def test_getitem(extra_info: ExtraInfoTable):
+    # Act / Assert
+    assert extra_info[1] == {"name": "a", "id_reference": {"table": "nodes", "index": 4}}
+    assert extra_info[2] == {"name": "b", "id_reference": {"table": "nodes", "index": 5}}
+    assert extra_info[3] == {"length_km": 1.5}
+    assert isinstance(extra_info[1]["id_reference"]["index"], int)  # type: ignore
+    with pytest.raises(KeyError):
+        extra_info[4]  # pylint: disable=pointless-statement
+
+
+def test_mapping(extra_info: ExtraInfoTable):
+    # Act / Assert
+    assert len(extra_info) == 3
+    assert list(extra_info) == [1, 2, 3]
+    assert 2 in extra_info
+    assert np.int32(3) in extra_info
+    assert 4 not in extra_info
+    assert "2" not in extra_info
+    assert extra_info.get(4, {}) == {}
+    np.testing.assert_array_equal(extra_info.ids, [1, 2, 3])
+
+
+def test_add__overwrite(extra_info: ExtraInfoTable):
+    # Act
+    extra_info.add(ids=[1, 4], columns={"name": "z"})
+
+    # Assert
+    assert extra_info[1] == {"name": "z", "id_reference": {"table": "nodes", "index": 4}}
+    assert extra_info[4] == {"name": "z"}
+
+
+def test_add__missing_values():
+    # Arrange
+    table = ExtraInfoTable()
+
+    # Act
+    table.add(ids=[1, 2], columns={"name": [None, "b"], "rating": np.array([np.nan, 3.0])})
+
+    # Assert
+    assert list(table) == [2]
+    assert table[2] == {"name": "b", "rating": 3.0}
+
+
+def test_add__invalid_length():
+    # Arrange
+    table = ExtraInfoTable()
+
+    # Act / Assert
+    with pytest.raises(ValueError, match=r"'id_reference.index' contains 1 values, expected 2"):
+        table.add(ids=[1, 2], columns={"id_reference": {"index": np.array([1])}})
+
+
+def test_merge(extra_info: ExtraInfoTable):
+    # Arrange
+    other = ExtraInfoTable()
+    other.add(ids=[3, 4], columns={"length_km": [2.5, 3.5]})
+
+    # Act
+    extra_info.merge({1: {"name": "z"}})
+    extra_info.merge(other)
+
+    # Assert
+    assert extra_info[1] == {"name": "z", "id_reference": {"table": "nodes", "index": 4}}
+    assert extra_info[3] == {"length_km": 2.5}
+    assert extra_info[4] == {"length_km": 3.5}
+
+
+def test_to_frame(extra_info: ExtraInfoTable):
+    # Act
+    frame = extra_info.to_frame()
+
+    # Assert
+    expected = pd.DataFrame(
+        {
+            "name": ["a", "b", np.nan],
+            "id_reference.table": ["nodes", "nodes", None],
+            "id_reference.index": pd.Series([4, 5, None], index=[1, 2, 3], dtype=object),
+            "length_km": [np.nan, np.nan, 1.5],
+        },
+        index=pd.Index([1, 2, 3], name="id"),
+    )
+    pd.testing.assert_frame_equal(frame, expected)
+
+
+def test_join(extra_info: ExtraInfoTable):
+    # Act
+    frame = extra_info.join(np.array([3, 7, 1], dtype=np.int32))
+
+    # Assert
+    assert list(frame.index) == [3, 7, 1]
+    assert list(frame["name"].fillna("-")) == ["-", "-", "a"]
+    assert list(frame["length_km"].fillna(0.0)) == [1.5, 0.0, 0.0]
+
+
+def test_lookup_round_trip():
+    # Arrange
+    lookup = {
+        5: {"a": 1, "b": {"c": [1, 2]}, "d": True},
+        6: {"a": 2.5},
+        7: {"a": 3, "b": {"e": "text"}},
+    }
+
+    # Act
+    table = ExtraInfoTable.from_lookup(lookup)
+
+    # Assert
+    assert table.to_lookup() == lookup
+    assert isinstance(table[5]["a"], int)
+
+
+def _typed(extra: Any) -> Any:
+    """Replace each value by a (type, value) pair, so that e.g. 10 and 10.0 are not considered equal"""
+    if isinstance(extra, dict):
+        return {key: _typed(value) for key, value in extra.items()}
+    return type(extra).__name__, extra
+
+
+@pytest.mark.parametrize(
+    "blocks",
+    [
+        # Integers in one block, floats in another
+        [([1, 2], {"rating": np.array([10, 20])}), ([3], {"rating": np.array([1.5])})],
+        # Missing values don't overwrite earlier values
+        [([1, 2], {"name": ["a", "b"]}), ([1, 2], {"name": [None, "c"]})],
+        [([1, 2], {"rating": np.array([10, 20])}), ([1, 2], {"rating": np.array([np.nan, 2.5])})],
+        [([1], {"rating": np.array([1.5])}), ([1, 2], {"rating": [None, 3]})],
+        # Nested values
+        [([1], {"id_reference": {"index": np.array([4])}}), ([1, 2], {"id_reference": {"index": [np.nan, "x"]}})],
+    ],
+)
+def test_add__equivalent_to_dict(blocks: List[Tuple[List[int], Dict[str, Any]]]):
+    # Arrange
+    table = ExtraInfoTable()
+    expected: Dict[int, Dict[str, Any]] = {}
+
+    # Act
+    for ids, columns in blocks:
+        table.add(ids=ids, columns=columns)
+        for i, pgm_id in enumerate(ids):
+            extra = expected.setdefault(pgm_id, {})
+            for key, values in columns.items():
+                node, leaves = (
+                    (extra.setdefault(key, {}), values) if isinstance(values, dict) else (extra, {key: values})
+                )
+                for leaf, column in leaves.items():
+                    value = column[i]
+                    if not (value is None or (isinstance(value, float) and np.isnan(value))):
+                        node[leaf] = value.item() if isinstance(value, np.generic) else value
+    expected = {pgm_id: extra for pgm_id, extra in expected.items() if extra}
+
+    # Assert
+    assert _typed(table.to_lookup()) == _typed(expected)
+    assert _typed({pgm_id: table[pgm_id] for pgm_id in table}) == _typed(expected)
@@ -194,6 +194,31 @@ def test_get_column__substitution__numpy(nodes_np: np.ndarray):
     pd.testing.assert_series_equal(col_data, pd.Series([100, 101, 102], name="id"))
 
 
+@pytest.mark.parametrize(
+    ("column", "substitutions", "expected"),
+    [
+        ([1, 0, 1], {True: "closed", False: "open"}, ["closed", "open", "closed"]),
+        ([True, False, True], {1: "closed", 0: "open"}, ["closed", "open", "closed"]),
+        (np.array([1, 0, 1]), {True: "closed", False: "open"}, ["closed", "open", "closed"]),
+        (np.array([True, False, True]), {1: "closed", 0: "open"}, ["closed", "open", "closed"]),
+    ],
+)
+def test_get_column__substitution__bool_int(column, substitutions, expected):
+    # Arrange
+    if isinstance(column, np.ndarray):
+        table = np.array([(value,) for value in column], dtype=[("closed", column.dtype)])
+    else:
+        table = pd.DataFrame({"closed": column})
+    data = TabularData(switches=table)
+    data.set_substitutions(ValueMapping({"closed": substitutions}))
+
+    # Act
+    col_data = data.get_column(table_name="switches", column_name="closed")
+
+    # Assert
+    np.testing.assert_array_equal(col_data, expected)
+
+
 def test_get_column__substitution_exception(nodes_vl: pd.DataFrame, lines: pd.DataFrame):
     # Arrange
     data = TabularData(nodes=nodes_vl, lines=lines)
@@ -204,6 +229,76 @@ def test_get_column__substitution_exception(nodes_vl: pd.DataFrame, lines: pd.Da
         data.get_column(table_name="nodes", column_name="u_rated")
 
 
+def test_get_column__substitution_exception__all_values(nodes_vl: pd.DataFrame):
+    # Arrange
+    data = TabularData(nodes=nodes_vl)
+    data.set_substitutions(ValueMapping({"u_rated": {"mv": 10500.0}}))
+
+    # Act / Assert
+    with pytest.raises(KeyError, match=r"values 'hv', 'lv' in column 'u_rated' in table 'nodes'"):
+        data.get_column(table_name="nodes", column_name="u_rated")
+
+
+def test_get_column__substitution__categorical():
+    # Arrange
+    categories = ["hv", "mv", "lv"]
+    nodes = pd.DataFrame(
+        {
+            "u_rated": pd.Categorical(["hv", "mv", "hv"], categories=categories),
+            "u_nom": pd.Categorical(["hv", None, "lv"], categories=categories),
+        }
+    )
+    data = TabularData(nodes=nodes)
+    data.set_substitutions(ValueMapping({"u_.*": {"mv": 10500.0, "hv": 150000.0}}))
+
+    # Act
+    col_data = data.get_column(table_name="nodes", column_name="u_rated")
+
+    # Assert
+    pd.testing.assert_series_equal(col_data, pd.Series([150e3, 10.5e3, 150e3], name="u_rated"))
+    with pytest.raises(KeyError, match=r"values 'nan', 'lv' in column 'u_nom'"):
+        data.get_column(table_name="nodes", column_name="u_nom")
+
+
+def test_get_column_array__numpy(nodes_np: np.ndarray):
+    # Arrange
+    data = TabularData(nodes=nodes_np)
+
+    # Act
+    col_data = data.get_column_array(table_name="nodes", column_name="u_rated")
+
+    # Assert
+    assert isinstance(col_data, np.ndarray)
+    assert np.shares_memory(col_data, nodes_np)
+    np.testing.assert_array_equal(col_data, [150e3, 10.5e3, 400.0])
+
+
+def test_get_column_array__numpy_substitution(nodes_np: np.ndarray):
+    # Arrange
+    data = TabularData(nodes=nodes_np)
+    data.set_substitutions(ValueMapping({"id": {0: 100, 1: 101, 2: 102}}))
+
+    # Act
+    col_data = data.get_column_array(table_name="nodes", column_name="id")
+
+    # Assert
+    assert isinstance(col_data, np.ndarray)
+    np.testing.assert_array_equal(col_data, [100, 101, 102])
+
+
+def test_get_column_array__pandas(nodes_vl: pd.DataFrame):
+    # Arrange
+    data = TabularData(nodes=nodes_vl)
+    data.set_substitutions(ValueMapping({"u_rated": {"mv": 10500.0, "lv": 400.0, "hv": 150000.0}}))
+
+    # Act
+    col_data = data.get_column_array(table_name="nodes", column_name="u_rated")
+
+    # Assert
+    assert isinstance(col_data, np.ndarray)
+    np.testing.assert_array_equal(col_data, [150e3, 10.5e3, 400.0])
+
+
 def test_get_column__index(nodes: pd.DataFrame, lines: pd.DataFrame):
     # Arrange
     data = TabularData(nodes=nodes, lines=lines)
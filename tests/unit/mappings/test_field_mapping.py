@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+import gc
+import weakref
+
+import pytest
+
+from power_grid_model_io.mappings.field_mapping import MAPPING_CACHE_SIZE, FieldMapping
+
+
+def test_get_mapping__first_pattern():
+    # Arrange
+    mapping = FieldMapping({"a.*": 1, ".*b": 2, "ab": 3})
+
+    # Act / Assert
+    assert mapping._get_mapping("ab") == 3
+    assert mapping._get_mapping("axb") == 1
+    assert mapping._get_mapping("xb") == 2
+
+
+def test_get_mapping__table_pattern():
+    # Arrange
+    mapping = FieldMapping({"p_.*": 1, "sources\\.p_.*": 2})
+
+    # Act / Assert
+    assert mapping._get_mapping("p_mw", table="sources") == 2
+    assert mapping._get_mapping("p_mw", table="loads") == 1
+
+
+def test_get_mapping__nested_groups():
+    # Arrange
+    mapping = FieldMapping({"(?P<prefix>from|to)_(node)": 1, "(x|y)+": 2})
+
+    # Act / Assert
+    assert mapping._combined_re is not None
+    assert mapping._get_mapping("to_node") == 1
+    assert mapping._get_mapping("xyx") == 2
+
+
+@pytest.mark.parametrize("pattern", ["(?i)foo", "(o)\\1", "(?P<bar>o)"])
+def test_get_mapping__uncombined_patterns(pattern: str):
+    # Arrange
+    mapping = FieldMapping({pattern: 1, "(?P<bar>bar)": 2})
+
+    # Act / Assert
+    assert mapping._combined_re is None
+    assert mapping._get_mapping("bar") == 2
+    with pytest.raises(KeyError, match="baz"):
+        mapping._get_mapping("baz")
+
+
+def test_get_mapping__uncombined_patterns__match():
+    # Arrange
+    mapping = FieldMapping({"(?i)foo": 1, "(o)\\1": 2})
+
+    # Act / Assert
+    assert mapping._combined_re is None
+    assert mapping._get_mapping("FOO") == 1
+    assert mapping._get_mapping("oo") == 2
+
+
+def test_get_mapping__empty():
+    # Arrange
+    mapping: FieldMapping[int] = FieldMapping()
+
+    # Act / Assert
+    with pytest.raises(KeyError):
+        mapping._get_mapping("")
+
+
+def test_get_mapping__cache():
+    # Arrange
+    mapping = FieldMapping({"a.*": 1})
+    other = FieldMapping({"a.*": 2})
+
+    # Act
+    for _ in range(3):
+        mapping._get_mapping("abc")
+        with pytest.raises(KeyError):
+            mapping._get_mapping("xyz")
+
+    # Assert
+    info = mapping._find_key.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (4, 2, MAPPING_CACHE_SIZE)
+    assert other._find_key.cache_info().currsize == 0
+
+
+def test_get_mapping__release():
+    # Arrange
+    mapping = FieldMapping({"a.*": 1})
+    mapping._get_mapping("abc")
+    ref = weakref.ref(mapping)
+
+    # Act
+    del mapping
+    gc.collect()
+
+    # Assert
+    assert ref() is None
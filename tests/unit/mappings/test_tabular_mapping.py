@@ -68,3 +68,91 @@ def test_instances__exception():
     # Act / Assert
     with pytest.raises(TypeError, match="Invalid table mapping for Nodes; expected a dictionary got list"):
         next(mapping.instances(table="Nodes"))
+
+
+@fixture
+def dependency_mapping() -> TabularMapping:
+    # Arrange
+    return TabularMapping(
+        {
+            "Nodes": {"node": {"id": {"auto_id": {"key": "Number"}}, "u_rated": "Unom | U_nom", "extra": ["Name"]}},
+            "Cables": {
+                "line": {
+                    "id": {"auto_id": {"key": ["Number", "Subnumber"]}},
+                    "from_node": {"auto_id": {"table": "Nodes", "key": {"Number": "From.Number"}}},
+                    "to_node": {"auto_id": {"table": "Nodes", "name": "internal", "key": {"Number": "To.Number"}}},
+                    "r1": {"expr": "R * `Cable length` / Parallel"},
+                    "x1": {"multiply": ["X", "Length"]},
+                    "c1": {"power_grid_model_io.functions.value_or_default": {"value": "C", "default": 0.0}},
+                    "i_n": "inf",
+                    "from_status": 1,
+                    "tan1": {
+                        "reference": {
+                            "other_table": "Types",
+                            "query_column": ["Type", "Variant"],
+                            "key_column": ["Code", "Variant"],
+                            "value_column": "tan",
+                        }
+                    },
+                    "extra": "index",
+                }
+            },
+        }
+    )
+
+
+def test_column_dependencies(dependency_mapping: TabularMapping):
+    # Act
+    dependencies = dependency_mapping.column_dependencies()
+
+    # Assert
+    assert dependencies == {
+        "Nodes": {("Number",), ("Unom", "U_nom"), ("Name",)},
+        "Cables": {
+            ("Number",),
+            ("Subnumber",),
+            ("From.Number",),
+            ("To.Number",),
+            ("R",),
+            ("Cable length",),
+            ("Parallel",),
+            ("X",),
+            ("Length",),
+            ("C",),
+            ("Type",),
+            ("Variant",),
+            ("index",),
+        },
+        "Types": {("Code",), ("Variant",), ("tan",)},
+    }
+
+
+def test_column_dependencies__invalid():
+    # Arrange
+    mapping = TabularMapping({"Nodes": {"node": {"id": None}}})  # type: ignore
+
+    # Act / Assert
+    with pytest.raises(TypeError, match="Invalid column definition: None"):
+        mapping.column_dependencies()
+
+
+def test_required_columns(dependency_mapping: TabularMapping):
+    # Act
+    columns = dependency_mapping.required_columns()
+
+    # Assert
+    assert columns["Nodes"] == {"Number", "Unom", "U_nom", "Name"}
+    assert columns["Types"] == {"Code", "Variant", "tan"}
+
+
+def test_missing_columns(dependency_mapping: TabularMapping):
+    # Act
+    missing = dependency_mapping.missing_columns(
+        {
+            "Nodes": ["Number", "U_nom", "Name"],
+            "Cables": ["Number", "Subnumber", "From.Number", "To.Number", "R", "Parallel", "X", "Length", "Type"],
+        }
+    )
+
+    # Assert
+    assert missing == {"Cables": ["C", "Cable length", "Variant"]}
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+import numpy as np
 import pytest
 from pytest import fixture
 
@@ -36,3 +37,18 @@ def test_get_substitutions__regex_match(mapping: ValueMapping):
 def test_get_substitutions__no_match(mapping: ValueMapping):
     with pytest.raises(KeyError):
         mapping.get_substitutions("N2")
+
+
+def test_get_substitution_table(mapping: ValueMapping):
+    # Act
+    keys, values = mapping.get_substitution_table("to_switch_state")
+
+    # Assert
+    assert list(keys) == ["off", "in"]
+    np.testing.assert_array_equal(values, [0, 1])
+    assert mapping.get_substitution_table("from_switch_state")[0] is keys
+
+
+def test_get_substitution_table__no_match(mapping: ValueMapping):
+    with pytest.raises(KeyError):
+        mapping.get_substitution_table("N2")
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+"""
+Import time regression tests: each statement is run in a fresh interpreter, after which we check that none of the
+heavy modules were imported. This is more reliable than measuring the import time itself.
+"""
+import subprocess
+import sys
+from typing import Set
+
+import pytest
+
+HEAVY_MODULES = {
+    "numpy",
+    "pandas",
+    "power_grid_model",
+    "structlog",
+    "yaml",
+    "power_grid_model_io.converters.pandapower_converter",
+    "power_grid_model_io.converters.tabular_converter",
+}
+
+
+def imported_modules(statement: str) -> Set[str]:
+    code = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True)
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    ("statement", "allowed"),
+    [
+        ("import power_grid_model_io", set()),
+        ("import power_grid_model_io.converters", set()),
+        ("import power_grid_model_io.data_stores", set()),
+        ("import power_grid_model_io.data_types", set()),
+        ("from power_grid_model_io.data_stores import JsonFileStore", {"numpy", "power_grid_model", "structlog"}),
+        (
+            "from power_grid_model_io.converters import PgmJsonConverter",
+            {"numpy", "pandas", "power_grid_model", "structlog"},
+        ),
+        ("import power_grid_model_io.cli.main", {"numpy", "pandas", "power_grid_model", "structlog"}),
+    ],
+)
+def test_import(statement: str, allowed: Set[str]):
+    # Act
+    modules = imported_modules(statement)
+
+    # Assert
+    assert modules & HEAVY_MODULES == allowed
@@ -72,3 +72,13 @@ def test_auto_id__with_clashing_keys():
     assert auto_id[1] == {"name": "Bravo"}
     with raises(IndexError):
         _ = auto_id[2]
+
+
+def test_auto_id__len_and_items():
+    auto_id = AutoID()
+    assert len(auto_id) == 0
+    assert auto_id(item={"name": "Alpha"}, key="Alpha") == 0
+    assert auto_id(item={"name": "Bravo"}, key="Bravo") == 1
+    assert auto_id(item={"name": "Charly"}, key="Alpha") == 0
+    assert len(auto_id) == 2
+    assert list(auto_id.items()) == [{"name": "Charly"}, {"name": "Bravo"}]
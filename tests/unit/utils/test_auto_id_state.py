@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from power_grid_model_io.utils.auto_id import AutoID
+from power_grid_model_io.utils.auto_id_state import load_auto_id_state, save_auto_id_state
+
+
+def add(auto_id: AutoID, table: str, key: dict, name=None) -> int:
+    return auto_id(item=(table, key, name), key=(table, tuple(sorted(key.items())), name))
+
+
+def test_save_load(tmp_path: Path):
+    # Arrange
+    file_path = tmp_path / "auto_ids.npz"
+    auto_id = AutoID()
+    add(auto_id, "Nodes", {"Number": np.int64(1)})
+    add(auto_id, "Cables", {"Number": 1, "Subnumber": 2})
+    add(auto_id, "Nodes", {"Number": np.int64(2)})
+    add(auto_id, "Transformer loads", {"Node_Number": 3, "Subnumber": 1}, name="internal_node")
+    add(auto_id, "Sources", {"Name": "a"})
+    add(auto_id, "Sources", {"Name": 7})
+    add(auto_id, "Constants", {})
+
+    # Act
+    save_auto_id_state(auto_id=auto_id, file_path=file_path)
+    loaded = load_auto_id_state(file_path=file_path)
+
+    # Assert
+    assert len(loaded) == 7
+    assert [loaded[i] for i in range(7)] == [auto_id[i] for i in range(7)]
+    assert list(loaded.items()) == list(auto_id.items())
+    assert add(loaded, "Nodes", {"Number": 2}) == 2
+    assert add(loaded, "Nodes", {"Number": 3}) == 7
+    with np.load(file_path) as data:
+        assert data["key_0_0"].dtype == np.int64
+        assert data["key_3_0"].dtype.kind == "U"
+        encodings = [group["encodings"] for group in json.loads(str(data["meta"]))]
+        assert encodings == [["array"], ["array", "array"], ["array", "array"], ["json"], []]
+
+
+def test_save__invalid_item(tmp_path: Path):
+    # Arrange
+    auto_id = AutoID()
+    auto_id(item="Alpha")
+
+    # Act / Assert
+    with pytest.raises(TypeError, match=r"Invalid auto id item 'Alpha'; expected a \(table, key, name\) tuple"):
+        save_auto_id_state(auto_id=auto_id, file_path=tmp_path / "auto_ids.npz")
+
+
+def test_load__missing_id(tmp_path: Path):
+    # Arrange
+    file_path = tmp_path / "auto_ids.npz"
+    meta = [{"table": "Nodes", "name": None, "key_names": ["Number"], "encodings": ["array"]}]
+    np.savez_compressed(file_path, ids_0=np.array([0, 2]), key_0_0=np.array([1, 2]), meta=np.array(json.dumps(meta)))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="id 1 is missing"):
+        load_auto_id_state(file_path=file_path)
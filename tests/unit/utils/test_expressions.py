@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+import re
+
+import numpy as np
+import pytest
+
+from power_grid_model_io.utils.expressions import EXPRESSION_CACHE_SIZE, Expression, compile_expression
+
+
+def test_expression():
+    # Arrange
+    expression = Expression("R * `Cable length` / Parallel - -R")
+    columns = {"R": np.array([1.0, 2.0]), "Cable length": np.array([3.0, 4.0]), "Parallel": np.array([1, 2])}
+
+    # Act
+    result = expression.evaluate(columns)
+
+    # Assert
+    assert expression.columns == ["R", "Cable length", "Parallel"]
+    np.testing.assert_array_equal(result, [4.0, 6.0])
+    assert repr(expression) == "Expression('R * `Cable length` / Parallel - -R')"
+
+
+def test_expression__functions():
+    # Arrange
+    expression = Expression("sqrt(P ** 2 + Q ** 2) + maximum(abs(Q), 1) // 2 % 2")
+    columns = {"P": np.array([3.0, 6.0]), "Q": np.array([-4.0, 8.0])}
+
+    # Act
+    result = expression.evaluate(columns)
+
+    # Assert
+    assert expression.columns == ["P", "Q"]
+    np.testing.assert_array_equal(result, [5.0, 10.0])
+
+
+def test_expression__function_name_as_column():
+    # Arrange
+    expression = Expression("abs(sqrt)")
+
+    # Act
+    result = expression.evaluate({"sqrt": np.array([-1, 2])})
+
+    # Assert
+    assert expression.columns == ["sqrt"]
+    np.testing.assert_array_equal(result, [1, 2])
+
+
+def test_expression__constant():
+    # Act / Assert
+    assert not Expression("2 * 3.5").columns
+    assert Expression("2 * 3.5").evaluate({}) == 7.0
+
+
+@pytest.mark.parametrize(
+    ("expression", "error"),
+    [
+        ("R *", "invalid syntax"),
+        ("R.x", r"unsupported syntax \(Attribute\)"),
+        ("R < 1", r"unsupported syntax \(Compare\)"),
+        ("R[0]", r"unsupported syntax \(Subscript\)"),
+        ("__import__('os')", "unsupported function call"),
+        ("sqrt(x=R)", "unsupported function call"),
+        ("R.sum()", "unsupported function call"),
+        ("R * 'a'", "unsupported value 'a'"),
+        ("R * True", "unsupported value True"),
+    ],
+)
+def test_expression__invalid(expression: str, error: str):
+    # Act / Assert
+    with pytest.raises(ValueError, match=rf"Invalid expression '{re.escape(expression)}': {error}"):
+        Expression(expression)
+
+
+def test_compile_expression():
+    # Act / Assert
+    assert compile_expression("R * 2") is compile_expression("R * 2")
+    assert compile_expression.cache_info().maxsize == EXPRESSION_CACHE_SIZE
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+from pathlib import Path
+
+import numpy as np
+import pytest
+from power_grid_model import initialize_array
+
+from power_grid_model_io.utils.growable_array import GrowableArray
+
+
+def node_array(ids):
+    nodes = initialize_array("input", "node", len(ids))
+    nodes["id"] = ids
+    nodes["u_rated"] = 400.0
+    return nodes
+
+
+def test_append():
+    # Arrange
+    array = GrowableArray(dtype=node_array([]).dtype, capacity=2)
+
+    # Act
+    array.append(node_array([1]))
+    array.append(node_array([2, 3, 4]))
+    array.append(node_array([5, 6]))
+    array.append(node_array([]))
+
+    # Assert
+    result = array.to_array()
+    assert len(array) == 6
+    assert array.dtype == result.dtype == node_array([]).dtype
+    np.testing.assert_array_equal(result["id"], [1, 2, 3, 4, 5, 6])
+    np.testing.assert_array_equal(result["u_rated"], 400.0)
+
+
+def test_append__memmap(tmp_path: Path):
+    # Arrange
+    file_path = tmp_path / "node.bin"
+    file_path.write_bytes(b"old data")
+    array = GrowableArray(dtype=node_array([]).dtype, file_path=file_path)
+
+    # Act
+    empty = array.to_array()
+    array.append(node_array([1, 2]))
+    array.append(node_array([3]))
+
+    # Assert
+    result = array.to_array()
+    assert len(empty) == 0
+    assert isinstance(result, np.memmap)
+    assert file_path.stat().st_size == 3 * result.dtype.itemsize
+    np.testing.assert_array_equal(result["id"], [1, 2, 3])
+
+
+def test_append__invalid_dtype():
+    # Arrange
+    array = GrowableArray(dtype=np.int32)
+
+    # Act / Assert
+    with pytest.raises(TypeError, match="Can't append data of type float64 to an array of type int32"):
+        array.append(np.array([1.0]))
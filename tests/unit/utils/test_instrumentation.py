@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+import threading
+import tracemalloc
+from unittest.mock import MagicMock
+
+import pytest
+from structlog.testing import capture_logs
+
+from power_grid_model_io.utils.instrumentation import Instrumentation, StageMetrics
+
+
+def test_stage():
+    # Arrange
+    hook = MagicMock()
+    instrumentation = Instrumentation(hooks=[hook])
+
+    # Act
+    with capture_logs() as cap_log:
+        with instrumentation.stage("outer"):
+            with instrumentation.stage("inner", table="Nodes"):
+                pass
+
+    # Assert
+    inner, outer = instrumentation.stages
+    assert (inner.name, inner.path, inner.context) == ("inner", ("outer", "inner"), {"table": "Nodes"})
+    assert (outer.name, outer.path, outer.context) == ("outer", ("outer",), {})
+    assert 0.0 <= inner.wall_time <= outer.wall_time
+    assert inner.self_time == inner.wall_time
+    assert outer.self_time == pytest.approx(outer.wall_time - inner.wall_time)
+    assert inner.parents == ({},)
+    assert outer.parents == ()
+    assert inner.cpu_time >= 0.0
+    assert inner.allocated_bytes is None
+    assert [call.args[0] for call in hook.call_args_list] == [inner, outer]
+    assert cap_log[0]["event"] == "Stage completed"
+    assert cap_log[0]["stage"] == "inner"
+    assert cap_log[0]["table"] == "Nodes"
+
+
+def test_stage__exception():
+    # Arrange
+    instrumentation = Instrumentation()
+
+    # Act
+    with pytest.raises(ValueError):
+        with instrumentation.stage("failing"):
+            raise ValueError()
+    with instrumentation.stage("next"):
+        pass
+
+    # Assert
+    assert [metrics.path for metrics in instrumentation.stages] == [("failing",), ("next",)]
+
+
+def test_stage__threads():
+    # Arrange
+    instrumentation = Instrumentation()
+
+    def run():
+        with instrumentation.stage("thread"):
+            pass
+
+    # Act
+    with instrumentation.stage("main"):
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+    # Assert
+    assert [metrics.path for metrics in instrumentation.stages] == [("thread",), ("main",)]
+
+
+def test_stage__trace_memory():
+    # Arrange
+    instrumentation = Instrumentation(trace_memory=True)
+    was_tracing = tracemalloc.is_tracing()
+
+    # Act
+    try:
+        with instrumentation.stage("allocate"):
+            data = bytearray(1_000_000)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    # Assert
+    assert len(data) == 1_000_000
+    allocated_bytes = instrumentation.stages[0].allocated_bytes
+    assert allocated_bytes is not None and allocated_bytes >= 1_000_000
+
+
+def test_stage__trace_memory__stop_tracing():
+    # Arrange
+    instrumentation = Instrumentation(trace_memory=True)
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+    # Act / Assert
+    with instrumentation.stage("outer"):
+        with instrumentation.stage("inner"):
+            assert tracemalloc.is_tracing()
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+    assert all(metrics.allocated_bytes is not None for metrics in instrumentation.stages)
+
+
+def test_stage__trace_memory__keep_tracing():
+    # Arrange
+    instrumentation = Instrumentation(trace_memory=True)
+    was_tracing = tracemalloc.is_tracing()
+    tracemalloc.start()
+
+    # Act
+    try:
+        with instrumentation.stage("stage"):
+            pass
+        still_tracing = tracemalloc.is_tracing()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    # Assert
+    assert still_tracing
+
+
+def test_summary():
+    # Arrange
+    instrumentation = Instrumentation()
+    hook = MagicMock()
+    instrumentation.add_hook(hook)
+    for name, allocated_bytes in (("a", 10), ("b", None), ("a", 5)):
+        instrumentation._record(
+            StageMetrics(
+                name=name, path=(name,), context={}, wall_time=1.0, cpu_time=0.5, allocated_bytes=allocated_bytes
+            )
+        )
+
+    # Act
+    summary = instrumentation.summary()
+
+    # Assert
+    assert list(summary) == ["a", "b"]
+    assert (summary["a"].count, summary["a"].wall_time, summary["a"].cpu_time) == (2, 2.0, 1.0)
+    assert summary["a"].allocated_bytes == 15
+    assert summary["b"].allocated_bytes is None
+    assert hook.call_count == 3
+
+
+def test_clear():
+    # Arrange
+    instrumentation = Instrumentation()
+    with instrumentation.stage("a"):
+        pass
+
+    # Act
+    instrumentation.clear()
+
+    # Assert
+    assert not instrumentation.stages
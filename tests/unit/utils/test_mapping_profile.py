@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+import json
+
+import pytest
+
+from power_grid_model_io.utils.instrumentation import StageMetrics
+from power_grid_model_io.utils.mapping_profile import MappingProfile
+
+TABLE = {"table": "Nodes", "component": "node", "rows": 3}
+ATTRIBUTE = {"attribute": "id", "rows": 3}
+
+
+@pytest.fixture
+def profile() -> MappingProfile:
+    def metrics(path, context, parents, wall_time, self_time):
+        return StageMetrics(
+            name=path[-1],
+            path=path,
+            context=context,
+            wall_time=wall_time,
+            cpu_time=wall_time,
+            self_time=self_time,
+            parents=parents,
+        )
+
+    parse = {"data_type": "input"}
+    return MappingProfile(
+        [
+            metrics(
+                ("parse", "table", "attribute", "col_def"),
+                {"node": "a;b", "rows": 3},
+                (parse, TABLE, ATTRIBUTE),
+                1.0,
+                1.0,
+            ),
+            metrics(("parse", "table", "attribute", "auto_id"), {"rows": 3}, (parse, TABLE, ATTRIBUTE), 3.0, 2.0),
+            metrics(("parse", "table", "attribute"), ATTRIBUTE, (parse, TABLE), 3.5, 0.5),
+            metrics(("parse", "table", "attribute", "auto_id"), {"rows": 3}, (parse, TABLE, ATTRIBUTE), 1.0, 1.0),
+            metrics(("parse", "table"), TABLE, (parse,), 5.0, 0.0000001),
+            metrics(("parse", "merge"), {}, (parse,), 0.1, 0.1),
+            metrics(("parse",), parse, (), 5.2, 0.1),
+        ]
+    )
+
+
+def test_entries(profile: MappingProfile):
+    # Act
+    entries = profile.entries
+
+    # Assert
+    assert [entry.location for entry in entries] == [
+        ("Nodes", "node", "id", "a;b"),
+        ("Nodes", "node", "id", "auto_id"),
+        ("Nodes", "node", "id"),
+        ("Nodes", "node"),
+    ]
+    auto_id = entries[1]
+    assert (auto_id.calls, auto_id.rows, auto_id.wall_time, auto_id.self_time) == (2, 6, 4.0, 3.0)
+
+
+def test_sorted_entries(profile: MappingProfile):
+    # Act / Assert
+    assert [entry.location[-1] for entry in profile.sorted_entries()] == ["auto_id", "a;b", "id", "node"]
+    assert [entry.location[-1] for entry in profile.sorted_entries("wall_time")] == ["node", "auto_id", "id", "a;b"]
+    assert [entry.location[-1] for entry in profile.sorted_entries("location")] == ["node", "id", "a;b", "auto_id"]
+    with pytest.raises(ValueError, match="Invalid sort key 'foo'"):
+        profile.sorted_entries("foo")
+
+
+def test_to_text(profile: MappingProfile):
+    # Act
+    text = profile.to_text(limit=2)
+
+    # Assert
+    lines = text.split("\n")
+    assert len(lines) == 3
+    assert lines[0].split() == ["wall", "time", "self", "time", "calls", "rows", "mapping", "entry"]
+    assert lines[1].split() == ["4.0000s", "3.0000s", "2", "6", "Nodes", ">", "node", ">", "id", ">", "auto_id"]
+
+
+def test_to_json(profile: MappingProfile):
+    # Act
+    data = json.loads(profile.to_json())
+
+    # Assert
+    assert data == profile.to_dict()
+    assert data[1] == {
+        "location": ["Nodes", "node", "id", "auto_id"],
+        "calls": 2,
+        "rows": 6,
+        "wall_time": 4.0,
+        "self_time": 3.0,
+    }
+
+
+def test_to_folded(profile: MappingProfile):
+    # Act
+    folded = profile.to_folded()
+
+    # Assert
+    assert folded.split("\n") == [
+        "Nodes;node;id;a:b 1000000",
+        "Nodes;node;id;auto_id 3000000",
+        "Nodes;node;id 500000",
+    ]
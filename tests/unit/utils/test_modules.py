@@ -36,3 +36,16 @@ def test_get_function__function_doesnt_exist():
 def test_get_function__builtin_doesnt_exist():
     with raises(AttributeError, match="Function 'mean' does not exist in module 'builtins'!"):
         assert get_function("mean")
+
+
+def test_lazy_attributes():
+    # Arrange
+    import power_grid_model_io.data_stores as data_stores
+    from power_grid_model_io.data_stores.json_file_store import JsonFileStore
+
+    # Act / Assert
+    assert data_stores.JsonFileStore is JsonFileStore
+    assert "JsonFileStore" in vars(data_stores)
+    assert {"BaseDataStore", "ExcelFileStore", "JsonFileStore", "VisionExcelFileStore"} <= set(dir(data_stores))
+    with raises(AttributeError, match="module 'power_grid_model_io.data_stores' has no attribute 'FooStore'"):
+        assert data_stores.FooStore
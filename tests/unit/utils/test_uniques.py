@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+from unittest.mock import MagicMock, call
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from power_grid_model_io.utils.uniques import apply_unique
+
+
+def test_apply_unique__series():
+    # Arrange
+    values = pd.Series(["Dyn", "YNd", "Dyn", "Dyn"], index=[10, 11, 12, 13])
+    fn = MagicMock(side_effect=lambda value: (len(value), value == "Dyn"))
+    expected = pd.DataFrame([(3, True), (3, False), (3, True), (3, True)], columns=["a", "b"], index=[10, 11, 12, 13])
+
+    # Act
+    actual = apply_unique(values, fn, columns=["a", "b"])
+
+    # Assert
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+    assert fn.call_args_list == [call("Dyn"), call("YNd")]
+
+
+def test_apply_unique__array():
+    # Arrange
+    values = np.array(["a", "bb", "a"])
+
+    # Act
+    actual = apply_unique(values, lambda value: (len(value),), columns=["len"])
+
+    # Assert
+    pd.testing.assert_frame_equal(actual, pd.DataFrame([1, 2, 1], columns=["len"]))
+
+
+def test_apply_unique__empty():
+    # Act
+    actual = apply_unique(pd.Series([], dtype=object), lambda value: (1, 2), columns=["a", "b"])
+
+    # Assert
+    assert actual.shape == (0, 2)
+
+
+def test_apply_unique__missing_values():
+    # Act / Assert
+    with pytest.raises(ValueError, match="Missing values"):
+        apply_unique(pd.Series(["Dyn", None]), lambda value: (1,), columns=["a"])